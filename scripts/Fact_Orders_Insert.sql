@@ -1,881 +1,883 @@
 USE Northwind_DWH;
 GO
 
-INSERT INTO FactOrders_Final VALUES ('1', 'access', '30', '27', '9', '20060115', '20060122.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('2', 'access', '31', '4', '3', '20060120', '20060122.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('3', 'access', '32', '12', '4', '20060122', '20060122.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('4', 'access', '33', '8', '6', '20060130', '20060131.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('5', 'access', '34', '4', '9', '20060206', '20060207.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('6', 'access', '35', '29', '3', '20060210', '20060212.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('7', 'access', '36', '3', '4', '20060223', '20060225.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('8', 'access', '37', '6', '8', '20060306', '20060309.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('9', 'access', '38', '28', '9', '20060310', '20060311.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('10', 'access', '39', '8', '3', '20060322', '20060324.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('11', 'access', '40', '10', '4', '20060324', '20060324.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('12', 'access', '41', '7', '1', '20060324', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('13', 'access', '42', '10', '1', '20060324', '20060407.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('14', 'access', '43', '11', '1', '20060324', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('15', 'access', '44', '1', '1', '20060324', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('16', 'access', '45', '28', '1', '20060407', '20060407.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('17', 'access', '46', '9', '7', '20060405', '20060405.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('18', 'access', '47', '6', '6', '20060408', '20060408.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('19', 'access', '48', '8', '4', '20060405', '20060405.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('20', 'access', '50', '25', '9', '20060405', '20060405.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('21', 'access', '51', '26', '9', '20060405', '20060405.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('22', 'access', '55', '29', '1', '20060405', '20060405.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('23', 'access', '56', '6', '2', '20060403', '20060403.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('24', 'access', '57', '27', '9', '20060422', '20060422.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('25', 'access', '58', '4', '3', '20060422', '20060422.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('26', 'access', '59', '12', '4', '20060422', '20060422.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('27', 'access', '60', '8', '6', '20060430', '20060430.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('28', 'access', '61', '4', '9', '20060407', '20060407.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('29', 'access', '62', '29', '3', '20060412', '20060412.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('30', 'access', '63', '3', '4', '20060425', '20060425.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('31', 'access', '64', '6', '8', '20060509', '20060509.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('32', 'access', '65', '28', '9', '20060511', '20060511.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('33', 'access', '66', '8', '3', '20060524', '20060524.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('34', 'access', '67', '10', '4', '20060524', '20060524.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('35', 'access', '68', '7', '1', '20060524', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('36', 'access', '69', '10', '1', '20060524', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('37', 'access', '70', '11', '1', '20060524', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('38', 'access', '71', '1', '1', '20060524', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('39', 'access', '72', '28', '1', '20060607', '20060607.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('40', 'access', '73', '9', '7', '20060605', '20060605.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('41', 'access', '74', '6', '6', '20060608', '20060608.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('42', 'access', '75', '8', '4', '20060605', '20060605.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('43', 'access', '76', '25', '9', '20060605', '20060605.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('44', 'access', '77', '26', '9', '20060605', '20060605.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('45', 'access', '78', '29', '1', '20060605', '20060605.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('46', 'access', '79', '6', '2', '20060623', '20060623.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('47', 'access', '80', '4', '2', '20060425', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('48', 'access', '81', '3', '2', '20060425', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('49', 'sqlserver', '10248', '114', '14', '19960704', '19960716.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('50', 'sqlserver', '10249', '108', '15', '19960705', '19960710.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('51', 'sqlserver', '10250', '63', '13', '19960708', '19960712.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('52', 'sqlserver', '10251', '113', '12', '19960708', '19960715.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('53', 'sqlserver', '10252', '105', '13', '19960709', '19960711.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('54', 'sqlserver', '10253', '63', '12', '19960710', '19960716.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('55', 'sqlserver', '10254', '43', '14', '19960711', '19960723.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('56', 'sqlserver', '10255', '97', '18', '19960712', '19960715.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('57', 'sqlserver', '10256', '117', '12', '19960715', '19960717.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('58', 'sqlserver', '10257', '64', '13', '19960716', '19960722.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('59', 'sqlserver', '10258', '49', '10', '19960717', '19960723.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('60', 'sqlserver', '10259', '42', '13', '19960718', '19960725.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('61', 'sqlserver', '10260', '85', '13', '19960719', '19960729.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('62', 'sqlserver', '10261', '90', '13', '19960719', '19960730.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('63', 'sqlserver', '10262', '94', '17', '19960722', '19960725.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('64', 'sqlserver', '10263', '49', '18', '19960723', '19960731.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('65', 'sqlserver', '10264', '53', '15', '19960724', '19960823.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('66', 'sqlserver', '10265', '36', '11', '19960725', '19960812.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('67', 'sqlserver', '10266', '116', '12', '19960726', '19960731.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('68', 'sqlserver', '10267', '54', '13', '19960729', '19960806.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('69', 'sqlserver', '10268', '62', '17', '19960730', '19960802.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('70', 'sqlserver', '10269', '118', '14', '19960731', '19960809.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('71', 'sqlserver', '10270', '116', '10', '19960801', '19960802.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('72', 'sqlserver', '10271', '104', '15', '19960801', '19960830.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('73', 'sqlserver', '10272', '94', '15', '19960802', '19960806.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('74', 'sqlserver', '10273', '92', '12', '19960805', '19960812.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('75', 'sqlserver', '10274', '114', '15', '19960806', '19960816.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('76', 'sqlserver', '10275', '78', '10', '19960807', '19960809.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('77', 'sqlserver', '10276', '109', '17', '19960808', '19960814.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('78', 'sqlserver', '10277', '81', '11', '19960809', '19960813.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('79', 'sqlserver', '10278', '34', '17', '19960812', '19960816.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('80', 'sqlserver', '10279', '73', '17', '19960813', '19960816.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('81', 'sqlserver', '10280', '34', '11', '19960814', '19960912.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('82', 'sqlserver', '10281', '98', '13', '19960814', '19960821.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('83', 'sqlserver', '10282', '98', '13', '19960815', '19960821.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('84', 'sqlserver', '10283', '75', '12', '19960816', '19960823.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('85', 'sqlserver', '10284', '73', '13', '19960819', '19960827.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('86', 'sqlserver', '10285', '92', '10', '19960820', '19960826.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('87', 'sqlserver', '10286', '92', '17', '19960821', '19960830.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('88', 'sqlserver', '10287', '96', '17', '19960822', '19960828.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('89', 'sqlserver', '10288', '95', '13', '19960823', '19960903.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('90', 'sqlserver', '10289', '40', '16', '19960826', '19960828.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('91', 'sqlserver', '10290', '44', '17', '19960827', '19960903.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('92', 'sqlserver', '10291', '90', '15', '19960827', '19960904.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('93', 'sqlserver', '10292', '110', '10', '19960828', '19960902.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('94', 'sqlserver', '10293', '109', '10', '19960829', '19960911.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('95', 'sqlserver', '10294', '94', '13', '19960830', '19960905.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('96', 'sqlserver', '10295', '114', '11', '19960902', '19960910.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('97', 'sqlserver', '10296', '75', '15', '19960903', '19960911.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('98', 'sqlserver', '10297', '36', '14', '19960904', '19960910.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('99', 'sqlserver', '10298', '66', '15', '19960905', '19960911.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('100', 'sqlserver', '10299', '96', '13', '19960906', '19960913.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('101', 'sqlserver', '10300', '78', '11', '19960909', '19960918.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('102', 'sqlserver', '10301', '115', '17', '19960909', '19960917.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('103', 'sqlserver', '10302', '105', '13', '19960910', '19961009.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('104', 'sqlserver', '10303', '59', '16', '19960911', '19960918.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('105', 'sqlserver', '10304', '109', '10', '19960912', '19960917.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('106', 'sqlserver', '10305', '84', '17', '19960913', '19961009.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('107', 'sqlserver', '10306', '98', '10', '19960916', '19960923.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('108', 'sqlserver', '10307', '77', '11', '19960917', '19960925.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('109', 'sqlserver', '10308', '31', '16', '19960918', '19960924.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('110', 'sqlserver', '10309', '66', '12', '19960919', '19961023.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('111', 'sqlserver', '10310', '106', '17', '19960920', '19960927.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('112', 'sqlserver', '10311', '47', '10', '19960920', '19960926.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('113', 'sqlserver', '10312', '115', '11', '19960923', '19961003.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('114', 'sqlserver', '10313', '92', '11', '19960924', '19961004.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('115', 'sqlserver', '10314', '94', '10', '19960925', '19961004.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('116', 'sqlserver', '10315', '67', '13', '19960926', '19961003.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('117', 'sqlserver', '10316', '94', '10', '19960927', '19961008.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('118', 'sqlserver', '10317', '77', '15', '19960930', '19961010.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('119', 'sqlserver', '10318', '67', '17', '19961001', '19961004.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('120', 'sqlserver', '10319', '109', '16', '19961002', '19961011.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('121', 'sqlserver', '10320', '116', '14', '19961003', '19961018.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('122', 'sqlserver', '10321', '67', '12', '19961003', '19961011.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('123', 'sqlserver', '10322', '87', '16', '19961004', '19961023.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('124', 'sqlserver', '10323', '68', '13', '19961007', '19961014.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('125', 'sqlserver', '10324', '100', '18', '19961008', '19961010.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('126', 'sqlserver', '10325', '68', '10', '19961009', '19961014.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('127', 'sqlserver', '10326', '37', '13', '19961010', '19961014.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('128', 'sqlserver', '10327', '53', '11', '19961011', '19961014.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('129', 'sqlserver', '10328', '57', '13', '19961014', '19961017.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('130', 'sqlserver', '10329', '104', '13', '19961015', '19961023.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('131', 'sqlserver', '10330', '75', '12', '19961016', '19961028.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('132', 'sqlserver', '10331', '38', '18', '19961016', '19961021.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('133', 'sqlserver', '10332', '80', '12', '19961017', '19961021.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('134', 'sqlserver', '10333', '116', '14', '19961018', '19961025.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('135', 'sqlserver', '10334', '113', '17', '19961021', '19961028.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('136', 'sqlserver', '10335', '66', '16', '19961022', '19961024.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('137', 'sqlserver', '10336', '89', '16', '19961023', '19961025.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('138', 'sqlserver', '10337', '54', '13', '19961024', '19961029.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('139', 'sqlserver', '10338', '84', '13', '19961025', '19961029.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('140', 'sqlserver', '10339', '80', '11', '19961028', '19961104.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('141', 'sqlserver', '10340', '38', '10', '19961029', '19961108.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('142', 'sqlserver', '10341', '102', '16', '19961029', '19961105.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('143', 'sqlserver', '10342', '54', '13', '19961030', '19961104.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('144', 'sqlserver', '10343', '73', '13', '19961031', '19961106.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('145', 'sqlserver', '10344', '118', '13', '19961101', '19961105.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('146', 'sqlserver', '10345', '92', '11', '19961104', '19961111.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('147', 'sqlserver', '10346', '94', '12', '19961105', '19961108.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('148', 'sqlserver', '10347', '50', '13', '19961106', '19961108.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('149', 'sqlserver', '10348', '115', '13', '19961107', '19961115.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('150', 'sqlserver', '10349', '104', '16', '19961108', '19961115.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('151', 'sqlserver', '10350', '70', '15', '19961111', '19961203.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('152', 'sqlserver', '10351', '49', '10', '19961111', '19961120.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('153', 'sqlserver', '10352', '57', '12', '19961112', '19961118.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('154', 'sqlserver', '10353', '88', '16', '19961113', '19961125.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('155', 'sqlserver', '10354', '87', '17', '19961114', '19961120.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('156', 'sqlserver', '10355', '33', '15', '19961115', '19961120.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('157', 'sqlserver', '10356', '115', '15', '19961118', '19961127.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('158', 'sqlserver', '10357', '75', '10', '19961119', '19961202.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('159', 'sqlserver', '10358', '70', '14', '19961120', '19961127.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('160', 'sqlserver', '10359', '101', '14', '19961121', '19961126.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('161', 'sqlserver', '10360', '36', '13', '19961122', '19961202.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('162', 'sqlserver', '10361', '92', '10', '19961122', '19961203.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('163', 'sqlserver', '10362', '38', '12', '19961125', '19961128.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('164', 'sqlserver', '10363', '46', '13', '19961126', '19961204.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('165', 'sqlserver', '10364', '48', '10', '19961126', '19961204.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('166', 'sqlserver', '10365', '32', '12', '19961127', '19961202.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('167', 'sqlserver', '10366', '58', '17', '19961128', '19961230.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('168', 'sqlserver', '10367', '112', '16', '19961128', '19961202.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('169', 'sqlserver', '10368', '49', '11', '19961129', '19961202.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('170', 'sqlserver', '10369', '104', '17', '19961202', '19961209.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('171', 'sqlserver', '10370', '43', '15', '19961203', '19961227.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('172', 'sqlserver', '10371', '70', '10', '19961203', '19961224.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('173', 'sqlserver', '10372', '91', '14', '19961204', '19961209.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('174', 'sqlserver', '10373', '66', '13', '19961205', '19961211.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('175', 'sqlserver', '10374', '120', '10', '19961205', '19961209.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('176', 'sqlserver', '10375', '65', '12', '19961206', '19961209.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('177', 'sqlserver', '10376', '80', '10', '19961209', '19961213.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('178', 'sqlserver', '10377', '101', '10', '19961209', '19961213.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('179', 'sqlserver', '10378', '53', '14', '19961210', '19961219.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('180', 'sqlserver', '10379', '90', '11', '19961211', '19961213.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('181', 'sqlserver', '10380', '66', '17', '19961212', '19970116.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('182', 'sqlserver', '10381', '75', '12', '19961212', '19961213.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('183', 'sqlserver', '10382', '49', '13', '19961213', '19961216.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('184', 'sqlserver', '10383', '33', '17', '19961216', '19961218.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('185', 'sqlserver', '10384', '34', '12', '19961216', '19961220.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('186', 'sqlserver', '10385', '104', '10', '19961217', '19961223.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('187', 'sqlserver', '10386', '50', '18', '19961218', '19961225.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('188', 'sqlserver', '10387', '99', '10', '19961218', '19961220.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('189', 'sqlserver', '10388', '101', '11', '19961219', '19961220.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('190', 'sqlserver', '10389', '39', '13', '19961220', '19961224.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('191', 'sqlserver', '10390', '49', '15', '19961223', '19961226.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('192', 'sqlserver', '10391', '46', '12', '19961223', '19961231.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('193', 'sqlserver', '10392', '88', '11', '19961224', '19970101.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('194', 'sqlserver', '10393', '100', '10', '19961225', '19970103.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('195', 'sqlserver', '10394', '65', '10', '19961225', '19970103.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('196', 'sqlserver', '10395', '64', '15', '19961226', '19970103.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('197', 'sqlserver', '10396', '54', '10', '19961227', '19970106.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('198', 'sqlserver', '10397', '89', '14', '19961227', '19970102.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('199', 'sqlserver', '10398', '100', '11', '19961230', '19970109.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('200', 'sqlserver', '10399', '112', '17', '19961231', '19970108.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('201', 'sqlserver', '10400', '48', '10', '19970101', '19970116.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('202', 'sqlserver', '10401', '94', '10', '19970101', '19970110.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('203', 'sqlserver', '10402', '49', '17', '19970102', '19970110.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('204', 'sqlserver', '10403', '49', '13', '19970103', '19970109.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('205', 'sqlserver', '10404', '78', '11', '19970103', '19970108.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('206', 'sqlserver', '10405', '76', '10', '19970106', '19970122.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('207', 'sqlserver', '10406', '91', '16', '19970107', '19970113.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('208', 'sqlserver', '10407', '85', '11', '19970107', '19970130.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('209', 'sqlserver', '10408', '52', '17', '19970108', '19970114.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('210', 'sqlserver', '10409', '83', '12', '19970109', '19970114.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('211', 'sqlserver', '10410', '39', '12', '19970110', '19970115.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('212', 'sqlserver', '10411', '39', '18', '19970110', '19970121.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('213', 'sqlserver', '10412', '116', '17', '19970113', '19970115.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('214', 'sqlserver', '10413', '70', '12', '19970114', '19970116.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('215', 'sqlserver', '10414', '50', '11', '19970114', '19970117.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('216', 'sqlserver', '10415', '65', '12', '19970115', '19970124.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('217', 'sqlserver', '10416', '116', '17', '19970116', '19970127.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('218', 'sqlserver', '10417', '102', '13', '19970116', '19970128.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('219', 'sqlserver', '10418', '92', '13', '19970117', '19970124.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('220', 'sqlserver', '10419', '97', '13', '19970120', '19970130.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('221', 'sqlserver', '10420', '117', '12', '19970121', '19970127.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('222', 'sqlserver', '10421', '90', '17', '19970121', '19970127.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('223', 'sqlserver', '10422', '56', '11', '19970122', '19970131.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('224', 'sqlserver', '10423', '60', '15', '19970123', '19970224.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('225', 'sqlserver', '10424', '80', '16', '19970123', '19970127.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('226', 'sqlserver', '10425', '70', '15', '19970124', '19970214.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('227', 'sqlserver', '10426', '58', '13', '19970127', '19970206.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('228', 'sqlserver', '10427', '88', '13', '19970127', '19970303.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('229', 'sqlserver', '10428', '95', '16', '19970128', '19970204.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('230', 'sqlserver', '10429', '66', '12', '19970129', '19970207.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('231', 'sqlserver', '10430', '49', '13', '19970130', '19970203.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('232', 'sqlserver', '10431', '39', '13', '19970130', '19970207.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('233', 'sqlserver', '10432', '104', '12', '19970131', '19970207.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('234', 'sqlserver', '10433', '89', '12', '19970203', '19970304.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('235', 'sqlserver', '10434', '53', '12', '19970203', '19970213.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('236', 'sqlserver', '10435', '45', '17', '19970204', '19970207.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('237', 'sqlserver', '10436', '36', '12', '19970205', '19970211.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('238', 'sqlserver', '10437', '116', '17', '19970205', '19970212.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('239', 'sqlserver', '10438', '108', '12', '19970206', '19970214.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('240', 'sqlserver', '10439', '80', '15', '19970207', '19970210.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('241', 'sqlserver', '10440', '100', '13', '19970210', '19970228.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('242', 'sqlserver', '10441', '84', '12', '19970210', '19970314.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('243', 'sqlserver', '10442', '49', '12', '19970211', '19970218.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('244', 'sqlserver', '10443', '95', '17', '19970212', '19970214.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('245', 'sqlserver', '10444', '34', '12', '19970212', '19970221.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('246', 'sqlserver', '10445', '34', '12', '19970213', '19970220.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('247', 'sqlserver', '10446', '108', '15', '19970214', '19970219.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('248', 'sqlserver', '10447', '96', '13', '19970214', '19970307.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('249', 'sqlserver', '10448', '93', '13', '19970217', '19970224.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('250', 'sqlserver', '10449', '36', '12', '19970218', '19970227.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('251', 'sqlserver', '10450', '113', '17', '19970219', '19970311.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('252', 'sqlserver', '10451', '92', '13', '19970219', '19970312.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('253', 'sqlserver', '10452', '100', '17', '19970220', '19970226.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('254', 'sqlserver', '10453', '33', '10', '19970221', '19970226.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('255', 'sqlserver', '10454', '70', '13', '19970221', '19970225.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('256', 'sqlserver', '10455', '116', '17', '19970224', '19970303.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('257', 'sqlserver', '10456', '68', '17', '19970225', '19970228.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('258', 'sqlserver', '10457', '68', '11', '19970225', '19970303.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('259', 'sqlserver', '10458', '105', '16', '19970226', '19970304.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('260', 'sqlserver', '10459', '113', '13', '19970227', '19970228.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('261', 'sqlserver', '10460', '53', '17', '19970228', '19970303.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('262', 'sqlserver', '10461', '75', '10', '19970228', '19970305.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('263', 'sqlserver', '10462', '45', '11', '19970303', '19970318.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('264', 'sqlserver', '10463', '105', '14', '19970304', '19970306.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('265', 'sqlserver', '10464', '57', '13', '19970304', '19970314.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('266', 'sqlserver', '10465', '112', '10', '19970305', '19970314.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('267', 'sqlserver', '10466', '44', '13', '19970306', '19970313.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('268', 'sqlserver', '10467', '78', '17', '19970306', '19970311.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('269', 'sqlserver', '10468', '68', '12', '19970307', '19970312.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('270', 'sqlserver', '10469', '118', '10', '19970310', '19970314.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('271', 'sqlserver', '10470', '38', '13', '19970311', '19970314.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('272', 'sqlserver', '10471', '40', '11', '19970311', '19970318.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('273', 'sqlserver', '10472', '101', '17', '19970312', '19970319.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('274', 'sqlserver', '10473', '67', '10', '19970313', '19970321.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('275', 'sqlserver', '10474', '87', '14', '19970313', '19970321.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('276', 'sqlserver', '10475', '105', '18', '19970314', '19970404.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('277', 'sqlserver', '10476', '64', '17', '19970317', '19970324.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('278', 'sqlserver', '10477', '89', '14', '19970317', '19970325.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('279', 'sqlserver', '10478', '113', '11', '19970318', '19970326.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('280', 'sqlserver', '10479', '94', '12', '19970319', '19970321.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('281', 'sqlserver', '10480', '52', '15', '19970320', '19970324.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('282', 'sqlserver', '10481', '96', '17', '19970320', '19970325.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('283', 'sqlserver', '10482', '72', '10', '19970321', '19970410.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('284', 'sqlserver', '10483', '118', '16', '19970324', '19970425.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('285', 'sqlserver', '10484', '40', '12', '19970324', '19970401.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('286', 'sqlserver', '10485', '76', '13', '19970325', '19970331.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('287', 'sqlserver', '10486', '64', '10', '19970326', '19970402.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('288', 'sqlserver', '10487', '91', '11', '19970326', '19970328.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('289', 'sqlserver', '10488', '54', '17', '19970327', '19970402.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('290', 'sqlserver', '10489', '88', '15', '19970328', '19970409.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('291', 'sqlserver', '10490', '64', '16', '19970331', '19970403.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('292', 'sqlserver', '10491', '57', '17', '19970331', '19970408.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('293', 'sqlserver', '10492', '39', '12', '19970401', '19970411.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('294', 'sqlserver', '10493', '70', '13', '19970402', '19970410.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('295', 'sqlserver', '10494', '44', '13', '19970402', '19970409.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('296', 'sqlserver', '10495', '71', '12', '19970403', '19970411.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('297', 'sqlserver', '10496', '110', '16', '19970404', '19970407.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('298', 'sqlserver', '10497', '73', '16', '19970404', '19970407.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('299', 'sqlserver', '10498', '64', '17', '19970407', '19970411.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('300', 'sqlserver', '10499', '75', '13', '19970408', '19970416.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('301', 'sqlserver', '10500', '70', '15', '19970409', '19970417.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('302', 'sqlserver', '10501', '35', '18', '19970409', '19970416.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('303', 'sqlserver', '10502', '87', '11', '19970410', '19970429.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('304', 'sqlserver', '10503', '66', '15', '19970411', '19970416.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('305', 'sqlserver', '10504', '118', '13', '19970411', '19970418.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('306', 'sqlserver', '10505', '80', '12', '19970414', '19970421.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('307', 'sqlserver', '10506', '68', '18', '19970415', '19970502.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('308', 'sqlserver', '10507', '32', '16', '19970415', '19970422.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('309', 'sqlserver', '10508', '85', '10', '19970416', '19970513.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('310', 'sqlserver', '10509', '35', '13', '19970417', '19970429.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('311', 'sqlserver', '10510', '100', '15', '19970418', '19970428.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('312', 'sqlserver', '10511', '38', '13', '19970418', '19970421.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('313', 'sqlserver', '10512', '50', '16', '19970421', '19970424.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('314', 'sqlserver', '10513', '115', '16', '19970422', '19970428.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('315', 'sqlserver', '10514', '49', '12', '19970422', '19970516.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('316', 'sqlserver', '10515', '92', '11', '19970423', '19970523.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('317', 'sqlserver', '10516', '66', '11', '19970424', '19970501.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('318', 'sqlserver', '10517', '82', '12', '19970424', '19970429.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('319', 'sqlserver', '10518', '109', '13', '19970425', '19970505.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('320', 'sqlserver', '10519', '43', '15', '19970428', '19970501.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('321', 'sqlserver', '10520', '99', '16', '19970429', '19970501.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('322', 'sqlserver', '10521', '41', '17', '19970429', '19970502.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('323', 'sqlserver', '10522', '73', '13', '19970430', '19970506.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('324', 'sqlserver', '10523', '101', '16', '19970501', '19970530.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('325', 'sqlserver', '10524', '34', '10', '19970501', '19970507.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('326', 'sqlserver', '10525', '38', '10', '19970502', '19970523.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('327', 'sqlserver', '10526', '116', '13', '19970505', '19970515.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('328', 'sqlserver', '10527', '92', '16', '19970505', '19970507.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('329', 'sqlserver', '10528', '61', '15', '19970506', '19970509.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('330', 'sqlserver', '10529', '79', '14', '19970507', '19970509.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('331', 'sqlserver', '10530', '88', '12', '19970508', '19970512.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('332', 'sqlserver', '10531', '83', '16', '19970508', '19970519.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('333', 'sqlserver', '10532', '48', '16', '19970509', '19970512.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('334', 'sqlserver', '10533', '53', '17', '19970512', '19970522.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('335', 'sqlserver', '10534', '73', '17', '19970512', '19970514.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('336', 'sqlserver', '10535', '32', '13', '19970513', '19970521.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('337', 'sqlserver', '10536', '73', '12', '19970514', '19970606.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('338', 'sqlserver', '10537', '97', '10', '19970514', '19970519.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('339', 'sqlserver', '10538', '40', '18', '19970515', '19970516.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('340', 'sqlserver', '10539', '40', '15', '19970516', '19970523.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('341', 'sqlserver', '10540', '92', '12', '19970519', '19970613.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('342', 'sqlserver', '10541', '63', '11', '19970519', '19970529.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('343', 'sqlserver', '10542', '68', '10', '19970520', '19970526.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('344', 'sqlserver', '10543', '75', '17', '19970521', '19970523.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('345', 'sqlserver', '10544', '77', '13', '19970521', '19970530.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('346', 'sqlserver', '10545', '72', '17', '19970522', '19970626.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('347', 'sqlserver', '10546', '113', '10', '19970523', '19970527.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('348', 'sqlserver', '10547', '101', '12', '19970523', '19970602.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('349', 'sqlserver', '10548', '108', '12', '19970526', '19970602.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('350', 'sqlserver', '10549', '92', '14', '19970527', '19970530.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('351', 'sqlserver', '10550', '59', '16', '19970528', '19970606.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('352', 'sqlserver', '10551', '57', '13', '19970528', '19970606.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('353', 'sqlserver', '10552', '64', '11', '19970529', '19970605.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('354', 'sqlserver', '10553', '116', '11', '19970530', '19970603.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('355', 'sqlserver', '10554', '85', '13', '19970530', '19970605.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('356', 'sqlserver', '10555', '100', '15', '19970602', '19970604.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('357', 'sqlserver', '10556', '102', '11', '19970603', '19970613.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('358', 'sqlserver', '10557', '73', '18', '19970603', '19970606.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('359', 'sqlserver', '10558', '33', '10', '19970604', '19970610.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('360', 'sqlserver', '10559', '36', '15', '19970605', '19970613.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('361', 'sqlserver', '10560', '54', '17', '19970606', '19970609.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('362', 'sqlserver', '10561', '53', '11', '19970606', '19970609.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('363', 'sqlserver', '10562', '95', '10', '19970609', '19970612.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('364', 'sqlserver', '10563', '96', '11', '19970610', '19970624.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('365', 'sqlserver', '10564', '94', '13', '19970610', '19970616.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('366', 'sqlserver', '10565', '80', '17', '19970611', '19970618.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('367', 'sqlserver', '10566', '36', '18', '19970612', '19970618.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('368', 'sqlserver', '10567', '66', '10', '19970612', '19970617.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('369', 'sqlserver', '10568', '58', '12', '19970613', '19970709.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('370', 'sqlserver', '10569', '94', '14', '19970616', '19970711.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('371', 'sqlserver', '10570', '80', '12', '19970617', '19970619.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('372', 'sqlserver', '10571', '49', '17', '19970617', '19970704.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('373', 'sqlserver', '10572', '34', '12', '19970618', '19970625.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('374', 'sqlserver', '10573', '32', '16', '19970619', '19970620.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('375', 'sqlserver', '10574', '111', '13', '19970619', '19970630.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('376', 'sqlserver', '10575', '81', '14', '19970620', '19970630.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('377', 'sqlserver', '10576', '109', '12', '19970623', '19970630.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('378', 'sqlserver', '10577', '111', '18', '19970623', '19970630.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('379', 'sqlserver', '10578', '40', '13', '19970624', '19970725.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('380', 'sqlserver', '10579', '74', '10', '19970625', '19970704.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('381', 'sqlserver', '10580', '85', '13', '19970626', '19970701.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('382', 'sqlserver', '10581', '50', '12', '19970626', '19970702.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('383', 'sqlserver', '10582', '35', '12', '19970627', '19970714.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('384', 'sqlserver', '10583', '116', '11', '19970630', '19970704.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('385', 'sqlserver', '10584', '36', '13', '19970630', '19970704.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('386', 'sqlserver', '10585', '117', '16', '19970701', '19970710.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('387', 'sqlserver', '10586', '95', '18', '19970702', '19970709.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('388', 'sqlserver', '10587', '90', '10', '19970702', '19970709.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('389', 'sqlserver', '10588', '92', '11', '19970703', '19970710.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('390', 'sqlserver', '10589', '61', '17', '19970704', '19970714.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('391', 'sqlserver', '10590', '80', '13', '19970707', '19970714.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('392', 'sqlserver', '10591', '112', '10', '19970707', '19970716.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('393', 'sqlserver', '10592', '73', '12', '19970708', '19970716.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('394', 'sqlserver', '10593', '73', '16', '19970709', '19970813.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('395', 'sqlserver', '10594', '84', '12', '19970709', '19970716.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('396', 'sqlserver', '10595', '49', '11', '19970710', '19970714.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('397', 'sqlserver', '10596', '118', '17', '19970711', '19970812.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('398', 'sqlserver', '10597', '88', '16', '19970711', '19970718.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('399', 'sqlserver', '10598', '94', '10', '19970714', '19970718.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('400', 'sqlserver', '10599', '40', '15', '19970715', '19970721.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('401', 'sqlserver', '10600', '65', '13', '19970716', '19970721.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('402', 'sqlserver', '10601', '64', '16', '19970716', '19970722.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('403', 'sqlserver', '10602', '112', '17', '19970717', '19970722.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('404', 'sqlserver', '10603', '100', '17', '19970718', '19970808.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('405', 'sqlserver', '10604', '57', '10', '19970718', '19970729.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('406', 'sqlserver', '10605', '80', '10', '19970721', '19970729.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('407', 'sqlserver', '10606', '110', '13', '19970722', '19970731.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('408', 'sqlserver', '10607', '100', '14', '19970722', '19970725.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('409', 'sqlserver', '10608', '108', '13', '19970723', '19970801.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('410', 'sqlserver', '10609', '47', '16', '19970724', '19970730.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('411', 'sqlserver', '10610', '70', '17', '19970725', '19970806.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('412', 'sqlserver', '10611', '120', '15', '19970725', '19970801.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('413', 'sqlserver', '10612', '100', '10', '19970728', '19970801.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('414', 'sqlserver', '10613', '64', '13', '19970729', '19970801.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('415', 'sqlserver', '10614', '35', '17', '19970729', '19970801.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('416', 'sqlserver', '10615', '119', '11', '19970730', '19970806.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('417', 'sqlserver', '10616', '61', '10', '19970731', '19970805.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('418', 'sqlserver', '10617', '61', '13', '19970731', '19970804.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('419', 'sqlserver', '10618', '80', '10', '19970801', '19970808.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('420', 'sqlserver', '10619', '80', '12', '19970804', '19970807.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('421', 'sqlserver', '10620', '71', '11', '19970805', '19970814.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('422', 'sqlserver', '10621', '67', '13', '19970805', '19970811.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('423', 'sqlserver', '10622', '96', '13', '19970806', '19970811.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('424', 'sqlserver', '10623', '54', '17', '19970807', '19970812.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('425', 'sqlserver', '10624', '107', '13', '19970807', '19970819.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('426', 'sqlserver', '10625', '31', '12', '19970808', '19970814.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('427', 'sqlserver', '10626', '34', '10', '19970811', '19970820.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('428', 'sqlserver', '10627', '100', '17', '19970811', '19970821.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('429', 'sqlserver', '10628', '36', '13', '19970812', '19970820.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('430', 'sqlserver', '10629', '59', '13', '19970812', '19970820.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('431', 'sqlserver', '10630', '68', '10', '19970813', '19970819.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('432', 'sqlserver', '10631', '70', '17', '19970814', '19970815.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('433', 'sqlserver', '10632', '115', '17', '19970814', '19970819.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('434', 'sqlserver', '10633', '49', '16', '19970815', '19970818.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('435', 'sqlserver', '10634', '52', '13', '19970815', '19970821.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('436', 'sqlserver', '10635', '78', '17', '19970818', '19970821.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('437', 'sqlserver', '10636', '116', '13', '19970819', '19970826.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('438', 'sqlserver', '10637', '91', '15', '19970819', '19970826.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('439', 'sqlserver', '10638', '76', '12', '19970820', '19970901.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('440', 'sqlserver', '10639', '99', '16', '19970820', '19970827.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('441', 'sqlserver', '10640', '115', '13', '19970821', '19970828.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('442', 'sqlserver', '10641', '64', '13', '19970822', '19970826.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('443', 'sqlserver', '10642', '102', '16', '19970822', '19970905.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('444', 'sqlserver', '10643', '30', '15', '19970825', '19970902.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('445', 'sqlserver', '10644', '117', '12', '19970825', '19970901.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('446', 'sqlserver', '10645', '63', '13', '19970826', '19970902.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('447', 'sqlserver', '10646', '66', '18', '19970827', '19970903.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('448', 'sqlserver', '10647', '90', '13', '19970827', '19970903.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('449', 'sqlserver', '10648', '96', '14', '19970828', '19970909.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('450', 'sqlserver', '10649', '79', '14', '19970828', '19970829.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('451', 'sqlserver', '10650', '50', '14', '19970829', '19970903.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('452', 'sqlserver', '10651', '115', '17', '19970901', '19970911.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('453', 'sqlserver', '10652', '60', '13', '19970901', '19970908.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('454', 'sqlserver', '10653', '54', '10', '19970902', '19970919.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('455', 'sqlserver', '10654', '34', '14', '19970902', '19970911.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('456', 'sqlserver', '10655', '95', '10', '19970903', '19970911.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('457', 'sqlserver', '10656', '61', '15', '19970904', '19970910.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('458', 'sqlserver', '10657', '100', '11', '19970904', '19970915.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('459', 'sqlserver', '10658', '92', '13', '19970905', '19970908.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('460', 'sqlserver', '10659', '91', '16', '19970905', '19970910.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('461', 'sqlserver', '10660', '65', '17', '19970908', '19971015.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('462', 'sqlserver', '10661', '66', '16', '19970909', '19970915.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('463', 'sqlserver', '10662', '77', '12', '19970909', '19970918.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('464', 'sqlserver', '10663', '38', '11', '19970910', '19971003.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('465', 'sqlserver', '10664', '57', '10', '19970910', '19970919.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('466', 'sqlserver', '10665', '77', '10', '19970911', '19970917.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('467', 'sqlserver', '10666', '97', '16', '19970912', '19970922.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('468', 'sqlserver', '10667', '49', '16', '19970912', '19970919.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('469', 'sqlserver', '10668', '115', '10', '19970915', '19970923.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('470', 'sqlserver', '10669', '102', '11', '19970915', '19970922.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('471', 'sqlserver', '10670', '54', '13', '19970916', '19970918.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('472', 'sqlserver', '10671', '55', '10', '19970917', '19970924.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('473', 'sqlserver', '10672', '34', '18', '19970917', '19970926.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('474', 'sqlserver', '10673', '119', '11', '19970918', '19970919.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('475', 'sqlserver', '10674', '67', '13', '19970918', '19970930.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('476', 'sqlserver', '10675', '54', '14', '19970919', '19970923.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('477', 'sqlserver', '10676', '109', '11', '19970922', '19970929.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('478', 'sqlserver', '10677', '32', '10', '19970922', '19970926.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('479', 'sqlserver', '10678', '100', '16', '19970923', '19971016.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('480', 'sqlserver', '10679', '36', '17', '19970923', '19970930.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('481', 'sqlserver', '10680', '84', '10', '19970924', '19970926.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('482', 'sqlserver', '10681', '61', '12', '19970925', '19970930.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('483', 'sqlserver', '10682', '32', '12', '19970925', '19971001.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('484', 'sqlserver', '10683', '47', '11', '19970926', '19971001.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('485', 'sqlserver', '10684', '85', '12', '19970926', '19970930.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('486', 'sqlserver', '10685', '60', '13', '19970929', '19971003.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('487', 'sqlserver', '10686', '88', '11', '19970930', '19971008.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('488', 'sqlserver', '10687', '66', '18', '19970930', '19971030.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('489', 'sqlserver', '10688', '112', '13', '19971001', '19971007.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('490', 'sqlserver', '10689', '34', '10', '19971001', '19971007.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('491', 'sqlserver', '10690', '63', '10', '19971002', '19971003.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('492', 'sqlserver', '10691', '92', '11', '19971003', '19971022.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('493', 'sqlserver', '10692', '30', '13', '19971003', '19971013.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('494', 'sqlserver', '10693', '118', '12', '19971006', '19971010.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('495', 'sqlserver', '10694', '92', '17', '19971006', '19971009.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('496', 'sqlserver', '10695', '119', '16', '19971007', '19971014.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('497', 'sqlserver', '10696', '118', '17', '19971008', '19971014.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('498', 'sqlserver', '10697', '76', '12', '19971008', '19971014.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('499', 'sqlserver', '10698', '49', '13', '19971009', '19971017.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('500', 'sqlserver', '10699', '81', '12', '19971009', '19971013.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('501', 'sqlserver', '10700', '100', '12', '19971010', '19971016.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('502', 'sqlserver', '10701', '66', '15', '19971013', '19971015.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('503', 'sqlserver', '10702', '30', '13', '19971013', '19971021.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('504', 'sqlserver', '10703', '53', '15', '19971014', '19971020.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('505', 'sqlserver', '10704', '91', '15', '19971014', '19971107.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('506', 'sqlserver', '10705', '64', '18', '19971015', '19971118.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('507', 'sqlserver', '10706', '84', '17', '19971016', '19971021.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('508', 'sqlserver', '10707', '33', '13', '19971016', '19971023.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('509', 'sqlserver', '10708', '106', '15', '19971017', '19971105.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('510', 'sqlserver', '10709', '60', '10', '19971017', '19971120.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('511', 'sqlserver', '10710', '56', '10', '19971020', '19971023.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('512', 'sqlserver', '10711', '100', '14', '19971021', '19971029.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('513', 'sqlserver', '10712', '66', '12', '19971021', '19971031.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('514', 'sqlserver', '10713', '100', '10', '19971022', '19971024.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('515', 'sqlserver', '10714', '100', '14', '19971022', '19971027.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('516', 'sqlserver', '10715', '38', '12', '19971023', '19971029.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('517', 'sqlserver', '10716', '93', '13', '19971024', '19971027.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('518', 'sqlserver', '10717', '54', '10', '19971024', '19971029.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('519', 'sqlserver', '10718', '68', '10', '19971027', '19971029.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('520', 'sqlserver', '10719', '74', '17', '19971027', '19971105.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('521', 'sqlserver', '10720', '90', '17', '19971028', '19971105.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('522', 'sqlserver', '10721', '92', '14', '19971029', '19971031.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('523', 'sqlserver', '10722', '100', '17', '19971029', '19971104.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('524', 'sqlserver', '10723', '118', '12', '19971030', '19971125.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('525', 'sqlserver', '10724', '80', '17', '19971030', '19971105.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('526', 'sqlserver', '10725', '50', '13', '19971031', '19971105.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('527', 'sqlserver', '10726', '48', '13', '19971103', '19971205.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('528', 'sqlserver', '10727', '95', '11', '19971103', '19971205.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('529', 'sqlserver', '10728', '91', '13', '19971104', '19971111.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('530', 'sqlserver', '10729', '76', '17', '19971104', '19971114.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('531', 'sqlserver', '10730', '38', '14', '19971105', '19971114.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('532', 'sqlserver', '10731', '43', '16', '19971106', '19971114.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('533', 'sqlserver', '10732', '38', '12', '19971106', '19971107.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('534', 'sqlserver', '10733', '34', '10', '19971107', '19971110.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('535', 'sqlserver', '10734', '60', '11', '19971107', '19971112.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('536', 'sqlserver', '10735', '74', '15', '19971110', '19971121.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('537', 'sqlserver', '10736', '66', '18', '19971111', '19971121.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('538', 'sqlserver', '10737', '114', '11', '19971111', '19971118.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('539', 'sqlserver', '10738', '103', '11', '19971112', '19971118.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('540', 'sqlserver', '10739', '114', '12', '19971112', '19971117.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('541', 'sqlserver', '10740', '118', '13', '19971113', '19971125.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('542', 'sqlserver', '10741', '33', '13', '19971114', '19971118.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('543', 'sqlserver', '10742', '39', '12', '19971114', '19971118.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('544', 'sqlserver', '10743', '33', '10', '19971117', '19971121.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('545', 'sqlserver', '10744', '112', '15', '19971117', '19971124.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('546', 'sqlserver', '10745', '92', '18', '19971118', '19971127.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('547', 'sqlserver', '10746', '43', '10', '19971119', '19971121.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('548', 'sqlserver', '10747', '88', '15', '19971119', '19971126.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('549', 'sqlserver', '10748', '100', '12', '19971120', '19971128.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('550', 'sqlserver', '10749', '67', '13', '19971120', '19971219.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('551', 'sqlserver', '10750', '116', '18', '19971121', '19971124.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('552', 'sqlserver', '10751', '97', '12', '19971124', '19971203.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('553', 'sqlserver', '10752', '82', '11', '19971124', '19971128.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('554', 'sqlserver', '10753', '56', '12', '19971125', '19971127.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('555', 'sqlserver', '10754', '78', '15', '19971125', '19971127.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('556', 'sqlserver', '10755', '38', '13', '19971126', '19971128.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('557', 'sqlserver', '10756', '104', '17', '19971127', '19971202.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('558', 'sqlserver', '10757', '100', '15', '19971127', '19971215.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('559', 'sqlserver', '10758', '97', '12', '19971128', '19971204.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('560', 'sqlserver', '10759', '31', '12', '19971128', '19971212.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('561', 'sqlserver', '10760', '79', '13', '19971201', '19971210.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('562', 'sqlserver', '10761', '94', '14', '19971202', '19971208.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('563', 'sqlserver', '10762', '53', '12', '19971202', '19971209.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('564', 'sqlserver', '10763', '52', '12', '19971203', '19971208.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('565', 'sqlserver', '10764', '49', '15', '19971203', '19971208.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('566', 'sqlserver', '10765', '92', '12', '19971204', '19971209.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('567', 'sqlserver', '10766', '85', '13', '19971205', '19971209.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('568', 'sqlserver', '10767', '105', '13', '19971205', '19971215.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('569', 'sqlserver', '10768', '33', '12', '19971208', '19971215.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('570', 'sqlserver', '10769', '112', '12', '19971208', '19971212.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('571', 'sqlserver', '10770', '63', '17', '19971209', '19971217.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('572', 'sqlserver', '10771', '49', '18', '19971210', '19980102.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('573', 'sqlserver', '10772', '73', '12', '19971210', '19971219.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('574', 'sqlserver', '10773', '49', '10', '19971211', '19971216.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('575', 'sqlserver', '10774', '53', '13', '19971211', '19971212.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('576', 'sqlserver', '10775', '107', '16', '19971212', '19971226.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('577', 'sqlserver', '10776', '49', '10', '19971215', '19971218.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('578', 'sqlserver', '10777', '60', '16', '19971215', '19980121.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('579', 'sqlserver', '10778', '34', '12', '19971216', '19971224.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('580', 'sqlserver', '10779', '81', '12', '19971216', '19980114.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('581', 'sqlserver', '10780', '75', '11', '19971216', '19971225.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('582', 'sqlserver', '10781', '116', '11', '19971217', '19971219.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('583', 'sqlserver', '10782', '41', '18', '19971217', '19971222.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('584', 'sqlserver', '10783', '63', '13', '19971218', '19971219.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('585', 'sqlserver', '10784', '78', '13', '19971218', '19971222.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('586', 'sqlserver', '10785', '62', '10', '19971218', '19971224.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('587', 'sqlserver', '10786', '91', '17', '19971219', '19971223.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('588', 'sqlserver', '10787', '70', '11', '19971219', '19971226.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('589', 'sqlserver', '10788', '92', '10', '19971222', '19980119.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('590', 'sqlserver', '10789', '52', '10', '19971222', '19971231.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('591', 'sqlserver', '10790', '60', '15', '19971222', '19971226.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('592', 'sqlserver', '10791', '54', '15', '19971223', '19980101.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('593', 'sqlserver', '10792', '120', '10', '19971223', '19971231.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('594', 'sqlserver', '10793', '33', '12', '19971224', '19980108.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('595', 'sqlserver', '10794', '90', '15', '19971224', '19980102.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('596', 'sqlserver', '10795', '49', '17', '19971224', '19980120.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('597', 'sqlserver', '10796', '64', '12', '19971225', '19980114.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('598', 'sqlserver', '10797', '46', '16', '19971225', '19980105.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('599', 'sqlserver', '10798', '67', '11', '19971226', '19980105.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('600', 'sqlserver', '10799', '68', '18', '19971226', '19980105.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('601', 'sqlserver', '10800', '101', '10', '19971226', '19980105.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('602', 'sqlserver', '10801', '37', '13', '19971229', '19971231.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('603', 'sqlserver', '10802', '102', '13', '19971229', '19980102.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('604', 'sqlserver', '10803', '117', '13', '19971230', '19980106.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('605', 'sqlserver', '10804', '101', '15', '19971230', '19980107.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('606', 'sqlserver', '10805', '106', '11', '19971230', '19980109.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('607', 'sqlserver', '10806', '113', '12', '19971231', '19980105.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('608', 'sqlserver', '10807', '56', '13', '19971231', '19980130.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('609', 'sqlserver', '10808', '84', '11', '19980101', '19980109.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('610', 'sqlserver', '10809', '117', '16', '19980101', '19980107.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('611', 'sqlserver', '10810', '71', '11', '19980101', '19980107.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('612', 'sqlserver', '10811', '76', '17', '19980102', '19980108.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('613', 'sqlserver', '10812', '95', '14', '19980102', '19980112.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('614', 'sqlserver', '10813', '96', '10', '19980105', '19980109.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('615', 'sqlserver', '10814', '113', '12', '19980105', '19980114.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('616', 'sqlserver', '10815', '100', '11', '19980105', '19980114.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('617', 'sqlserver', '10816', '61', '13', '19980106', '19980204.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('618', 'sqlserver', '10817', '68', '12', '19980106', '19980113.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('619', 'sqlserver', '10818', '78', '16', '19980107', '19980112.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('620', 'sqlserver', '10819', '41', '11', '19980107', '19980116.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('621', 'sqlserver', '10820', '94', '12', '19980107', '19980113.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('622', 'sqlserver', '10821', '104', '10', '19980108', '19980115.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('623', 'sqlserver', '10822', '111', '15', '19980108', '19980116.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('624', 'sqlserver', '10823', '75', '14', '19980109', '19980113.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('625', 'sqlserver', '10824', '53', '17', '19980109', '19980130.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('626', 'sqlserver', '10825', '46', '10', '19980109', '19980114.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('627', 'sqlserver', '10826', '36', '15', '19980112', '19980206.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('628', 'sqlserver', '10827', '38', '10', '19980112', '19980206.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('629', 'sqlserver', '10828', '93', '18', '19980113', '19980204.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('630', 'sqlserver', '10829', '67', '18', '19980113', '19980123.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('631', 'sqlserver', '10830', '110', '13', '19980113', '19980121.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('632', 'sqlserver', '10831', '99', '12', '19980114', '19980123.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('633', 'sqlserver', '10832', '70', '11', '19980114', '19980119.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('634', 'sqlserver', '10833', '85', '15', '19980115', '19980123.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('635', 'sqlserver', '10834', '110', '10', '19980115', '19980119.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('636', 'sqlserver', '10835', '30', '10', '19980115', '19980121.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('637', 'sqlserver', '10836', '49', '16', '19980116', '19980121.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('638', 'sqlserver', '10837', '34', '18', '19980116', '19980123.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('639', 'sqlserver', '10838', '76', '12', '19980119', '19980123.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('640', 'sqlserver', '10839', '110', '12', '19980119', '19980122.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('641', 'sqlserver', '10840', '76', '13', '19980119', '19980216.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('642', 'sqlserver', '10841', '105', '14', '19980120', '19980129.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('643', 'sqlserver', '10842', '109', '10', '19980120', '19980129.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('644', 'sqlserver', '10843', '113', '13', '19980121', '19980126.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('645', 'sqlserver', '10844', '88', '17', '19980121', '19980126.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('646', 'sqlserver', '10845', '92', '17', '19980121', '19980130.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('647', 'sqlserver', '10846', '105', '11', '19980122', '19980123.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('648', 'sqlserver', '10847', '100', '13', '19980122', '19980210.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('649', 'sqlserver', '10848', '45', '16', '19980123', '19980129.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('650', 'sqlserver', '10849', '68', '18', '19980123', '19980130.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('651', 'sqlserver', '10850', '113', '10', '19980123', '19980130.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('652', 'sqlserver', '10851', '96', '14', '19980126', '19980202.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('653', 'sqlserver', '10852', '94', '17', '19980126', '19980130.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('654', 'sqlserver', '10853', '35', '18', '19980127', '19980203.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('655', 'sqlserver', '10854', '49', '12', '19980127', '19980205.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('656', 'sqlserver', '10855', '84', '12', '19980127', '19980204.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('657', 'sqlserver', '10856', '32', '12', '19980128', '19980210.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('658', 'sqlserver', '10857', '34', '17', '19980128', '19980206.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('659', 'sqlserver', '10858', '69', '11', '19980129', '19980203.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('660', 'sqlserver', '10859', '54', '10', '19980129', '19980202.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('661', 'sqlserver', '10860', '55', '12', '19980129', '19980204.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('662', 'sqlserver', '10861', '118', '13', '19980130', '19980217.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('663', 'sqlserver', '10862', '73', '17', '19980130', '19980202.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('664', 'sqlserver', '10863', '64', '13', '19980202', '19980217.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('665', 'sqlserver', '10864', '33', '13', '19980202', '19980209.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('666', 'sqlserver', '10865', '92', '11', '19980202', '19980212.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('667', 'sqlserver', '10866', '34', '14', '19980203', '19980212.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('668', 'sqlserver', '10867', '77', '15', '19980203', '19980211.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('669', 'sqlserver', '10868', '91', '16', '19980204', '19980223.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('670', 'sqlserver', '10869', '101', '14', '19980204', '19980209.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('671', 'sqlserver', '10870', '120', '14', '19980204', '19980213.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('672', 'sqlserver', '10871', '38', '18', '19980205', '19980210.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('673', 'sqlserver', '10872', '59', '14', '19980205', '19980209.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('674', 'sqlserver', '10873', '119', '13', '19980206', '19980209.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('675', 'sqlserver', '10874', '59', '14', '19980206', '19980211.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('676', 'sqlserver', '10875', '34', '13', '19980206', '19980303.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('677', 'sqlserver', '10876', '38', '16', '19980209', '19980212.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('678', 'sqlserver', '10877', '96', '10', '19980209', '19980219.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('679', 'sqlserver', '10878', '92', '13', '19980210', '19980212.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('680', 'sqlserver', '10879', '119', '12', '19980210', '19980212.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('681', 'sqlserver', '10880', '53', '16', '19980210', '19980218.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('682', 'sqlserver', '10881', '41', '13', '19980211', '19980218.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('683', 'sqlserver', '10882', '100', '13', '19980211', '19980220.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('684', 'sqlserver', '10883', '77', '17', '19980212', '19980220.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('685', 'sqlserver', '10884', '74', '13', '19980212', '19980213.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('686', 'sqlserver', '10885', '105', '15', '19980212', '19980218.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('687', 'sqlserver', '10886', '63', '10', '19980213', '19980302.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('688', 'sqlserver', '10887', '58', '17', '19980213', '19980216.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('689', 'sqlserver', '10888', '59', '10', '19980216', '19980223.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('690', 'sqlserver', '10889', '94', '18', '19980216', '19980223.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('691', 'sqlserver', '10890', '47', '16', '19980216', '19980218.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('692', 'sqlserver', '10891', '73', '16', '19980217', '19980219.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('693', 'sqlserver', '10892', '79', '13', '19980217', '19980219.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('694', 'sqlserver', '10893', '68', '18', '19980218', '19980220.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('695', 'sqlserver', '10894', '100', '10', '19980218', '19980220.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('696', 'sqlserver', '10895', '49', '12', '19980218', '19980223.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('697', 'sqlserver', '10896', '79', '16', '19980219', '19980227.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('698', 'sqlserver', '10897', '66', '12', '19980219', '19980225.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('699', 'sqlserver', '10898', '83', '13', '19980220', '19980306.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('700', 'sqlserver', '10899', '75', '14', '19980220', '19980226.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('701', 'sqlserver', '10900', '117', '10', '19980220', '19980304.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('702', 'sqlserver', '10901', '64', '13', '19980223', '19980226.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('703', 'sqlserver', '10902', '53', '10', '19980223', '19980303.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('704', 'sqlserver', '10903', '63', '12', '19980224', '19980304.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('705', 'sqlserver', '10904', '118', '12', '19980224', '19980227.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('706', 'sqlserver', '10905', '117', '18', '19980224', '19980306.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('707', 'sqlserver', '10906', '120', '13', '19980225', '19980303.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('708', 'sqlserver', '10907', '103', '15', '19980225', '19980227.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('709', 'sqlserver', '10908', '95', '13', '19980226', '19980306.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('710', 'sqlserver', '10909', '99', '10', '19980226', '19980310.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('711', 'sqlserver', '10910', '119', '10', '19980226', '19980304.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('712', 'sqlserver', '10911', '59', '12', '19980226', '19980305.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('713', 'sqlserver', '10912', '66', '11', '19980226', '19980318.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('714', 'sqlserver', '10913', '91', '13', '19980226', '19980304.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('715', 'sqlserver', '10914', '91', '15', '19980227', '19980302.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('716', 'sqlserver', '10915', '109', '11', '19980227', '19980302.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('717', 'sqlserver', '10916', '93', '10', '19980227', '19980309.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('718', 'sqlserver', '10917', '98', '13', '19980302', '19980311.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('719', 'sqlserver', '10918', '39', '12', '19980302', '19980311.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('720', 'sqlserver', '10919', '76', '11', '19980302', '19980304.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('721', 'sqlserver', '10920', '33', '13', '19980303', '19980309.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('722', 'sqlserver', '10921', '112', '10', '19980303', '19980309.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('723', 'sqlserver', '10922', '63', '14', '19980303', '19980305.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('724', 'sqlserver', '10923', '70', '16', '19980303', '19980313.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('725', 'sqlserver', '10924', '34', '12', '19980304', '19980408.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('726', 'sqlserver', '10925', '63', '12', '19980304', '19980313.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('727', 'sqlserver', '10926', '31', '13', '19980304', '19980311.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('728', 'sqlserver', '10927', '69', '13', '19980305', '19980408.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('729', 'sqlserver', '10928', '58', '10', '19980305', '19980318.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('730', 'sqlserver', '10929', '54', '15', '19980305', '19980312.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('731', 'sqlserver', '10930', '105', '13', '19980306', '19980318.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('732', 'sqlserver', '10931', '97', '13', '19980306', '19980319.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('733', 'sqlserver', '10932', '38', '17', '19980306', '19980324.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('734', 'sqlserver', '10933', '67', '15', '19980306', '19980316.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('735', 'sqlserver', '10934', '73', '12', '19980309', '19980312.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('736', 'sqlserver', '10935', '117', '13', '19980309', '19980318.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('737', 'sqlserver', '10936', '61', '12', '19980309', '19980318.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('738', 'sqlserver', '10937', '41', '16', '19980310', '19980313.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('739', 'sqlserver', '10938', '92', '12', '19980310', '19980316.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('740', 'sqlserver', '10939', '78', '11', '19980310', '19980313.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('741', 'sqlserver', '10940', '38', '17', '19980311', '19980323.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('742', 'sqlserver', '10941', '100', '16', '19980311', '19980320.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('743', 'sqlserver', '10942', '95', '18', '19980311', '19980318.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('744', 'sqlserver', '10943', '40', '13', '19980311', '19980319.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('745', 'sqlserver', '10944', '39', '15', '19980312', '19980313.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('746', 'sqlserver', '10945', '81', '13', '19980312', '19980318.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('747', 'sqlserver', '10946', '112', '10', '19980312', '19980319.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('748', 'sqlserver', '10947', '40', '12', '19980313', '19980316.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('749', 'sqlserver', '10948', '59', '12', '19980313', '19980319.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('750', 'sqlserver', '10949', '39', '11', '19980313', '19980317.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('751', 'sqlserver', '10950', '78', '10', '19980316', '19980323.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('752', 'sqlserver', '10951', '97', '18', '19980316', '19980407.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('753', 'sqlserver', '10952', '30', '10', '19980316', '19980324.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('754', 'sqlserver', '10953', '33', '18', '19980316', '19980325.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('755', 'sqlserver', '10954', '76', '14', '19980317', '19980320.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('756', 'sqlserver', '10955', '53', '17', '19980317', '19980320.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('757', 'sqlserver', '10956', '35', '15', '19980317', '19980320.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('758', 'sqlserver', '10957', '64', '17', '19980318', '19980327.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('759', 'sqlserver', '10958', '83', '16', '19980318', '19980327.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('760', 'sqlserver', '10959', '60', '15', '19980318', '19980323.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('761', 'sqlserver', '10960', '64', '12', '19980319', '19980408.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('762', 'sqlserver', '10961', '91', '17', '19980319', '19980330.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('763', 'sqlserver', '10962', '92', '17', '19980319', '19980323.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('764', 'sqlserver', '10963', '57', '18', '19980319', '19980326.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('765', 'sqlserver', '10964', '103', '12', '19980320', '19980324.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('766', 'sqlserver', '10965', '84', '15', '19980320', '19980330.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('767', 'sqlserver', '10966', '43', '13', '19980320', '19980408.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('768', 'sqlserver', '10967', '108', '11', '19980323', '19980402.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('769', 'sqlserver', '10968', '49', '10', '19980323', '19980401.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('770', 'sqlserver', '10969', '44', '10', '19980323', '19980330.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('771', 'sqlserver', '10970', '37', '18', '19980324', '19980424.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('772', 'sqlserver', '10971', '55', '11', '19980324', '19980402.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('773', 'sqlserver', '10972', '69', '13', '19980324', '19980326.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('774', 'sqlserver', '10973', '69', '15', '19980324', '19980327.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('775', 'sqlserver', '10974', '104', '12', '19980325', '19980403.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('776', 'sqlserver', '10975', '39', '10', '19980325', '19980327.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('777', 'sqlserver', '10976', '64', '10', '19980325', '19980403.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('778', 'sqlserver', '10977', '53', '17', '19980326', '19980410.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('779', 'sqlserver', '10978', '79', '18', '19980326', '19980423.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('780', 'sqlserver', '10979', '49', '17', '19980326', '19980331.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('781', 'sqlserver', '10980', '53', '13', '19980327', '19980417.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('782', 'sqlserver', '10981', '63', '10', '19980327', '19980402.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('783', 'sqlserver', '10982', '39', '11', '19980327', '19980408.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('784', 'sqlserver', '10983', '100', '11', '19980327', '19980406.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('785', 'sqlserver', '10984', '100', '10', '19980330', '19980403.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('786', 'sqlserver', '10985', '66', '11', '19980330', '19980402.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('787', 'sqlserver', '10986', '83', '17', '19980330', '19980421.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('788', 'sqlserver', '10987', '48', '17', '19980331', '19980406.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('789', 'sqlserver', '10988', '94', '12', '19980331', '19980410.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('790', 'sqlserver', '10989', '90', '11', '19980331', '19980402.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('791', 'sqlserver', '10990', '49', '11', '19980401', '19980407.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('792', 'sqlserver', '10991', '92', '10', '19980401', '19980407.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('793', 'sqlserver', '10992', '106', '10', '19980401', '19980403.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('794', 'sqlserver', '10993', '53', '16', '19980401', '19980410.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('795', 'sqlserver', '10994', '112', '11', '19980402', '19980409.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('796', 'sqlserver', '10995', '87', '10', '19980402', '19980406.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('797', 'sqlserver', '10996', '92', '13', '19980402', '19980410.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('798', 'sqlserver', '10997', '75', '17', '19980403', '19980413.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('799', 'sqlserver', '10998', '120', '17', '19980403', '19980417.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('800', 'sqlserver', '10999', '85', '15', '19980403', '19980410.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('801', 'sqlserver', '11000', '94', '11', '19980406', '19980414.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('802', 'sqlserver', '11001', '53', '11', '19980406', '19980414.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('803', 'sqlserver', '11002', '100', '13', '19980406', '19980416.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('804', 'sqlserver', '11003', '107', '12', '19980406', '19980408.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('805', 'sqlserver', '11004', '79', '12', '19980407', '19980420.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('806', 'sqlserver', '11005', '119', '11', '19980407', '19980410.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('807', 'sqlserver', '11006', '61', '12', '19980407', '19980415.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('808', 'sqlserver', '11007', '89', '17', '19980408', '19980413.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('809', 'sqlserver', '11008', '49', '16', '19980408', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('810', 'sqlserver', '11009', '59', '11', '19980408', '19980410.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('811', 'sqlserver', '11010', '95', '11', '19980409', '19980421.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('812', 'sqlserver', '11011', '30', '12', '19980409', '19980413.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('813', 'sqlserver', '11012', '54', '10', '19980409', '19980417.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('814', 'sqlserver', '11013', '98', '11', '19980409', '19980410.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('815', 'sqlserver', '11014', '76', '11', '19980410', '19980415.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('816', 'sqlserver', '11015', '99', '11', '19980410', '19980420.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('817', 'sqlserver', '11016', '33', '18', '19980410', '19980413.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('818', 'sqlserver', '11017', '49', '18', '19980413', '19980420.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('819', 'sqlserver', '11018', '77', '13', '19980413', '19980416.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('820', 'sqlserver', '11019', '93', '15', '19980413', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('821', 'sqlserver', '11020', '85', '11', '19980414', '19980416.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('822', 'sqlserver', '11021', '92', '12', '19980414', '19980421.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('823', 'sqlserver', '11022', '63', '18', '19980414', '19980504.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('824', 'sqlserver', '11023', '40', '10', '19980414', '19980424.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('825', 'sqlserver', '11024', '48', '13', '19980415', '19980420.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('826', 'sqlserver', '11025', '116', '15', '19980415', '19980424.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('827', 'sqlserver', '11026', '56', '13', '19980415', '19980428.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('828', 'sqlserver', '11027', '39', '10', '19980416', '19980420.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('829', 'sqlserver', '11028', '68', '11', '19980416', '19980422.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('830', 'sqlserver', '11029', '43', '13', '19980416', '19980427.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('831', 'sqlserver', '11030', '100', '16', '19980417', '19980427.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('832', 'sqlserver', '11031', '100', '15', '19980417', '19980424.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('833', 'sqlserver', '11032', '118', '11', '19980417', '19980423.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('834', 'sqlserver', '11033', '97', '16', '19980417', '19980423.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('835', 'sqlserver', '11034', '84', '17', '19980420', '19980427.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('836', 'sqlserver', '11035', '105', '11', '19980420', '19980424.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('837', 'sqlserver', '11036', '46', '17', '19980420', '19980422.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('838', 'sqlserver', '11037', '59', '16', '19980421', '19980427.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('839', 'sqlserver', '11038', '105', '10', '19980421', '19980430.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('840', 'sqlserver', '11039', '76', '10', '19980421', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('841', 'sqlserver', '11040', '61', '13', '19980422', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('842', 'sqlserver', '11041', '43', '12', '19980422', '19980428.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('843', 'sqlserver', '11042', '44', '11', '19980422', '19980501.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('844', 'sqlserver', '11043', '103', '14', '19980422', '19980429.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('845', 'sqlserver', '11044', '120', '13', '19980423', '19980501.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('846', 'sqlserver', '11045', '39', '15', '19980423', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('847', 'sqlserver', '11046', '115', '17', '19980423', '19980424.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('848', 'sqlserver', '11047', '48', '16', '19980424', '19980501.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('849', 'sqlserver', '11048', '39', '16', '19980424', '19980430.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('850', 'sqlserver', '11049', '60', '12', '19980424', '19980504.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('851', 'sqlserver', '11050', '53', '17', '19980427', '19980505.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('852', 'sqlserver', '11051', '70', '16', '19980427', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('853', 'sqlserver', '11052', '63', '12', '19980427', '19980501.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('854', 'sqlserver', '11053', '88', '11', '19980427', '19980429.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('855', 'sqlserver', '11054', '41', '17', '19980428', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('856', 'sqlserver', '11055', '64', '16', '19980428', '19980505.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('857', 'sqlserver', '11056', '48', '17', '19980428', '19980501.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('858', 'sqlserver', '11057', '82', '12', '19980429', '19980501.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('859', 'sqlserver', '11058', '35', '18', '19980429', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('860', 'sqlserver', '11059', '96', '11', '19980429', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('861', 'sqlserver', '11060', '56', '11', '19980430', '19980504.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('862', 'sqlserver', '11061', '61', '13', '19980430', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('863', 'sqlserver', '11062', '95', '13', '19980430', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('864', 'sqlserver', '11063', '66', '12', '19980430', '19980506.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('865', 'sqlserver', '11064', '100', '10', '19980501', '19980504.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('866', 'sqlserver', '11065', '75', '17', '19980501', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('867', 'sqlserver', '11066', '118', '16', '19980501', '19980504.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('868', 'sqlserver', '11067', '46', '10', '19980504', '19980506.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('869', 'sqlserver', '11068', '91', '17', '19980504', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('870', 'sqlserver', '11069', '109', '10', '19980504', '19980506.0', '1', '0');
-INSERT INTO FactOrders_Final VALUES ('871', 'sqlserver', '11070', '73', '11', '19980505', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('872', 'sqlserver', '11071', '75', '10', '19980505', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('873', 'sqlserver', '11072', '49', '13', '19980505', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('874', 'sqlserver', '11073', '87', '11', '19980505', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('875', 'sqlserver', '11074', '102', '16', '19980506', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('876', 'sqlserver', '11075', '97', '17', '19980506', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('877', 'sqlserver', '11076', '38', '13', '19980506', NULL, '0', '1');
-INSERT INTO FactOrders_Final VALUES ('878', 'sqlserver', '11077', '94', '10', '19980506', NULL, '0', '1');
+INSERT INTO FactOrders_Final ([fact_order_key], [source_system], [order_id_source], [customer_key], [employee_key], [order_date_key], [ship_date_key], [nb_commandes_livrees], [nb_commandes_non_livrees]) VALUES
+(1, N'access', 30, 27, 9, 20060115, 20060122, 1, 0),
+(2, N'access', 31, 4, 3, 20060120, 20060122, 1, 0),
+(3, N'access', 32, 12, 4, 20060122, 20060122, 1, 0),
+(4, N'access', 33, 8, 6, 20060130, 20060131, 1, 0),
+(5, N'access', 34, 4, 9, 20060206, 20060207, 1, 0),
+(6, N'access', 35, 29, 3, 20060210, 20060212, 1, 0),
+(7, N'access', 36, 3, 4, 20060223, 20060225, 1, 0),
+(8, N'access', 37, 6, 8, 20060306, 20060309, 1, 0),
+(9, N'access', 38, 28, 9, 20060310, 20060311, 1, 0),
+(10, N'access', 39, 8, 3, 20060322, 20060324, 1, 0),
+(11, N'access', 40, 10, 4, 20060324, 20060324, 1, 0),
+(12, N'access', 41, 7, 1, 20060324, NULL, 0, 1),
+(13, N'access', 42, 10, 1, 20060324, 20060407, 1, 0),
+(14, N'access', 43, 11, 1, 20060324, NULL, 0, 1),
+(15, N'access', 44, 1, 1, 20060324, NULL, 0, 1),
+(16, N'access', 45, 28, 1, 20060407, 20060407, 1, 0),
+(17, N'access', 46, 9, 7, 20060405, 20060405, 1, 0),
+(18, N'access', 47, 6, 6, 20060408, 20060408, 1, 0),
+(19, N'access', 48, 8, 4, 20060405, 20060405, 1, 0),
+(20, N'access', 50, 25, 9, 20060405, 20060405, 1, 0),
+(21, N'access', 51, 26, 9, 20060405, 20060405, 1, 0),
+(22, N'access', 55, 29, 1, 20060405, 20060405, 1, 0),
+(23, N'access', 56, 6, 2, 20060403, 20060403, 1, 0),
+(24, N'access', 57, 27, 9, 20060422, 20060422, 1, 0),
+(25, N'access', 58, 4, 3, 20060422, 20060422, 1, 0),
+(26, N'access', 59, 12, 4, 20060422, 20060422, 1, 0),
+(27, N'access', 60, 8, 6, 20060430, 20060430, 1, 0),
+(28, N'access', 61, 4, 9, 20060407, 20060407, 1, 0),
+(29, N'access', 62, 29, 3, 20060412, 20060412, 1, 0),
+(30, N'access', 63, 3, 4, 20060425, 20060425, 1, 0),
+(31, N'access', 64, 6, 8, 20060509, 20060509, 1, 0),
+(32, N'access', 65, 28, 9, 20060511, 20060511, 1, 0),
+(33, N'access', 66, 8, 3, 20060524, 20060524, 1, 0),
+(34, N'access', 67, 10, 4, 20060524, 20060524, 1, 0),
+(35, N'access', 68, 7, 1, 20060524, NULL, 0, 1),
+(36, N'access', 69, 10, 1, 20060524, NULL, 0, 1),
+(37, N'access', 70, 11, 1, 20060524, NULL, 0, 1),
+(38, N'access', 71, 1, 1, 20060524, NULL, 0, 1),
+(39, N'access', 72, 28, 1, 20060607, 20060607, 1, 0),
+(40, N'access', 73, 9, 7, 20060605, 20060605, 1, 0),
+(41, N'access', 74, 6, 6, 20060608, 20060608, 1, 0),
+(42, N'access', 75, 8, 4, 20060605, 20060605, 1, 0),
+(43, N'access', 76, 25, 9, 20060605, 20060605, 1, 0),
+(44, N'access', 77, 26, 9, 20060605, 20060605, 1, 0),
+(45, N'access', 78, 29, 1, 20060605, 20060605, 1, 0),
+(46, N'access', 79, 6, 2, 20060623, 20060623, 1, 0),
+(47, N'access', 80, 4, 2, 20060425, NULL, 0, 1),
+(48, N'access', 81, 3, 2, 20060425, NULL, 0, 1),
+(49, N'sqlserver', 10248, 114, 14, 19960704, 19960716, 1, 0),
+(50, N'sqlserver', 10249, 108, 15, 19960705, 19960710, 1, 0),
+(51, N'sqlserver', 10250, 63, 13, 19960708, 19960712, 1, 0),
+(52, N'sqlserver', 10251, 113, 12, 19960708, 19960715, 1, 0),
+(53, N'sqlserver', 10252, 105, 13, 19960709, 19960711, 1, 0),
+(54, N'sqlserver', 10253, 63, 12, 19960710, 19960716, 1, 0),
+(55, N'sqlserver', 10254, 43, 14, 19960711, 19960723, 1, 0),
+(56, N'sqlserver', 10255, 97, 18, 19960712, 19960715, 1, 0),
+(57, N'sqlserver', 10256, 117, 12, 19960715, 19960717, 1, 0),
+(58, N'sqlserver', 10257, 64, 13, 19960716, 19960722, 1, 0),
+(59, N'sqlserver', 10258, 49, 10, 19960717, 19960723, 1, 0),
+(60, N'sqlserver', 10259, 42, 13, 19960718, 19960725, 1, 0),
+(61, N'sqlserver', 10260, 85, 13, 19960719, 19960729, 1, 0),
+(62, N'sqlserver', 10261, 90, 13, 19960719, 19960730, 1, 0),
+(63, N'sqlserver', 10262, 94, 17, 19960722, 19960725, 1, 0),
+(64, N'sqlserver', 10263, 49, 18, 19960723, 19960731, 1, 0),
+(65, N'sqlserver', 10264, 53, 15, 19960724, 19960823, 1, 0),
+(66, N'sqlserver', 10265, 36, 11, 19960725, 19960812, 1, 0),
+(67, N'sqlserver', 10266, 116, 12, 19960726, 19960731, 1, 0),
+(68, N'sqlserver', 10267, 54, 13, 19960729, 19960806, 1, 0),
+(69, N'sqlserver', 10268, 62, 17, 19960730, 19960802, 1, 0),
+(70, N'sqlserver', 10269, 118, 14, 19960731, 19960809, 1, 0),
+(71, N'sqlserver', 10270, 116, 10, 19960801, 19960802, 1, 0),
+(72, N'sqlserver', 10271, 104, 15, 19960801, 19960830, 1, 0),
+(73, N'sqlserver', 10272, 94, 15, 19960802, 19960806, 1, 0),
+(74, N'sqlserver', 10273, 92, 12, 19960805, 19960812, 1, 0),
+(75, N'sqlserver', 10274, 114, 15, 19960806, 19960816, 1, 0),
+(76, N'sqlserver', 10275, 78, 10, 19960807, 19960809, 1, 0),
+(77, N'sqlserver', 10276, 109, 17, 19960808, 19960814, 1, 0),
+(78, N'sqlserver', 10277, 81, 11, 19960809, 19960813, 1, 0),
+(79, N'sqlserver', 10278, 34, 17, 19960812, 19960816, 1, 0),
+(80, N'sqlserver', 10279, 73, 17, 19960813, 19960816, 1, 0),
+(81, N'sqlserver', 10280, 34, 11, 19960814, 19960912, 1, 0),
+(82, N'sqlserver', 10281, 98, 13, 19960814, 19960821, 1, 0),
+(83, N'sqlserver', 10282, 98, 13, 19960815, 19960821, 1, 0),
+(84, N'sqlserver', 10283, 75, 12, 19960816, 19960823, 1, 0),
+(85, N'sqlserver', 10284, 73, 13, 19960819, 19960827, 1, 0),
+(86, N'sqlserver', 10285, 92, 10, 19960820, 19960826, 1, 0),
+(87, N'sqlserver', 10286, 92, 17, 19960821, 19960830, 1, 0),
+(88, N'sqlserver', 10287, 96, 17, 19960822, 19960828, 1, 0),
+(89, N'sqlserver', 10288, 95, 13, 19960823, 19960903, 1, 0),
+(90, N'sqlserver', 10289, 40, 16, 19960826, 19960828, 1, 0),
+(91, N'sqlserver', 10290, 44, 17, 19960827, 19960903, 1, 0),
+(92, N'sqlserver', 10291, 90, 15, 19960827, 19960904, 1, 0),
+(93, N'sqlserver', 10292, 110, 10, 19960828, 19960902, 1, 0),
+(94, N'sqlserver', 10293, 109, 10, 19960829, 19960911, 1, 0),
+(95, N'sqlserver', 10294, 94, 13, 19960830, 19960905, 1, 0),
+(96, N'sqlserver', 10295, 114, 11, 19960902, 19960910, 1, 0),
+(97, N'sqlserver', 10296, 75, 15, 19960903, 19960911, 1, 0),
+(98, N'sqlserver', 10297, 36, 14, 19960904, 19960910, 1, 0),
+(99, N'sqlserver', 10298, 66, 15, 19960905, 19960911, 1, 0),
+(100, N'sqlserver', 10299, 96, 13, 19960906, 19960913, 1, 0),
+(101, N'sqlserver', 10300, 78, 11, 19960909, 19960918, 1, 0),
+(102, N'sqlserver', 10301, 115, 17, 19960909, 19960917, 1, 0),
+(103, N'sqlserver', 10302, 105, 13, 19960910, 19961009, 1, 0),
+(104, N'sqlserver', 10303, 59, 16, 19960911, 19960918, 1, 0),
+(105, N'sqlserver', 10304, 109, 10, 19960912, 19960917, 1, 0),
+(106, N'sqlserver', 10305, 84, 17, 19960913, 19961009, 1, 0),
+(107, N'sqlserver', 10306, 98, 10, 19960916, 19960923, 1, 0),
+(108, N'sqlserver', 10307, 77, 11, 19960917, 19960925, 1, 0),
+(109, N'sqlserver', 10308, 31, 16, 19960918, 19960924, 1, 0),
+(110, N'sqlserver', 10309, 66, 12, 19960919, 19961023, 1, 0),
+(111, N'sqlserver', 10310, 106, 17, 19960920, 19960927, 1, 0),
+(112, N'sqlserver', 10311, 47, 10, 19960920, 19960926, 1, 0),
+(113, N'sqlserver', 10312, 115, 11, 19960923, 19961003, 1, 0),
+(114, N'sqlserver', 10313, 92, 11, 19960924, 19961004, 1, 0),
+(115, N'sqlserver', 10314, 94, 10, 19960925, 19961004, 1, 0),
+(116, N'sqlserver', 10315, 67, 13, 19960926, 19961003, 1, 0),
+(117, N'sqlserver', 10316, 94, 10, 19960927, 19961008, 1, 0),
+(118, N'sqlserver', 10317, 77, 15, 19960930, 19961010, 1, 0),
+(119, N'sqlserver', 10318, 67, 17, 19961001, 19961004, 1, 0),
+(120, N'sqlserver', 10319, 109, 16, 19961002, 19961011, 1, 0),
+(121, N'sqlserver', 10320, 116, 14, 19961003, 19961018, 1, 0),
+(122, N'sqlserver', 10321, 67, 12, 19961003, 19961011, 1, 0),
+(123, N'sqlserver', 10322, 87, 16, 19961004, 19961023, 1, 0),
+(124, N'sqlserver', 10323, 68, 13, 19961007, 19961014, 1, 0),
+(125, N'sqlserver', 10324, 100, 18, 19961008, 19961010, 1, 0),
+(126, N'sqlserver', 10325, 68, 10, 19961009, 19961014, 1, 0),
+(127, N'sqlserver', 10326, 37, 13, 19961010, 19961014, 1, 0),
+(128, N'sqlserver', 10327, 53, 11, 19961011, 19961014, 1, 0),
+(129, N'sqlserver', 10328, 57, 13, 19961014, 19961017, 1, 0),
+(130, N'sqlserver', 10329, 104, 13, 19961015, 19961023, 1, 0),
+(131, N'sqlserver', 10330, 75, 12, 19961016, 19961028, 1, 0),
+(132, N'sqlserver', 10331, 38, 18, 19961016, 19961021, 1, 0),
+(133, N'sqlserver', 10332, 80, 12, 19961017, 19961021, 1, 0),
+(134, N'sqlserver', 10333, 116, 14, 19961018, 19961025, 1, 0),
+(135, N'sqlserver', 10334, 113, 17, 19961021, 19961028, 1, 0),
+(136, N'sqlserver', 10335, 66, 16, 19961022, 19961024, 1, 0),
+(137, N'sqlserver', 10336, 89, 16, 19961023, 19961025, 1, 0),
+(138, N'sqlserver', 10337, 54, 13, 19961024, 19961029, 1, 0),
+(139, N'sqlserver', 10338, 84, 13, 19961025, 19961029, 1, 0),
+(140, N'sqlserver', 10339, 80, 11, 19961028, 19961104, 1, 0),
+(141, N'sqlserver', 10340, 38, 10, 19961029, 19961108, 1, 0),
+(142, N'sqlserver', 10341, 102, 16, 19961029, 19961105, 1, 0),
+(143, N'sqlserver', 10342, 54, 13, 19961030, 19961104, 1, 0),
+(144, N'sqlserver', 10343, 73, 13, 19961031, 19961106, 1, 0),
+(145, N'sqlserver', 10344, 118, 13, 19961101, 19961105, 1, 0),
+(146, N'sqlserver', 10345, 92, 11, 19961104, 19961111, 1, 0),
+(147, N'sqlserver', 10346, 94, 12, 19961105, 19961108, 1, 0),
+(148, N'sqlserver', 10347, 50, 13, 19961106, 19961108, 1, 0),
+(149, N'sqlserver', 10348, 115, 13, 19961107, 19961115, 1, 0),
+(150, N'sqlserver', 10349, 104, 16, 19961108, 19961115, 1, 0),
+(151, N'sqlserver', 10350, 70, 15, 19961111, 19961203, 1, 0),
+(152, N'sqlserver', 10351, 49, 10, 19961111, 19961120, 1, 0),
+(153, N'sqlserver', 10352, 57, 12, 19961112, 19961118, 1, 0),
+(154, N'sqlserver', 10353, 88, 16, 19961113, 19961125, 1, 0),
+(155, N'sqlserver', 10354, 87, 17, 19961114, 19961120, 1, 0),
+(156, N'sqlserver', 10355, 33, 15, 19961115, 19961120, 1, 0),
+(157, N'sqlserver', 10356, 115, 15, 19961118, 19961127, 1, 0),
+(158, N'sqlserver', 10357, 75, 10, 19961119, 19961202, 1, 0),
+(159, N'sqlserver', 10358, 70, 14, 19961120, 19961127, 1, 0),
+(160, N'sqlserver', 10359, 101, 14, 19961121, 19961126, 1, 0),
+(161, N'sqlserver', 10360, 36, 13, 19961122, 19961202, 1, 0),
+(162, N'sqlserver', 10361, 92, 10, 19961122, 19961203, 1, 0),
+(163, N'sqlserver', 10362, 38, 12, 19961125, 19961128, 1, 0),
+(164, N'sqlserver', 10363, 46, 13, 19961126, 19961204, 1, 0),
+(165, N'sqlserver', 10364, 48, 10, 19961126, 19961204, 1, 0),
+(166, N'sqlserver', 10365, 32, 12, 19961127, 19961202, 1, 0),
+(167, N'sqlserver', 10366, 58, 17, 19961128, 19961230, 1, 0),
+(168, N'sqlserver', 10367, 112, 16, 19961128, 19961202, 1, 0),
+(169, N'sqlserver', 10368, 49, 11, 19961129, 19961202, 1, 0),
+(170, N'sqlserver', 10369, 104, 17, 19961202, 19961209, 1, 0),
+(171, N'sqlserver', 10370, 43, 15, 19961203, 19961227, 1, 0),
+(172, N'sqlserver', 10371, 70, 10, 19961203, 19961224, 1, 0),
+(173, N'sqlserver', 10372, 91, 14, 19961204, 19961209, 1, 0),
+(174, N'sqlserver', 10373, 66, 13, 19961205, 19961211, 1, 0),
+(175, N'sqlserver', 10374, 120, 10, 19961205, 19961209, 1, 0),
+(176, N'sqlserver', 10375, 65, 12, 19961206, 19961209, 1, 0),
+(177, N'sqlserver', 10376, 80, 10, 19961209, 19961213, 1, 0),
+(178, N'sqlserver', 10377, 101, 10, 19961209, 19961213, 1, 0),
+(179, N'sqlserver', 10378, 53, 14, 19961210, 19961219, 1, 0),
+(180, N'sqlserver', 10379, 90, 11, 19961211, 19961213, 1, 0),
+(181, N'sqlserver', 10380, 66, 17, 19961212, 19970116, 1, 0),
+(182, N'sqlserver', 10381, 75, 12, 19961212, 19961213, 1, 0),
+(183, N'sqlserver', 10382, 49, 13, 19961213, 19961216, 1, 0),
+(184, N'sqlserver', 10383, 33, 17, 19961216, 19961218, 1, 0),
+(185, N'sqlserver', 10384, 34, 12, 19961216, 19961220, 1, 0),
+(186, N'sqlserver', 10385, 104, 10, 19961217, 19961223, 1, 0),
+(187, N'sqlserver', 10386, 50, 18, 19961218, 19961225, 1, 0),
+(188, N'sqlserver', 10387, 99, 10, 19961218, 19961220, 1, 0),
+(189, N'sqlserver', 10388, 101, 11, 19961219, 19961220, 1, 0),
+(190, N'sqlserver', 10389, 39, 13, 19961220, 19961224, 1, 0),
+(191, N'sqlserver', 10390, 49, 15, 19961223, 19961226, 1, 0),
+(192, N'sqlserver', 10391, 46, 12, 19961223, 19961231, 1, 0),
+(193, N'sqlserver', 10392, 88, 11, 19961224, 19970101, 1, 0),
+(194, N'sqlserver', 10393, 100, 10, 19961225, 19970103, 1, 0),
+(195, N'sqlserver', 10394, 65, 10, 19961225, 19970103, 1, 0),
+(196, N'sqlserver', 10395, 64, 15, 19961226, 19970103, 1, 0),
+(197, N'sqlserver', 10396, 54, 10, 19961227, 19970106, 1, 0),
+(198, N'sqlserver', 10397, 89, 14, 19961227, 19970102, 1, 0),
+(199, N'sqlserver', 10398, 100, 11, 19961230, 19970109, 1, 0),
+(200, N'sqlserver', 10399, 112, 17, 19961231, 19970108, 1, 0),
+(201, N'sqlserver', 10400, 48, 10, 19970101, 19970116, 1, 0),
+(202, N'sqlserver', 10401, 94, 10, 19970101, 19970110, 1, 0),
+(203, N'sqlserver', 10402, 49, 17, 19970102, 19970110, 1, 0),
+(204, N'sqlserver', 10403, 49, 13, 19970103, 19970109, 1, 0),
+(205, N'sqlserver', 10404, 78, 11, 19970103, 19970108, 1, 0),
+(206, N'sqlserver', 10405, 76, 10, 19970106, 19970122, 1, 0),
+(207, N'sqlserver', 10406, 91, 16, 19970107, 19970113, 1, 0),
+(208, N'sqlserver', 10407, 85, 11, 19970107, 19970130, 1, 0),
+(209, N'sqlserver', 10408, 52, 17, 19970108, 19970114, 1, 0),
+(210, N'sqlserver', 10409, 83, 12, 19970109, 19970114, 1, 0),
+(211, N'sqlserver', 10410, 39, 12, 19970110, 19970115, 1, 0),
+(212, N'sqlserver', 10411, 39, 18, 19970110, 19970121, 1, 0),
+(213, N'sqlserver', 10412, 116, 17, 19970113, 19970115, 1, 0),
+(214, N'sqlserver', 10413, 70, 12, 19970114, 19970116, 1, 0),
+(215, N'sqlserver', 10414, 50, 11, 19970114, 19970117, 1, 0),
+(216, N'sqlserver', 10415, 65, 12, 19970115, 19970124, 1, 0),
+(217, N'sqlserver', 10416, 116, 17, 19970116, 19970127, 1, 0),
+(218, N'sqlserver', 10417, 102, 13, 19970116, 19970128, 1, 0),
+(219, N'sqlserver', 10418, 92, 13, 19970117, 19970124, 1, 0),
+(220, N'sqlserver', 10419, 97, 13, 19970120, 19970130, 1, 0),
+(221, N'sqlserver', 10420, 117, 12, 19970121, 19970127, 1, 0),
+(222, N'sqlserver', 10421, 90, 17, 19970121, 19970127, 1, 0),
+(223, N'sqlserver', 10422, 56, 11, 19970122, 19970131, 1, 0),
+(224, N'sqlserver', 10423, 60, 15, 19970123, 19970224, 1, 0),
+(225, N'sqlserver', 10424, 80, 16, 19970123, 19970127, 1, 0),
+(226, N'sqlserver', 10425, 70, 15, 19970124, 19970214, 1, 0),
+(227, N'sqlserver', 10426, 58, 13, 19970127, 19970206, 1, 0),
+(228, N'sqlserver', 10427, 88, 13, 19970127, 19970303, 1, 0),
+(229, N'sqlserver', 10428, 95, 16, 19970128, 19970204, 1, 0),
+(230, N'sqlserver', 10429, 66, 12, 19970129, 19970207, 1, 0),
+(231, N'sqlserver', 10430, 49, 13, 19970130, 19970203, 1, 0),
+(232, N'sqlserver', 10431, 39, 13, 19970130, 19970207, 1, 0),
+(233, N'sqlserver', 10432, 104, 12, 19970131, 19970207, 1, 0),
+(234, N'sqlserver', 10433, 89, 12, 19970203, 19970304, 1, 0),
+(235, N'sqlserver', 10434, 53, 12, 19970203, 19970213, 1, 0),
+(236, N'sqlserver', 10435, 45, 17, 19970204, 19970207, 1, 0),
+(237, N'sqlserver', 10436, 36, 12, 19970205, 19970211, 1, 0),
+(238, N'sqlserver', 10437, 116, 17, 19970205, 19970212, 1, 0),
+(239, N'sqlserver', 10438, 108, 12, 19970206, 19970214, 1, 0),
+(240, N'sqlserver', 10439, 80, 15, 19970207, 19970210, 1, 0),
+(241, N'sqlserver', 10440, 100, 13, 19970210, 19970228, 1, 0),
+(242, N'sqlserver', 10441, 84, 12, 19970210, 19970314, 1, 0),
+(243, N'sqlserver', 10442, 49, 12, 19970211, 19970218, 1, 0),
+(244, N'sqlserver', 10443, 95, 17, 19970212, 19970214, 1, 0),
+(245, N'sqlserver', 10444, 34, 12, 19970212, 19970221, 1, 0),
+(246, N'sqlserver', 10445, 34, 12, 19970213, 19970220, 1, 0),
+(247, N'sqlserver', 10446, 108, 15, 19970214, 19970219, 1, 0),
+(248, N'sqlserver', 10447, 96, 13, 19970214, 19970307, 1, 0),
+(249, N'sqlserver', 10448, 93, 13, 19970217, 19970224, 1, 0),
+(250, N'sqlserver', 10449, 36, 12, 19970218, 19970227, 1, 0),
+(251, N'sqlserver', 10450, 113, 17, 19970219, 19970311, 1, 0),
+(252, N'sqlserver', 10451, 92, 13, 19970219, 19970312, 1, 0),
+(253, N'sqlserver', 10452, 100, 17, 19970220, 19970226, 1, 0),
+(254, N'sqlserver', 10453, 33, 10, 19970221, 19970226, 1, 0),
+(255, N'sqlserver', 10454, 70, 13, 19970221, 19970225, 1, 0),
+(256, N'sqlserver', 10455, 116, 17, 19970224, 19970303, 1, 0),
+(257, N'sqlserver', 10456, 68, 17, 19970225, 19970228, 1, 0),
+(258, N'sqlserver', 10457, 68, 11, 19970225, 19970303, 1, 0),
+(259, N'sqlserver', 10458, 105, 16, 19970226, 19970304, 1, 0),
+(260, N'sqlserver', 10459, 113, 13, 19970227, 19970228, 1, 0),
+(261, N'sqlserver', 10460, 53, 17, 19970228, 19970303, 1, 0),
+(262, N'sqlserver', 10461, 75, 10, 19970228, 19970305, 1, 0),
+(263, N'sqlserver', 10462, 45, 11, 19970303, 19970318, 1, 0),
+(264, N'sqlserver', 10463, 105, 14, 19970304, 19970306, 1, 0),
+(265, N'sqlserver', 10464, 57, 13, 19970304, 19970314, 1, 0),
+(266, N'sqlserver', 10465, 112, 10, 19970305, 19970314, 1, 0),
+(267, N'sqlserver', 10466, 44, 13, 19970306, 19970313, 1, 0),
+(268, N'sqlserver', 10467, 78, 17, 19970306, 19970311, 1, 0),
+(269, N'sqlserver', 10468, 68, 12, 19970307, 19970312, 1, 0),
+(270, N'sqlserver', 10469, 118, 10, 19970310, 19970314, 1, 0),
+(271, N'sqlserver', 10470, 38, 13, 19970311, 19970314, 1, 0),
+(272, N'sqlserver', 10471, 40, 11, 19970311, 19970318, 1, 0),
+(273, N'sqlserver', 10472, 101, 17, 19970312, 19970319, 1, 0),
+(274, N'sqlserver', 10473, 67, 10, 19970313, 19970321, 1, 0),
+(275, N'sqlserver', 10474, 87, 14, 19970313, 19970321, 1, 0),
+(276, N'sqlserver', 10475, 105, 18, 19970314, 19970404, 1, 0),
+(277, N'sqlserver', 10476, 64, 17, 19970317, 19970324, 1, 0),
+(278, N'sqlserver', 10477, 89, 14, 19970317, 19970325, 1, 0),
+(279, N'sqlserver', 10478, 113, 11, 19970318, 19970326, 1, 0),
+(280, N'sqlserver', 10479, 94, 12, 19970319, 19970321, 1, 0),
+(281, N'sqlserver', 10480, 52, 15, 19970320, 19970324, 1, 0),
+(282, N'sqlserver', 10481, 96, 17, 19970320, 19970325, 1, 0),
+(283, N'sqlserver', 10482, 72, 10, 19970321, 19970410, 1, 0),
+(284, N'sqlserver', 10483, 118, 16, 19970324, 19970425, 1, 0),
+(285, N'sqlserver', 10484, 40, 12, 19970324, 19970401, 1, 0),
+(286, N'sqlserver', 10485, 76, 13, 19970325, 19970331, 1, 0),
+(287, N'sqlserver', 10486, 64, 10, 19970326, 19970402, 1, 0),
+(288, N'sqlserver', 10487, 91, 11, 19970326, 19970328, 1, 0),
+(289, N'sqlserver', 10488, 54, 17, 19970327, 19970402, 1, 0),
+(290, N'sqlserver', 10489, 88, 15, 19970328, 19970409, 1, 0),
+(291, N'sqlserver', 10490, 64, 16, 19970331, 19970403, 1, 0),
+(292, N'sqlserver', 10491, 57, 17, 19970331, 19970408, 1, 0),
+(293, N'sqlserver', 10492, 39, 12, 19970401, 19970411, 1, 0),
+(294, N'sqlserver', 10493, 70, 13, 19970402, 19970410, 1, 0),
+(295, N'sqlserver', 10494, 44, 13, 19970402, 19970409, 1, 0),
+(296, N'sqlserver', 10495, 71, 12, 19970403, 19970411, 1, 0),
+(297, N'sqlserver', 10496, 110, 16, 19970404, 19970407, 1, 0),
+(298, N'sqlserver', 10497, 73, 16, 19970404, 19970407, 1, 0),
+(299, N'sqlserver', 10498, 64, 17, 19970407, 19970411, 1, 0),
+(300, N'sqlserver', 10499, 75, 13, 19970408, 19970416, 1, 0),
+(301, N'sqlserver', 10500, 70, 15, 19970409, 19970417, 1, 0),
+(302, N'sqlserver', 10501, 35, 18, 19970409, 19970416, 1, 0),
+(303, N'sqlserver', 10502, 87, 11, 19970410, 19970429, 1, 0),
+(304, N'sqlserver', 10503, 66, 15, 19970411, 19970416, 1, 0),
+(305, N'sqlserver', 10504, 118, 13, 19970411, 19970418, 1, 0),
+(306, N'sqlserver', 10505, 80, 12, 19970414, 19970421, 1, 0),
+(307, N'sqlserver', 10506, 68, 18, 19970415, 19970502, 1, 0),
+(308, N'sqlserver', 10507, 32, 16, 19970415, 19970422, 1, 0),
+(309, N'sqlserver', 10508, 85, 10, 19970416, 19970513, 1, 0),
+(310, N'sqlserver', 10509, 35, 13, 19970417, 19970429, 1, 0),
+(311, N'sqlserver', 10510, 100, 15, 19970418, 19970428, 1, 0),
+(312, N'sqlserver', 10511, 38, 13, 19970418, 19970421, 1, 0),
+(313, N'sqlserver', 10512, 50, 16, 19970421, 19970424, 1, 0),
+(314, N'sqlserver', 10513, 115, 16, 19970422, 19970428, 1, 0),
+(315, N'sqlserver', 10514, 49, 12, 19970422, 19970516, 1, 0),
+(316, N'sqlserver', 10515, 92, 11, 19970423, 19970523, 1, 0),
+(317, N'sqlserver', 10516, 66, 11, 19970424, 19970501, 1, 0),
+(318, N'sqlserver', 10517, 82, 12, 19970424, 19970429, 1, 0),
+(319, N'sqlserver', 10518, 109, 13, 19970425, 19970505, 1, 0),
+(320, N'sqlserver', 10519, 43, 15, 19970428, 19970501, 1, 0),
+(321, N'sqlserver', 10520, 99, 16, 19970429, 19970501, 1, 0),
+(322, N'sqlserver', 10521, 41, 17, 19970429, 19970502, 1, 0),
+(323, N'sqlserver', 10522, 73, 13, 19970430, 19970506, 1, 0),
+(324, N'sqlserver', 10523, 101, 16, 19970501, 19970530, 1, 0),
+(325, N'sqlserver', 10524, 34, 10, 19970501, 19970507, 1, 0),
+(326, N'sqlserver', 10525, 38, 10, 19970502, 19970523, 1, 0),
+(327, N'sqlserver', 10526, 116, 13, 19970505, 19970515, 1, 0),
+(328, N'sqlserver', 10527, 92, 16, 19970505, 19970507, 1, 0),
+(329, N'sqlserver', 10528, 61, 15, 19970506, 19970509, 1, 0),
+(330, N'sqlserver', 10529, 79, 14, 19970507, 19970509, 1, 0),
+(331, N'sqlserver', 10530, 88, 12, 19970508, 19970512, 1, 0),
+(332, N'sqlserver', 10531, 83, 16, 19970508, 19970519, 1, 0),
+(333, N'sqlserver', 10532, 48, 16, 19970509, 19970512, 1, 0),
+(334, N'sqlserver', 10533, 53, 17, 19970512, 19970522, 1, 0),
+(335, N'sqlserver', 10534, 73, 17, 19970512, 19970514, 1, 0),
+(336, N'sqlserver', 10535, 32, 13, 19970513, 19970521, 1, 0),
+(337, N'sqlserver', 10536, 73, 12, 19970514, 19970606, 1, 0),
+(338, N'sqlserver', 10537, 97, 10, 19970514, 19970519, 1, 0),
+(339, N'sqlserver', 10538, 40, 18, 19970515, 19970516, 1, 0),
+(340, N'sqlserver', 10539, 40, 15, 19970516, 19970523, 1, 0),
+(341, N'sqlserver', 10540, 92, 12, 19970519, 19970613, 1, 0),
+(342, N'sqlserver', 10541, 63, 11, 19970519, 19970529, 1, 0),
+(343, N'sqlserver', 10542, 68, 10, 19970520, 19970526, 1, 0),
+(344, N'sqlserver', 10543, 75, 17, 19970521, 19970523, 1, 0),
+(345, N'sqlserver', 10544, 77, 13, 19970521, 19970530, 1, 0),
+(346, N'sqlserver', 10545, 72, 17, 19970522, 19970626, 1, 0),
+(347, N'sqlserver', 10546, 113, 10, 19970523, 19970527, 1, 0),
+(348, N'sqlserver', 10547, 101, 12, 19970523, 19970602, 1, 0),
+(349, N'sqlserver', 10548, 108, 12, 19970526, 19970602, 1, 0),
+(350, N'sqlserver', 10549, 92, 14, 19970527, 19970530, 1, 0),
+(351, N'sqlserver', 10550, 59, 16, 19970528, 19970606, 1, 0),
+(352, N'sqlserver', 10551, 57, 13, 19970528, 19970606, 1, 0),
+(353, N'sqlserver', 10552, 64, 11, 19970529, 19970605, 1, 0),
+(354, N'sqlserver', 10553, 116, 11, 19970530, 19970603, 1, 0),
+(355, N'sqlserver', 10554, 85, 13, 19970530, 19970605, 1, 0),
+(356, N'sqlserver', 10555, 100, 15, 19970602, 19970604, 1, 0),
+(357, N'sqlserver', 10556, 102, 11, 19970603, 19970613, 1, 0),
+(358, N'sqlserver', 10557, 73, 18, 19970603, 19970606, 1, 0),
+(359, N'sqlserver', 10558, 33, 10, 19970604, 19970610, 1, 0),
+(360, N'sqlserver', 10559, 36, 15, 19970605, 19970613, 1, 0),
+(361, N'sqlserver', 10560, 54, 17, 19970606, 19970609, 1, 0),
+(362, N'sqlserver', 10561, 53, 11, 19970606, 19970609, 1, 0),
+(363, N'sqlserver', 10562, 95, 10, 19970609, 19970612, 1, 0),
+(364, N'sqlserver', 10563, 96, 11, 19970610, 19970624, 1, 0),
+(365, N'sqlserver', 10564, 94, 13, 19970610, 19970616, 1, 0),
+(366, N'sqlserver', 10565, 80, 17, 19970611, 19970618, 1, 0),
+(367, N'sqlserver', 10566, 36, 18, 19970612, 19970618, 1, 0),
+(368, N'sqlserver', 10567, 66, 10, 19970612, 19970617, 1, 0),
+(369, N'sqlserver', 10568, 58, 12, 19970613, 19970709, 1, 0),
+(370, N'sqlserver', 10569, 94, 14, 19970616, 19970711, 1, 0),
+(371, N'sqlserver', 10570, 80, 12, 19970617, 19970619, 1, 0),
+(372, N'sqlserver', 10571, 49, 17, 19970617, 19970704, 1, 0),
+(373, N'sqlserver', 10572, 34, 12, 19970618, 19970625, 1, 0),
+(374, N'sqlserver', 10573, 32, 16, 19970619, 19970620, 1, 0),
+(375, N'sqlserver', 10574, 111, 13, 19970619, 19970630, 1, 0),
+(376, N'sqlserver', 10575, 81, 14, 19970620, 19970630, 1, 0),
+(377, N'sqlserver', 10576, 109, 12, 19970623, 19970630, 1, 0),
+(378, N'sqlserver', 10577, 111, 18, 19970623, 19970630, 1, 0),
+(379, N'sqlserver', 10578, 40, 13, 19970624, 19970725, 1, 0),
+(380, N'sqlserver', 10579, 74, 10, 19970625, 19970704, 1, 0),
+(381, N'sqlserver', 10580, 85, 13, 19970626, 19970701, 1, 0),
+(382, N'sqlserver', 10581, 50, 12, 19970626, 19970702, 1, 0),
+(383, N'sqlserver', 10582, 35, 12, 19970627, 19970714, 1, 0),
+(384, N'sqlserver', 10583, 116, 11, 19970630, 19970704, 1, 0),
+(385, N'sqlserver', 10584, 36, 13, 19970630, 19970704, 1, 0),
+(386, N'sqlserver', 10585, 117, 16, 19970701, 19970710, 1, 0),
+(387, N'sqlserver', 10586, 95, 18, 19970702, 19970709, 1, 0),
+(388, N'sqlserver', 10587, 90, 10, 19970702, 19970709, 1, 0),
+(389, N'sqlserver', 10588, 92, 11, 19970703, 19970710, 1, 0),
+(390, N'sqlserver', 10589, 61, 17, 19970704, 19970714, 1, 0),
+(391, N'sqlserver', 10590, 80, 13, 19970707, 19970714, 1, 0),
+(392, N'sqlserver', 10591, 112, 10, 19970707, 19970716, 1, 0),
+(393, N'sqlserver', 10592, 73, 12, 19970708, 19970716, 1, 0),
+(394, N'sqlserver', 10593, 73, 16, 19970709, 19970813, 1, 0),
+(395, N'sqlserver', 10594, 84, 12, 19970709, 19970716, 1, 0),
+(396, N'sqlserver', 10595, 49, 11, 19970710, 19970714, 1, 0),
+(397, N'sqlserver', 10596, 118, 17, 19970711, 19970812, 1, 0),
+(398, N'sqlserver', 10597, 88, 16, 19970711, 19970718, 1, 0),
+(399, N'sqlserver', 10598, 94, 10, 19970714, 19970718, 1, 0),
+(400, N'sqlserver', 10599, 40, 15, 19970715, 19970721, 1, 0),
+(401, N'sqlserver', 10600, 65, 13, 19970716, 19970721, 1, 0),
+(402, N'sqlserver', 10601, 64, 16, 19970716, 19970722, 1, 0),
+(403, N'sqlserver', 10602, 112, 17, 19970717, 19970722, 1, 0),
+(404, N'sqlserver', 10603, 100, 17, 19970718, 19970808, 1, 0),
+(405, N'sqlserver', 10604, 57, 10, 19970718, 19970729, 1, 0),
+(406, N'sqlserver', 10605, 80, 10, 19970721, 19970729, 1, 0),
+(407, N'sqlserver', 10606, 110, 13, 19970722, 19970731, 1, 0),
+(408, N'sqlserver', 10607, 100, 14, 19970722, 19970725, 1, 0),
+(409, N'sqlserver', 10608, 108, 13, 19970723, 19970801, 1, 0),
+(410, N'sqlserver', 10609, 47, 16, 19970724, 19970730, 1, 0),
+(411, N'sqlserver', 10610, 70, 17, 19970725, 19970806, 1, 0),
+(412, N'sqlserver', 10611, 120, 15, 19970725, 19970801, 1, 0),
+(413, N'sqlserver', 10612, 100, 10, 19970728, 19970801, 1, 0),
+(414, N'sqlserver', 10613, 64, 13, 19970729, 19970801, 1, 0),
+(415, N'sqlserver', 10614, 35, 17, 19970729, 19970801, 1, 0),
+(416, N'sqlserver', 10615, 119, 11, 19970730, 19970806, 1, 0),
+(417, N'sqlserver', 10616, 61, 10, 19970731, 19970805, 1, 0),
+(418, N'sqlserver', 10617, 61, 13, 19970731, 19970804, 1, 0),
+(419, N'sqlserver', 10618, 80, 10, 19970801, 19970808, 1, 0),
+(420, N'sqlserver', 10619, 80, 12, 19970804, 19970807, 1, 0),
+(421, N'sqlserver', 10620, 71, 11, 19970805, 19970814, 1, 0),
+(422, N'sqlserver', 10621, 67, 13, 19970805, 19970811, 1, 0),
+(423, N'sqlserver', 10622, 96, 13, 19970806, 19970811, 1, 0),
+(424, N'sqlserver', 10623, 54, 17, 19970807, 19970812, 1, 0),
+(425, N'sqlserver', 10624, 107, 13, 19970807, 19970819, 1, 0),
+(426, N'sqlserver', 10625, 31, 12, 19970808, 19970814, 1, 0),
+(427, N'sqlserver', 10626, 34, 10, 19970811, 19970820, 1, 0),
+(428, N'sqlserver', 10627, 100, 17, 19970811, 19970821, 1, 0),
+(429, N'sqlserver', 10628, 36, 13, 19970812, 19970820, 1, 0),
+(430, N'sqlserver', 10629, 59, 13, 19970812, 19970820, 1, 0),
+(431, N'sqlserver', 10630, 68, 10, 19970813, 19970819, 1, 0),
+(432, N'sqlserver', 10631, 70, 17, 19970814, 19970815, 1, 0),
+(433, N'sqlserver', 10632, 115, 17, 19970814, 19970819, 1, 0),
+(434, N'sqlserver', 10633, 49, 16, 19970815, 19970818, 1, 0),
+(435, N'sqlserver', 10634, 52, 13, 19970815, 19970821, 1, 0),
+(436, N'sqlserver', 10635, 78, 17, 19970818, 19970821, 1, 0),
+(437, N'sqlserver', 10636, 116, 13, 19970819, 19970826, 1, 0),
+(438, N'sqlserver', 10637, 91, 15, 19970819, 19970826, 1, 0),
+(439, N'sqlserver', 10638, 76, 12, 19970820, 19970901, 1, 0),
+(440, N'sqlserver', 10639, 99, 16, 19970820, 19970827, 1, 0),
+(441, N'sqlserver', 10640, 115, 13, 19970821, 19970828, 1, 0),
+(442, N'sqlserver', 10641, 64, 13, 19970822, 19970826, 1, 0),
+(443, N'sqlserver', 10642, 102, 16, 19970822, 19970905, 1, 0),
+(444, N'sqlserver', 10643, 30, 15, 19970825, 19970902, 1, 0),
+(445, N'sqlserver', 10644, 117, 12, 19970825, 19970901, 1, 0),
+(446, N'sqlserver', 10645, 63, 13, 19970826, 19970902, 1, 0),
+(447, N'sqlserver', 10646, 66, 18, 19970827, 19970903, 1, 0),
+(448, N'sqlserver', 10647, 90, 13, 19970827, 19970903, 1, 0),
+(449, N'sqlserver', 10648, 96, 14, 19970828, 19970909, 1, 0),
+(450, N'sqlserver', 10649, 79, 14, 19970828, 19970829, 1, 0),
+(451, N'sqlserver', 10650, 50, 14, 19970829, 19970903, 1, 0),
+(452, N'sqlserver', 10651, 115, 17, 19970901, 19970911, 1, 0),
+(453, N'sqlserver', 10652, 60, 13, 19970901, 19970908, 1, 0),
+(454, N'sqlserver', 10653, 54, 10, 19970902, 19970919, 1, 0),
+(455, N'sqlserver', 10654, 34, 14, 19970902, 19970911, 1, 0),
+(456, N'sqlserver', 10655, 95, 10, 19970903, 19970911, 1, 0),
+(457, N'sqlserver', 10656, 61, 15, 19970904, 19970910, 1, 0),
+(458, N'sqlserver', 10657, 100, 11, 19970904, 19970915, 1, 0),
+(459, N'sqlserver', 10658, 92, 13, 19970905, 19970908, 1, 0),
+(460, N'sqlserver', 10659, 91, 16, 19970905, 19970910, 1, 0),
+(461, N'sqlserver', 10660, 65, 17, 19970908, 19971015, 1, 0),
+(462, N'sqlserver', 10661, 66, 16, 19970909, 19970915, 1, 0),
+(463, N'sqlserver', 10662, 77, 12, 19970909, 19970918, 1, 0),
+(464, N'sqlserver', 10663, 38, 11, 19970910, 19971003, 1, 0),
+(465, N'sqlserver', 10664, 57, 10, 19970910, 19970919, 1, 0),
+(466, N'sqlserver', 10665, 77, 10, 19970911, 19970917, 1, 0),
+(467, N'sqlserver', 10666, 97, 16, 19970912, 19970922, 1, 0),
+(468, N'sqlserver', 10667, 49, 16, 19970912, 19970919, 1, 0),
+(469, N'sqlserver', 10668, 115, 10, 19970915, 19970923, 1, 0),
+(470, N'sqlserver', 10669, 102, 11, 19970915, 19970922, 1, 0),
+(471, N'sqlserver', 10670, 54, 13, 19970916, 19970918, 1, 0),
+(472, N'sqlserver', 10671, 55, 10, 19970917, 19970924, 1, 0),
+(473, N'sqlserver', 10672, 34, 18, 19970917, 19970926, 1, 0),
+(474, N'sqlserver', 10673, 119, 11, 19970918, 19970919, 1, 0),
+(475, N'sqlserver', 10674, 67, 13, 19970918, 19970930, 1, 0),
+(476, N'sqlserver', 10675, 54, 14, 19970919, 19970923, 1, 0),
+(477, N'sqlserver', 10676, 109, 11, 19970922, 19970929, 1, 0),
+(478, N'sqlserver', 10677, 32, 10, 19970922, 19970926, 1, 0),
+(479, N'sqlserver', 10678, 100, 16, 19970923, 19971016, 1, 0),
+(480, N'sqlserver', 10679, 36, 17, 19970923, 19970930, 1, 0),
+(481, N'sqlserver', 10680, 84, 10, 19970924, 19970926, 1, 0),
+(482, N'sqlserver', 10681, 61, 12, 19970925, 19970930, 1, 0),
+(483, N'sqlserver', 10682, 32, 12, 19970925, 19971001, 1, 0),
+(484, N'sqlserver', 10683, 47, 11, 19970926, 19971001, 1, 0),
+(485, N'sqlserver', 10684, 85, 12, 19970926, 19970930, 1, 0),
+(486, N'sqlserver', 10685, 60, 13, 19970929, 19971003, 1, 0),
+(487, N'sqlserver', 10686, 88, 11, 19970930, 19971008, 1, 0),
+(488, N'sqlserver', 10687, 66, 18, 19970930, 19971030, 1, 0),
+(489, N'sqlserver', 10688, 112, 13, 19971001, 19971007, 1, 0),
+(490, N'sqlserver', 10689, 34, 10, 19971001, 19971007, 1, 0),
+(491, N'sqlserver', 10690, 63, 10, 19971002, 19971003, 1, 0),
+(492, N'sqlserver', 10691, 92, 11, 19971003, 19971022, 1, 0),
+(493, N'sqlserver', 10692, 30, 13, 19971003, 19971013, 1, 0),
+(494, N'sqlserver', 10693, 118, 12, 19971006, 19971010, 1, 0),
+(495, N'sqlserver', 10694, 92, 17, 19971006, 19971009, 1, 0),
+(496, N'sqlserver', 10695, 119, 16, 19971007, 19971014, 1, 0),
+(497, N'sqlserver', 10696, 118, 17, 19971008, 19971014, 1, 0),
+(498, N'sqlserver', 10697, 76, 12, 19971008, 19971014, 1, 0),
+(499, N'sqlserver', 10698, 49, 13, 19971009, 19971017, 1, 0),
+(500, N'sqlserver', 10699, 81, 12, 19971009, 19971013, 1, 0),
+(501, N'sqlserver', 10700, 100, 12, 19971010, 19971016, 1, 0),
+(502, N'sqlserver', 10701, 66, 15, 19971013, 19971015, 1, 0),
+(503, N'sqlserver', 10702, 30, 13, 19971013, 19971021, 1, 0),
+(504, N'sqlserver', 10703, 53, 15, 19971014, 19971020, 1, 0),
+(505, N'sqlserver', 10704, 91, 15, 19971014, 19971107, 1, 0),
+(506, N'sqlserver', 10705, 64, 18, 19971015, 19971118, 1, 0),
+(507, N'sqlserver', 10706, 84, 17, 19971016, 19971021, 1, 0),
+(508, N'sqlserver', 10707, 33, 13, 19971016, 19971023, 1, 0),
+(509, N'sqlserver', 10708, 106, 15, 19971017, 19971105, 1, 0),
+(510, N'sqlserver', 10709, 60, 10, 19971017, 19971120, 1, 0),
+(511, N'sqlserver', 10710, 56, 10, 19971020, 19971023, 1, 0),
+(512, N'sqlserver', 10711, 100, 14, 19971021, 19971029, 1, 0),
+(513, N'sqlserver', 10712, 66, 12, 19971021, 19971031, 1, 0),
+(514, N'sqlserver', 10713, 100, 10, 19971022, 19971024, 1, 0),
+(515, N'sqlserver', 10714, 100, 14, 19971022, 19971027, 1, 0),
+(516, N'sqlserver', 10715, 38, 12, 19971023, 19971029, 1, 0),
+(517, N'sqlserver', 10716, 93, 13, 19971024, 19971027, 1, 0),
+(518, N'sqlserver', 10717, 54, 10, 19971024, 19971029, 1, 0),
+(519, N'sqlserver', 10718, 68, 10, 19971027, 19971029, 1, 0),
+(520, N'sqlserver', 10719, 74, 17, 19971027, 19971105, 1, 0),
+(521, N'sqlserver', 10720, 90, 17, 19971028, 19971105, 1, 0),
+(522, N'sqlserver', 10721, 92, 14, 19971029, 19971031, 1, 0),
+(523, N'sqlserver', 10722, 100, 17, 19971029, 19971104, 1, 0),
+(524, N'sqlserver', 10723, 118, 12, 19971030, 19971125, 1, 0),
+(525, N'sqlserver', 10724, 80, 17, 19971030, 19971105, 1, 0),
+(526, N'sqlserver', 10725, 50, 13, 19971031, 19971105, 1, 0),
+(527, N'sqlserver', 10726, 48, 13, 19971103, 19971205, 1, 0),
+(528, N'sqlserver', 10727, 95, 11, 19971103, 19971205, 1, 0),
+(529, N'sqlserver', 10728, 91, 13, 19971104, 19971111, 1, 0),
+(530, N'sqlserver', 10729, 76, 17, 19971104, 19971114, 1, 0),
+(531, N'sqlserver', 10730, 38, 14, 19971105, 19971114, 1, 0),
+(532, N'sqlserver', 10731, 43, 16, 19971106, 19971114, 1, 0),
+(533, N'sqlserver', 10732, 38, 12, 19971106, 19971107, 1, 0),
+(534, N'sqlserver', 10733, 34, 10, 19971107, 19971110, 1, 0),
+(535, N'sqlserver', 10734, 60, 11, 19971107, 19971112, 1, 0),
+(536, N'sqlserver', 10735, 74, 15, 19971110, 19971121, 1, 0),
+(537, N'sqlserver', 10736, 66, 18, 19971111, 19971121, 1, 0),
+(538, N'sqlserver', 10737, 114, 11, 19971111, 19971118, 1, 0),
+(539, N'sqlserver', 10738, 103, 11, 19971112, 19971118, 1, 0),
+(540, N'sqlserver', 10739, 114, 12, 19971112, 19971117, 1, 0),
+(541, N'sqlserver', 10740, 118, 13, 19971113, 19971125, 1, 0),
+(542, N'sqlserver', 10741, 33, 13, 19971114, 19971118, 1, 0),
+(543, N'sqlserver', 10742, 39, 12, 19971114, 19971118, 1, 0),
+(544, N'sqlserver', 10743, 33, 10, 19971117, 19971121, 1, 0),
+(545, N'sqlserver', 10744, 112, 15, 19971117, 19971124, 1, 0),
+(546, N'sqlserver', 10745, 92, 18, 19971118, 19971127, 1, 0),
+(547, N'sqlserver', 10746, 43, 10, 19971119, 19971121, 1, 0),
+(548, N'sqlserver', 10747, 88, 15, 19971119, 19971126, 1, 0),
+(549, N'sqlserver', 10748, 100, 12, 19971120, 19971128, 1, 0),
+(550, N'sqlserver', 10749, 67, 13, 19971120, 19971219, 1, 0),
+(551, N'sqlserver', 10750, 116, 18, 19971121, 19971124, 1, 0),
+(552, N'sqlserver', 10751, 97, 12, 19971124, 19971203, 1, 0),
+(553, N'sqlserver', 10752, 82, 11, 19971124, 19971128, 1, 0),
+(554, N'sqlserver', 10753, 56, 12, 19971125, 19971127, 1, 0),
+(555, N'sqlserver', 10754, 78, 15, 19971125, 19971127, 1, 0),
+(556, N'sqlserver', 10755, 38, 13, 19971126, 19971128, 1, 0),
+(557, N'sqlserver', 10756, 104, 17, 19971127, 19971202, 1, 0),
+(558, N'sqlserver', 10757, 100, 15, 19971127, 19971215, 1, 0),
+(559, N'sqlserver', 10758, 97, 12, 19971128, 19971204, 1, 0),
+(560, N'sqlserver', 10759, 31, 12, 19971128, 19971212, 1, 0),
+(561, N'sqlserver', 10760, 79, 13, 19971201, 19971210, 1, 0),
+(562, N'sqlserver', 10761, 94, 14, 19971202, 19971208, 1, 0),
+(563, N'sqlserver', 10762, 53, 12, 19971202, 19971209, 1, 0),
+(564, N'sqlserver', 10763, 52, 12, 19971203, 19971208, 1, 0),
+(565, N'sqlserver', 10764, 49, 15, 19971203, 19971208, 1, 0),
+(566, N'sqlserver', 10765, 92, 12, 19971204, 19971209, 1, 0),
+(567, N'sqlserver', 10766, 85, 13, 19971205, 19971209, 1, 0),
+(568, N'sqlserver', 10767, 105, 13, 19971205, 19971215, 1, 0),
+(569, N'sqlserver', 10768, 33, 12, 19971208, 19971215, 1, 0),
+(570, N'sqlserver', 10769, 112, 12, 19971208, 19971212, 1, 0),
+(571, N'sqlserver', 10770, 63, 17, 19971209, 19971217, 1, 0),
+(572, N'sqlserver', 10771, 49, 18, 19971210, 19980102, 1, 0),
+(573, N'sqlserver', 10772, 73, 12, 19971210, 19971219, 1, 0),
+(574, N'sqlserver', 10773, 49, 10, 19971211, 19971216, 1, 0),
+(575, N'sqlserver', 10774, 53, 13, 19971211, 19971212, 1, 0),
+(576, N'sqlserver', 10775, 107, 16, 19971212, 19971226, 1, 0),
+(577, N'sqlserver', 10776, 49, 10, 19971215, 19971218, 1, 0),
+(578, N'sqlserver', 10777, 60, 16, 19971215, 19980121, 1, 0),
+(579, N'sqlserver', 10778, 34, 12, 19971216, 19971224, 1, 0),
+(580, N'sqlserver', 10779, 81, 12, 19971216, 19980114, 1, 0),
+(581, N'sqlserver', 10780, 75, 11, 19971216, 19971225, 1, 0),
+(582, N'sqlserver', 10781, 116, 11, 19971217, 19971219, 1, 0),
+(583, N'sqlserver', 10782, 41, 18, 19971217, 19971222, 1, 0),
+(584, N'sqlserver', 10783, 63, 13, 19971218, 19971219, 1, 0),
+(585, N'sqlserver', 10784, 78, 13, 19971218, 19971222, 1, 0),
+(586, N'sqlserver', 10785, 62, 10, 19971218, 19971224, 1, 0),
+(587, N'sqlserver', 10786, 91, 17, 19971219, 19971223, 1, 0),
+(588, N'sqlserver', 10787, 70, 11, 19971219, 19971226, 1, 0),
+(589, N'sqlserver', 10788, 92, 10, 19971222, 19980119, 1, 0),
+(590, N'sqlserver', 10789, 52, 10, 19971222, 19971231, 1, 0),
+(591, N'sqlserver', 10790, 60, 15, 19971222, 19971226, 1, 0),
+(592, N'sqlserver', 10791, 54, 15, 19971223, 19980101, 1, 0),
+(593, N'sqlserver', 10792, 120, 10, 19971223, 19971231, 1, 0),
+(594, N'sqlserver', 10793, 33, 12, 19971224, 19980108, 1, 0),
+(595, N'sqlserver', 10794, 90, 15, 19971224, 19980102, 1, 0),
+(596, N'sqlserver', 10795, 49, 17, 19971224, 19980120, 1, 0),
+(597, N'sqlserver', 10796, 64, 12, 19971225, 19980114, 1, 0),
+(598, N'sqlserver', 10797, 46, 16, 19971225, 19980105, 1, 0),
+(599, N'sqlserver', 10798, 67, 11, 19971226, 19980105, 1, 0),
+(600, N'sqlserver', 10799, 68, 18, 19971226, 19980105, 1, 0),
+(601, N'sqlserver', 10800, 101, 10, 19971226, 19980105, 1, 0),
+(602, N'sqlserver', 10801, 37, 13, 19971229, 19971231, 1, 0),
+(603, N'sqlserver', 10802, 102, 13, 19971229, 19980102, 1, 0),
+(604, N'sqlserver', 10803, 117, 13, 19971230, 19980106, 1, 0),
+(605, N'sqlserver', 10804, 101, 15, 19971230, 19980107, 1, 0),
+(606, N'sqlserver', 10805, 106, 11, 19971230, 19980109, 1, 0),
+(607, N'sqlserver', 10806, 113, 12, 19971231, 19980105, 1, 0),
+(608, N'sqlserver', 10807, 56, 13, 19971231, 19980130, 1, 0),
+(609, N'sqlserver', 10808, 84, 11, 19980101, 19980109, 1, 0),
+(610, N'sqlserver', 10809, 117, 16, 19980101, 19980107, 1, 0),
+(611, N'sqlserver', 10810, 71, 11, 19980101, 19980107, 1, 0),
+(612, N'sqlserver', 10811, 76, 17, 19980102, 19980108, 1, 0),
+(613, N'sqlserver', 10812, 95, 14, 19980102, 19980112, 1, 0),
+(614, N'sqlserver', 10813, 96, 10, 19980105, 19980109, 1, 0),
+(615, N'sqlserver', 10814, 113, 12, 19980105, 19980114, 1, 0),
+(616, N'sqlserver', 10815, 100, 11, 19980105, 19980114, 1, 0),
+(617, N'sqlserver', 10816, 61, 13, 19980106, 19980204, 1, 0),
+(618, N'sqlserver', 10817, 68, 12, 19980106, 19980113, 1, 0),
+(619, N'sqlserver', 10818, 78, 16, 19980107, 19980112, 1, 0),
+(620, N'sqlserver', 10819, 41, 11, 19980107, 19980116, 1, 0),
+(621, N'sqlserver', 10820, 94, 12, 19980107, 19980113, 1, 0),
+(622, N'sqlserver', 10821, 104, 10, 19980108, 19980115, 1, 0),
+(623, N'sqlserver', 10822, 111, 15, 19980108, 19980116, 1, 0),
+(624, N'sqlserver', 10823, 75, 14, 19980109, 19980113, 1, 0),
+(625, N'sqlserver', 10824, 53, 17, 19980109, 19980130, 1, 0),
+(626, N'sqlserver', 10825, 46, 10, 19980109, 19980114, 1, 0),
+(627, N'sqlserver', 10826, 36, 15, 19980112, 19980206, 1, 0),
+(628, N'sqlserver', 10827, 38, 10, 19980112, 19980206, 1, 0),
+(629, N'sqlserver', 10828, 93, 18, 19980113, 19980204, 1, 0),
+(630, N'sqlserver', 10829, 67, 18, 19980113, 19980123, 1, 0),
+(631, N'sqlserver', 10830, 110, 13, 19980113, 19980121, 1, 0),
+(632, N'sqlserver', 10831, 99, 12, 19980114, 19980123, 1, 0),
+(633, N'sqlserver', 10832, 70, 11, 19980114, 19980119, 1, 0),
+(634, N'sqlserver', 10833, 85, 15, 19980115, 19980123, 1, 0),
+(635, N'sqlserver', 10834, 110, 10, 19980115, 19980119, 1, 0),
+(636, N'sqlserver', 10835, 30, 10, 19980115, 19980121, 1, 0),
+(637, N'sqlserver', 10836, 49, 16, 19980116, 19980121, 1, 0),
+(638, N'sqlserver', 10837, 34, 18, 19980116, 19980123, 1, 0),
+(639, N'sqlserver', 10838, 76, 12, 19980119, 19980123, 1, 0),
+(640, N'sqlserver', 10839, 110, 12, 19980119, 19980122, 1, 0),
+(641, N'sqlserver', 10840, 76, 13, 19980119, 19980216, 1, 0),
+(642, N'sqlserver', 10841, 105, 14, 19980120, 19980129, 1, 0),
+(643, N'sqlserver', 10842, 109, 10, 19980120, 19980129, 1, 0),
+(644, N'sqlserver', 10843, 113, 13, 19980121, 19980126, 1, 0),
+(645, N'sqlserver', 10844, 88, 17, 19980121, 19980126, 1, 0),
+(646, N'sqlserver', 10845, 92, 17, 19980121, 19980130, 1, 0),
+(647, N'sqlserver', 10846, 105, 11, 19980122, 19980123, 1, 0),
+(648, N'sqlserver', 10847, 100, 13, 19980122, 19980210, 1, 0),
+(649, N'sqlserver', 10848, 45, 16, 19980123, 19980129, 1, 0),
+(650, N'sqlserver', 10849, 68, 18, 19980123, 19980130, 1, 0),
+(651, N'sqlserver', 10850, 113, 10, 19980123, 19980130, 1, 0),
+(652, N'sqlserver', 10851, 96, 14, 19980126, 19980202, 1, 0),
+(653, N'sqlserver', 10852, 94, 17, 19980126, 19980130, 1, 0),
+(654, N'sqlserver', 10853, 35, 18, 19980127, 19980203, 1, 0),
+(655, N'sqlserver', 10854, 49, 12, 19980127, 19980205, 1, 0),
+(656, N'sqlserver', 10855, 84, 12, 19980127, 19980204, 1, 0),
+(657, N'sqlserver', 10856, 32, 12, 19980128, 19980210, 1, 0),
+(658, N'sqlserver', 10857, 34, 17, 19980128, 19980206, 1, 0),
+(659, N'sqlserver', 10858, 69, 11, 19980129, 19980203, 1, 0),
+(660, N'sqlserver', 10859, 54, 10, 19980129, 19980202, 1, 0),
+(661, N'sqlserver', 10860, 55, 12, 19980129, 19980204, 1, 0),
+(662, N'sqlserver', 10861, 118, 13, 19980130, 19980217, 1, 0),
+(663, N'sqlserver', 10862, 73, 17, 19980130, 19980202, 1, 0),
+(664, N'sqlserver', 10863, 64, 13, 19980202, 19980217, 1, 0),
+(665, N'sqlserver', 10864, 33, 13, 19980202, 19980209, 1, 0),
+(666, N'sqlserver', 10865, 92, 11, 19980202, 19980212, 1, 0),
+(667, N'sqlserver', 10866, 34, 14, 19980203, 19980212, 1, 0),
+(668, N'sqlserver', 10867, 77, 15, 19980203, 19980211, 1, 0),
+(669, N'sqlserver', 10868, 91, 16, 19980204, 19980223, 1, 0),
+(670, N'sqlserver', 10869, 101, 14, 19980204, 19980209, 1, 0),
+(671, N'sqlserver', 10870, 120, 14, 19980204, 19980213, 1, 0),
+(672, N'sqlserver', 10871, 38, 18, 19980205, 19980210, 1, 0),
+(673, N'sqlserver', 10872, 59, 14, 19980205, 19980209, 1, 0),
+(674, N'sqlserver', 10873, 119, 13, 19980206, 19980209, 1, 0),
+(675, N'sqlserver', 10874, 59, 14, 19980206, 19980211, 1, 0),
+(676, N'sqlserver', 10875, 34, 13, 19980206, 19980303, 1, 0),
+(677, N'sqlserver', 10876, 38, 16, 19980209, 19980212, 1, 0),
+(678, N'sqlserver', 10877, 96, 10, 19980209, 19980219, 1, 0),
+(679, N'sqlserver', 10878, 92, 13, 19980210, 19980212, 1, 0),
+(680, N'sqlserver', 10879, 119, 12, 19980210, 19980212, 1, 0),
+(681, N'sqlserver', 10880, 53, 16, 19980210, 19980218, 1, 0),
+(682, N'sqlserver', 10881, 41, 13, 19980211, 19980218, 1, 0),
+(683, N'sqlserver', 10882, 100, 13, 19980211, 19980220, 1, 0),
+(684, N'sqlserver', 10883, 77, 17, 19980212, 19980220, 1, 0),
+(685, N'sqlserver', 10884, 74, 13, 19980212, 19980213, 1, 0),
+(686, N'sqlserver', 10885, 105, 15, 19980212, 19980218, 1, 0),
+(687, N'sqlserver', 10886, 63, 10, 19980213, 19980302, 1, 0),
+(688, N'sqlserver', 10887, 58, 17, 19980213, 19980216, 1, 0),
+(689, N'sqlserver', 10888, 59, 10, 19980216, 19980223, 1, 0),
+(690, N'sqlserver', 10889, 94, 18, 19980216, 19980223, 1, 0),
+(691, N'sqlserver', 10890, 47, 16, 19980216, 19980218, 1, 0),
+(692, N'sqlserver', 10891, 73, 16, 19980217, 19980219, 1, 0),
+(693, N'sqlserver', 10892, 79, 13, 19980217, 19980219, 1, 0),
+(694, N'sqlserver', 10893, 68, 18, 19980218, 19980220, 1, 0),
+(695, N'sqlserver', 10894, 100, 10, 19980218, 19980220, 1, 0),
+(696, N'sqlserver', 10895, 49, 12, 19980218, 19980223, 1, 0),
+(697, N'sqlserver', 10896, 79, 16, 19980219, 19980227, 1, 0),
+(698, N'sqlserver', 10897, 66, 12, 19980219, 19980225, 1, 0),
+(699, N'sqlserver', 10898, 83, 13, 19980220, 19980306, 1, 0),
+(700, N'sqlserver', 10899, 75, 14, 19980220, 19980226, 1, 0),
+(701, N'sqlserver', 10900, 117, 10, 19980220, 19980304, 1, 0),
+(702, N'sqlserver', 10901, 64, 13, 19980223, 19980226, 1, 0),
+(703, N'sqlserver', 10902, 53, 10, 19980223, 19980303, 1, 0),
+(704, N'sqlserver', 10903, 63, 12, 19980224, 19980304, 1, 0),
+(705, N'sqlserver', 10904, 118, 12, 19980224, 19980227, 1, 0),
+(706, N'sqlserver', 10905, 117, 18, 19980224, 19980306, 1, 0),
+(707, N'sqlserver', 10906, 120, 13, 19980225, 19980303, 1, 0),
+(708, N'sqlserver', 10907, 103, 15, 19980225, 19980227, 1, 0),
+(709, N'sqlserver', 10908, 95, 13, 19980226, 19980306, 1, 0),
+(710, N'sqlserver', 10909, 99, 10, 19980226, 19980310, 1, 0),
+(711, N'sqlserver', 10910, 119, 10, 19980226, 19980304, 1, 0),
+(712, N'sqlserver', 10911, 59, 12, 19980226, 19980305, 1, 0),
+(713, N'sqlserver', 10912, 66, 11, 19980226, 19980318, 1, 0),
+(714, N'sqlserver', 10913, 91, 13, 19980226, 19980304, 1, 0),
+(715, N'sqlserver', 10914, 91, 15, 19980227, 19980302, 1, 0),
+(716, N'sqlserver', 10915, 109, 11, 19980227, 19980302, 1, 0),
+(717, N'sqlserver', 10916, 93, 10, 19980227, 19980309, 1, 0),
+(718, N'sqlserver', 10917, 98, 13, 19980302, 19980311, 1, 0),
+(719, N'sqlserver', 10918, 39, 12, 19980302, 19980311, 1, 0),
+(720, N'sqlserver', 10919, 76, 11, 19980302, 19980304, 1, 0),
+(721, N'sqlserver', 10920, 33, 13, 19980303, 19980309, 1, 0),
+(722, N'sqlserver', 10921, 112, 10, 19980303, 19980309, 1, 0),
+(723, N'sqlserver', 10922, 63, 14, 19980303, 19980305, 1, 0),
+(724, N'sqlserver', 10923, 70, 16, 19980303, 19980313, 1, 0),
+(725, N'sqlserver', 10924, 34, 12, 19980304, 19980408, 1, 0),
+(726, N'sqlserver', 10925, 63, 12, 19980304, 19980313, 1, 0),
+(727, N'sqlserver', 10926, 31, 13, 19980304, 19980311, 1, 0),
+(728, N'sqlserver', 10927, 69, 13, 19980305, 19980408, 1, 0),
+(729, N'sqlserver', 10928, 58, 10, 19980305, 19980318, 1, 0),
+(730, N'sqlserver', 10929, 54, 15, 19980305, 19980312, 1, 0),
+(731, N'sqlserver', 10930, 105, 13, 19980306, 19980318, 1, 0),
+(732, N'sqlserver', 10931, 97, 13, 19980306, 19980319, 1, 0),
+(733, N'sqlserver', 10932, 38, 17, 19980306, 19980324, 1, 0),
+(734, N'sqlserver', 10933, 67, 15, 19980306, 19980316, 1, 0),
+(735, N'sqlserver', 10934, 73, 12, 19980309, 19980312, 1, 0),
+(736, N'sqlserver', 10935, 117, 13, 19980309, 19980318, 1, 0),
+(737, N'sqlserver', 10936, 61, 12, 19980309, 19980318, 1, 0),
+(738, N'sqlserver', 10937, 41, 16, 19980310, 19980313, 1, 0),
+(739, N'sqlserver', 10938, 92, 12, 19980310, 19980316, 1, 0),
+(740, N'sqlserver', 10939, 78, 11, 19980310, 19980313, 1, 0),
+(741, N'sqlserver', 10940, 38, 17, 19980311, 19980323, 1, 0),
+(742, N'sqlserver', 10941, 100, 16, 19980311, 19980320, 1, 0),
+(743, N'sqlserver', 10942, 95, 18, 19980311, 19980318, 1, 0),
+(744, N'sqlserver', 10943, 40, 13, 19980311, 19980319, 1, 0),
+(745, N'sqlserver', 10944, 39, 15, 19980312, 19980313, 1, 0),
+(746, N'sqlserver', 10945, 81, 13, 19980312, 19980318, 1, 0),
+(747, N'sqlserver', 10946, 112, 10, 19980312, 19980319, 1, 0),
+(748, N'sqlserver', 10947, 40, 12, 19980313, 19980316, 1, 0),
+(749, N'sqlserver', 10948, 59, 12, 19980313, 19980319, 1, 0),
+(750, N'sqlserver', 10949, 39, 11, 19980313, 19980317, 1, 0),
+(751, N'sqlserver', 10950, 78, 10, 19980316, 19980323, 1, 0),
+(752, N'sqlserver', 10951, 97, 18, 19980316, 19980407, 1, 0),
+(753, N'sqlserver', 10952, 30, 10, 19980316, 19980324, 1, 0),
+(754, N'sqlserver', 10953, 33, 18, 19980316, 19980325, 1, 0),
+(755, N'sqlserver', 10954, 76, 14, 19980317, 19980320, 1, 0),
+(756, N'sqlserver', 10955, 53, 17, 19980317, 19980320, 1, 0),
+(757, N'sqlserver', 10956, 35, 15, 19980317, 19980320, 1, 0),
+(758, N'sqlserver', 10957, 64, 17, 19980318, 19980327, 1, 0),
+(759, N'sqlserver', 10958, 83, 16, 19980318, 19980327, 1, 0),
+(760, N'sqlserver', 10959, 60, 15, 19980318, 19980323, 1, 0),
+(761, N'sqlserver', 10960, 64, 12, 19980319, 19980408, 1, 0),
+(762, N'sqlserver', 10961, 91, 17, 19980319, 19980330, 1, 0),
+(763, N'sqlserver', 10962, 92, 17, 19980319, 19980323, 1, 0),
+(764, N'sqlserver', 10963, 57, 18, 19980319, 19980326, 1, 0),
+(765, N'sqlserver', 10964, 103, 12, 19980320, 19980324, 1, 0),
+(766, N'sqlserver', 10965, 84, 15, 19980320, 19980330, 1, 0),
+(767, N'sqlserver', 10966, 43, 13, 19980320, 19980408, 1, 0),
+(768, N'sqlserver', 10967, 108, 11, 19980323, 19980402, 1, 0),
+(769, N'sqlserver', 10968, 49, 10, 19980323, 19980401, 1, 0),
+(770, N'sqlserver', 10969, 44, 10, 19980323, 19980330, 1, 0),
+(771, N'sqlserver', 10970, 37, 18, 19980324, 19980424, 1, 0),
+(772, N'sqlserver', 10971, 55, 11, 19980324, 19980402, 1, 0),
+(773, N'sqlserver', 10972, 69, 13, 19980324, 19980326, 1, 0),
+(774, N'sqlserver', 10973, 69, 15, 19980324, 19980327, 1, 0),
+(775, N'sqlserver', 10974, 104, 12, 19980325, 19980403, 1, 0),
+(776, N'sqlserver', 10975, 39, 10, 19980325, 19980327, 1, 0),
+(777, N'sqlserver', 10976, 64, 10, 19980325, 19980403, 1, 0),
+(778, N'sqlserver', 10977, 53, 17, 19980326, 19980410, 1, 0),
+(779, N'sqlserver', 10978, 79, 18, 19980326, 19980423, 1, 0),
+(780, N'sqlserver', 10979, 49, 17, 19980326, 19980331, 1, 0),
+(781, N'sqlserver', 10980, 53, 13, 19980327, 19980417, 1, 0),
+(782, N'sqlserver', 10981, 63, 10, 19980327, 19980402, 1, 0),
+(783, N'sqlserver', 10982, 39, 11, 19980327, 19980408, 1, 0),
+(784, N'sqlserver', 10983, 100, 11, 19980327, 19980406, 1, 0),
+(785, N'sqlserver', 10984, 100, 10, 19980330, 19980403, 1, 0),
+(786, N'sqlserver', 10985, 66, 11, 19980330, 19980402, 1, 0),
+(787, N'sqlserver', 10986, 83, 17, 19980330, 19980421, 1, 0),
+(788, N'sqlserver', 10987, 48, 17, 19980331, 19980406, 1, 0),
+(789, N'sqlserver', 10988, 94, 12, 19980331, 19980410, 1, 0),
+(790, N'sqlserver', 10989, 90, 11, 19980331, 19980402, 1, 0),
+(791, N'sqlserver', 10990, 49, 11, 19980401, 19980407, 1, 0),
+(792, N'sqlserver', 10991, 92, 10, 19980401, 19980407, 1, 0),
+(793, N'sqlserver', 10992, 106, 10, 19980401, 19980403, 1, 0),
+(794, N'sqlserver', 10993, 53, 16, 19980401, 19980410, 1, 0),
+(795, N'sqlserver', 10994, 112, 11, 19980402, 19980409, 1, 0),
+(796, N'sqlserver', 10995, 87, 10, 19980402, 19980406, 1, 0),
+(797, N'sqlserver', 10996, 92, 13, 19980402, 19980410, 1, 0),
+(798, N'sqlserver', 10997, 75, 17, 19980403, 19980413, 1, 0),
+(799, N'sqlserver', 10998, 120, 17, 19980403, 19980417, 1, 0),
+(800, N'sqlserver', 10999, 85, 15, 19980403, 19980410, 1, 0),
+(801, N'sqlserver', 11000, 94, 11, 19980406, 19980414, 1, 0),
+(802, N'sqlserver', 11001, 53, 11, 19980406, 19980414, 1, 0),
+(803, N'sqlserver', 11002, 100, 13, 19980406, 19980416, 1, 0),
+(804, N'sqlserver', 11003, 107, 12, 19980406, 19980408, 1, 0),
+(805, N'sqlserver', 11004, 79, 12, 19980407, 19980420, 1, 0),
+(806, N'sqlserver', 11005, 119, 11, 19980407, 19980410, 1, 0),
+(807, N'sqlserver', 11006, 61, 12, 19980407, 19980415, 1, 0),
+(808, N'sqlserver', 11007, 89, 17, 19980408, 19980413, 1, 0),
+(809, N'sqlserver', 11008, 49, 16, 19980408, NULL, 0, 1),
+(810, N'sqlserver', 11009, 59, 11, 19980408, 19980410, 1, 0),
+(811, N'sqlserver', 11010, 95, 11, 19980409, 19980421, 1, 0),
+(812, N'sqlserver', 11011, 30, 12, 19980409, 19980413, 1, 0),
+(813, N'sqlserver', 11012, 54, 10, 19980409, 19980417, 1, 0),
+(814, N'sqlserver', 11013, 98, 11, 19980409, 19980410, 1, 0),
+(815, N'sqlserver', 11014, 76, 11, 19980410, 19980415, 1, 0),
+(816, N'sqlserver', 11015, 99, 11, 19980410, 19980420, 1, 0),
+(817, N'sqlserver', 11016, 33, 18, 19980410, 19980413, 1, 0),
+(818, N'sqlserver', 11017, 49, 18, 19980413, 19980420, 1, 0),
+(819, N'sqlserver', 11018, 77, 13, 19980413, 19980416, 1, 0),
+(820, N'sqlserver', 11019, 93, 15, 19980413, NULL, 0, 1),
+(821, N'sqlserver', 11020, 85, 11, 19980414, 19980416, 1, 0),
+(822, N'sqlserver', 11021, 92, 12, 19980414, 19980421, 1, 0),
+(823, N'sqlserver', 11022, 63, 18, 19980414, 19980504, 1, 0),
+(824, N'sqlserver', 11023, 40, 10, 19980414, 19980424, 1, 0),
+(825, N'sqlserver', 11024, 48, 13, 19980415, 19980420, 1, 0),
+(826, N'sqlserver', 11025, 116, 15, 19980415, 19980424, 1, 0),
+(827, N'sqlserver', 11026, 56, 13, 19980415, 19980428, 1, 0),
+(828, N'sqlserver', 11027, 39, 10, 19980416, 19980420, 1, 0),
+(829, N'sqlserver', 11028, 68, 11, 19980416, 19980422, 1, 0),
+(830, N'sqlserver', 11029, 43, 13, 19980416, 19980427, 1, 0),
+(831, N'sqlserver', 11030, 100, 16, 19980417, 19980427, 1, 0),
+(832, N'sqlserver', 11031, 100, 15, 19980417, 19980424, 1, 0),
+(833, N'sqlserver', 11032, 118, 11, 19980417, 19980423, 1, 0),
+(834, N'sqlserver', 11033, 97, 16, 19980417, 19980423, 1, 0),
+(835, N'sqlserver', 11034, 84, 17, 19980420, 19980427, 1, 0),
+(836, N'sqlserver', 11035, 105, 11, 19980420, 19980424, 1, 0),
+(837, N'sqlserver', 11036, 46, 17, 19980420, 19980422, 1, 0),
+(838, N'sqlserver', 11037, 59, 16, 19980421, 19980427, 1, 0),
+(839, N'sqlserver', 11038, 105, 10, 19980421, 19980430, 1, 0),
+(840, N'sqlserver', 11039, 76, 10, 19980421, NULL, 0, 1),
+(841, N'sqlserver', 11040, 61, 13, 19980422, NULL, 0, 1),
+(842, N'sqlserver', 11041, 43, 12, 19980422, 19980428, 1, 0),
+(843, N'sqlserver', 11042, 44, 11, 19980422, 19980501, 1, 0),
+(844, N'sqlserver', 11043, 103, 14, 19980422, 19980429, 1, 0),
+(845, N'sqlserver', 11044, 120, 13, 19980423, 19980501, 1, 0),
+(846, N'sqlserver', 11045, 39, 15, 19980423, NULL, 0, 1),
+(847, N'sqlserver', 11046, 115, 17, 19980423, 19980424, 1, 0),
+(848, N'sqlserver', 11047, 48, 16, 19980424, 19980501, 1, 0),
+(849, N'sqlserver', 11048, 39, 16, 19980424, 19980430, 1, 0),
+(850, N'sqlserver', 11049, 60, 12, 19980424, 19980504, 1, 0),
+(851, N'sqlserver', 11050, 53, 17, 19980427, 19980505, 1, 0),
+(852, N'sqlserver', 11051, 70, 16, 19980427, NULL, 0, 1),
+(853, N'sqlserver', 11052, 63, 12, 19980427, 19980501, 1, 0),
+(854, N'sqlserver', 11053, 88, 11, 19980427, 19980429, 1, 0),
+(855, N'sqlserver', 11054, 41, 17, 19980428, NULL, 0, 1),
+(856, N'sqlserver', 11055, 64, 16, 19980428, 19980505, 1, 0),
+(857, N'sqlserver', 11056, 48, 17, 19980428, 19980501, 1, 0),
+(858, N'sqlserver', 11057, 82, 12, 19980429, 19980501, 1, 0),
+(859, N'sqlserver', 11058, 35, 18, 19980429, NULL, 0, 1),
+(860, N'sqlserver', 11059, 96, 11, 19980429, NULL, 0, 1),
+(861, N'sqlserver', 11060, 56, 11, 19980430, 19980504, 1, 0),
+(862, N'sqlserver', 11061, 61, 13, 19980430, NULL, 0, 1),
+(863, N'sqlserver', 11062, 95, 13, 19980430, NULL, 0, 1),
+(864, N'sqlserver', 11063, 66, 12, 19980430, 19980506, 1, 0),
+(865, N'sqlserver', 11064, 100, 10, 19980501, 19980504, 1, 0),
+(866, N'sqlserver', 11065, 75, 17, 19980501, NULL, 0, 1),
+(867, N'sqlserver', 11066, 118, 16, 19980501, 19980504, 1, 0),
+(868, N'sqlserver', 11067, 46, 10, 19980504, 19980506, 1, 0),
+(869, N'sqlserver', 11068, 91, 17, 19980504, NULL, 0, 1),
+(870, N'sqlserver', 11069, 109, 10, 19980504, 19980506, 1, 0),
+(871, N'sqlserver', 11070, 73, 11, 19980505, NULL, 0, 1),
+(872, N'sqlserver', 11071, 75, 10, 19980505, NULL, 0, 1),
+(873, N'sqlserver', 11072, 49, 13, 19980505, NULL, 0, 1),
+(874, N'sqlserver', 11073, 87, 11, 19980505, NULL, 0, 1),
+(875, N'sqlserver', 11074, 102, 16, 19980506, NULL, 0, 1),
+(876, N'sqlserver', 11075, 97, 17, 19980506, NULL, 0, 1),
+(877, N'sqlserver', 11076, 38, 13, 19980506, NULL, 0, 1),
+(878, N'sqlserver', 11077, 94, 10, 19980506, NULL, 0, 1);
+GO
@@ -0,0 +1,135 @@
+import argparse
+import sqlite3
+import tempfile
+import time
+from contextlib import closing
+from pathlib import Path
+
+import dashboard_queries as queries
+import duckdb_store
+import etl
+import warehouse
+from bench_suite import scd_dims
+from synthetic import make_scaled_sources
+
+
+# =========================
+# REQUETES DU DASHBOARD : SQLITE vs DUCKDB
+# =========================
+# facteurs d'échelle par rapport aux volumes northwind actuels (878 commandes)
+DEFAULT_SCALES = [100, 10_000]
+
+
+def build_dw(scale, tmp_dir):
+    """
+    DW sqlite (schéma typé + agrégats) et sa copie duckdb à un facteur d'échelle
+    """
+    access_data, sql_data = make_scaled_sources(scale)
+    dim_emp = etl.build_dim_employee(access_data, sql_data)
+    dim_cust = etl.build_dim_customer(access_data, sql_data)
+    dim_date = etl.build_dim_date()
+    fact = etl.build_fact_orders(access_data, sql_data, dim_emp, dim_cust, dim_date)
+
+    sqlite_path = Path(tmp_dir) / f"dw_x{scale}.sqlite"
+    duckdb_path = Path(tmp_dir) / f"dw_x{scale}.duckdb"
+    with closing(sqlite3.connect(sqlite_path)) as conn:
+        warehouse.load_star_schema(conn, dict(scd_dims(dim_emp, dim_cust), dim_date=dim_date, fact_orders=fact))
+        warehouse.refresh_aggregates(conn)
+        warehouse.record_load_version(conn, "full", len(fact))
+
+    t0 = time.perf_counter()
+    duckdb_store.export_from_sqlite(sqlite_path, duckdb_path)
+    print(f"  {len(fact):,} commandes, copie duckdb {time.perf_counter() - t0:.2f} s")
+    return sqlite_path, duckdb_path
+
+
+def query_cases(conn):
+    """
+    [(libellé, requête, arguments)] : vue d'ouverture (toute la période), une année,
+    et un filtre courant (une année, trois employés).
+    load_summary (lignes du graphe 3d) n'est pas mesuré sur toute la période : à x10000
+    ce sont des millions de lignes renvoyées, la mesure serait celle de pandas, pas du moteur.
+    """
+    min_key, max_key = queries.date_bounds(conn)
+    year = int(max_key) // 10000 - 1
+    everything = {"date_from": min_key, "date_to": max_key, "employee_keys": None}
+    one_year = {"date_from": year * 10000 + 101, "date_to": year * 10000 + 1231, "employee_keys": None}
+    three_employees = dict(one_year, employee_keys=(1, 2, 3))
+
+    cases = []
+    for label, filters in (("tout", everything), (f"{year}", one_year), (f"{year}, 3 employés", three_employees)):
+        cases += [
+            (f"load_kpis ({label})", queries.load_kpis, (filters,)),
+            (f"count_detail ({label})", queries.count_detail, (filters,)),
+            (f"load_detail_page ({label})", queries.load_detail_page, (filters, 1, 100, "customer_name", True)),
+            (f"load_monthly ({label})", queries.load_monthly, (filters,)),
+        ]
+        if filters is not everything:
+            cases.append((f"load_summary ({label})", queries.load_summary, (filters,)))
+    return cases
+
+
+def best_time(connect, fn, args, repeat):
+    best = None
+    for _ in range(repeat):
+        with closing(connect()) as cnx:
+            t0 = time.perf_counter()
+            fn(cnx, *args)
+            seconds = time.perf_counter() - t0
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def compare_engines(sqlite_path, duckdb_path, repeat):
+    engines = {
+        "sqlite": lambda: sqlite3.connect(sqlite_path),
+        "duckdb": lambda: duckdb_store.connect(duckdb_path),
+    }
+    with closing(engines["sqlite"]()) as conn:
+        cases = query_cases(conn)
+
+    total = dict.fromkeys(engines, 0.0)
+    for label, fn, args in cases:
+        times = {name: best_time(connect, fn, args, repeat) for name, connect in engines.items()}
+        for name, seconds in times.items():
+            total[name] += seconds
+        print(
+            f"  {label:<42} sqlite {times['sqlite']:8.3f} s | duckdb {times['duckdb']:8.3f} s"
+            f" | x{times['sqlite'] / times['duckdb']:6.1f}"
+        )
+    print(f"  {'total':<42} sqlite {total['sqlite']:8.3f} s | duckdb {total['duckdb']:8.3f} s")
+
+
+def drop_aggregates(sqlite_path, duckdb_path):
+    """
+    sans agrégats : les requêtes repassent sur la jointure fact x dimensions
+    """
+    with closing(sqlite3.connect(sqlite_path)) as conn:
+        for table in (warehouse.AGG_DAILY, warehouse.AGG_MONTHLY):
+            conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.commit()
+    duckdb_store.export_from_sqlite(sqlite_path, duckdb_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="requêtes du dashboard : sqlite vs duckdb")
+    parser.add_argument("--scales", type=float, nargs="+", default=DEFAULT_SCALES, help="facteurs d'échelle")
+    parser.add_argument("--repeat", type=int, default=2, help="passes par requête (meilleur temps gardé)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales:
+            scale = int(scale) if float(scale).is_integer() else scale
+            print(f"\néchelle x{scale}")
+            sqlite_path, duckdb_path = build_dw(scale, tmp)
+
+            print("avec agrégats (agg_orders_daily / agg_orders_monthly) :")
+            compare_engines(sqlite_path, duckdb_path, args.repeat)
+
+            drop_aggregates(sqlite_path, duckdb_path)
+            print("sans agrégats (jointure fact_orders x dimensions) :")
+            compare_engines(sqlite_path, duckdb_path, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+import dashboard_queries as queries
+import etl
+import warehouse
+from bench_dashboard_query import DASHBOARD_JOIN
+from synthetic import make_sources
+
+
+# =========================
+# MEMOIRE DU FRAME DU DASHBOARD : objets python vs représentation compacte
+# =========================
+def load_legacy(conn):
+    """
+    frame tel que le chargeait l'ancien dashboard (chaînes object, int64, Timestamp)
+    """
+    df = pd.read_sql(DASHBOARD_JOIN, conn)
+    df["order_date"] = pd.to_datetime(df["order_date"], errors="coerce")
+    df = df.dropna(subset=["order_date"]).copy()
+    df["employee_name"] = df["employee_name"].fillna("").str.strip()
+    df["region"] = df["region"].fillna("(sans région)").astype(str)
+    for col in ("nb_commandes_livrees", "nb_commandes_non_livrees"):
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(int)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="mémoire par ligne du frame du dashboard (avant / après)")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="nombre de commandes synthétiques")
+    args = parser.parse_args()
+
+    access_data, sql_data = make_sources(args.rows)
+    dim_emp = etl.build_dim_employee(access_data, sql_data)
+    dim_cust = etl.build_dim_customer(access_data, sql_data)
+    dim_date = etl.build_dim_date()
+    fact = etl.build_fact_orders(access_data, sql_data, dim_emp, dim_cust, dim_date)
+
+    tables = {"dim_date": dim_date, "fact_orders": fact}
+    for name, df, key_col, tracked in (
+        ("dim_employee", dim_emp, "employee_key", etl.EMPLOYEE_TRACKED),
+        ("dim_customer", dim_cust, "customer_key", etl.CUSTOMER_TRACKED),
+    ):
+        natural = ["source_system", key_col.replace("_key", "_id_source")]
+        tables[name], _ = etl.scd2_merge(df, pd.DataFrame(), key_col, natural, tracked, "2000-01-01")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(Path(tmp) / "dw.sqlite")
+        warehouse.load_star_schema(conn, tables)
+
+        legacy = load_legacy(conn)
+        min_key, max_key = queries.date_bounds(conn)
+        compact = queries.load_rows(conn, {"date_from": min_key, "date_to": max_key, "employee_keys": None})
+        conn.close()
+
+    print(f"fact_orders : {len(fact):,} lignes")
+    for label, df in (("avant (object / int64 / Timestamp)", legacy), ("après (category / int32 / date_key)", compact)):
+        total = df.memory_usage(deep=True).sum()
+        print(f"  {label:<40} {queries.memory_per_row(df):7.1f} octets/ligne | {total / 1024 ** 2:8.1f} Mo")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import argparse
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+import etl
+import warehouse
+from synthetic import make_sources
+
+
+# =========================
+# REQUETES DU DASHBOARD : to_sql brut vs schéma typé + index
+# =========================
+# jointure complète (ancien chargement du dashboard, avant les filtres SQL)
+DASHBOARD_JOIN = """
+    SELECT
+        d.date AS order_date,
+        e.employee_key,
+        c.customer_key,
+        TRIM(COALESCE(e.FirstName, '') || ' ' || COALESCE(e.LastName, '')) AS employee_name,
+        COALESCE(c.CompanyName, '(sans nom)') AS customer_name,
+        COALESCE(e.RegionDescription, '(sans région)') AS region,
+        f.nb_commandes_livrees,
+        f.nb_commandes_non_livrees
+    FROM fact_orders f
+    LEFT JOIN dim_employee e ON f.employee_key = e.employee_key
+    LEFT JOIN dim_customer c ON f.customer_key = c.customer_key
+    LEFT JOIN dim_date d      ON f.order_date_key = d.date_key
+"""
+
+# un mois, quelques employés : le cas courant des filtres du dashboard
+DASHBOARD_FILTERED = DASHBOARD_JOIN + """
+    WHERE f.order_date_key BETWEEN 20000101 AND 20000131
+      AND f.employee_key IN (1, 2, 3)
+"""
+
+
+def load_plain(conn, tables):
+    for name, df in tables.items():
+        df.to_sql(name, conn, if_exists="replace", index=False)
+
+
+def timed(fn, repeat=1):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return out, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark des requêtes du dashboard sur le DW sqlite")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="nombre de commandes synthétiques")
+    parser.add_argument("--repeat", type=int, default=3, help="répétitions par requête (meilleur temps)")
+    args = parser.parse_args()
+
+    access_data, sql_data = make_sources(args.rows)
+    dim_emp = etl.build_dim_employee(access_data, sql_data)
+    dim_cust = etl.build_dim_customer(access_data, sql_data)
+    dim_date = etl.build_dim_date()
+    fact = etl.build_fact_orders(access_data, sql_data, dim_emp, dim_cust, dim_date)
+    tables = {"dim_employee": dim_emp, "dim_customer": dim_cust, "dim_date": dim_date, "fact_orders": fact}
+
+    # le DDL porte les colonnes SCD : dimensions complétées comme dans l'etl
+    scd_tables = dict(tables)
+    for name, key_col, tracked in (
+        ("dim_employee", "employee_key", etl.EMPLOYEE_TRACKED),
+        ("dim_customer", "customer_key", etl.CUSTOMER_TRACKED),
+    ):
+        natural = ["source_system", key_col.replace("_key", "_id_source")]
+        scd_tables[name], _ = etl.scd2_merge(tables[name], pd.DataFrame(), key_col, natural, tracked, "2000-01-01")
+
+    print(f"fact_orders : {len(fact):,} lignes")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, loader, data in (
+            ("avant (to_sql)", load_plain, tables),
+            ("après (DDL + index)", warehouse.load_star_schema, scd_tables),
+        ):
+            conn = sqlite3.connect(Path(tmp) / f"{label.split()[0]}.sqlite")
+            _, t_load = timed(lambda: loader(conn, data))
+            full, t_full = timed(lambda: pd.read_sql(DASHBOARD_JOIN, conn), args.repeat)
+            part, t_part = timed(lambda: pd.read_sql(DASHBOARD_FILTERED, conn), args.repeat)
+            conn.close()
+
+            print(
+                f"  {label:<22} chargement {t_load:7.2f} s | jointure complète {t_full:7.2f} s "
+                f"({len(full):,} l.) | filtrée mois + 3 employés {t_part:7.3f} s ({len(part):,} l.)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import argparse
+import time
+
+import pandas as pd
+
+import etl
+from synthetic import make_sources
+
+
+# =========================
+# ANCIENNE VERSION (ligne par ligne) pour comparaison
+# =========================
+def legacy_resolve_keys(orders, dim_emp, dim_cust, dim_date):
+    dim_date_index = dim_date.set_index("date")
+
+    def date_to_key(d):
+        if pd.isna(d):
+            return None
+        d2 = pd.to_datetime(d).normalize()
+        try:
+            return int(dim_date_index.loc[d2, "date_key"])
+        except KeyError:
+            return None
+
+    orders["order_date_key"] = orders["OrderDate"].apply(date_to_key)
+    orders["ship_date_key"] = orders["ShippedDate"].apply(date_to_key)
+
+    emp_map = dim_emp.set_index(["source_system", "employee_id_source"])["employee_key"]
+
+    def map_emp(row):
+        return emp_map.get((row["source_system"], row["EmployeeID"]), None)
+
+    orders["employee_key"] = orders.apply(map_emp, axis=1)
+
+    cust_map = dim_cust.set_index(["source_system", "customer_id_source"])["customer_key"]
+
+    def map_cust(row):
+        return cust_map.get((row["source_system"], row["CustomerID"]), None)
+
+    orders["customer_key"] = orders.apply(map_cust, axis=1)
+    return orders
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def bench(n_rows, legacy_max):
+    access_data, sql_data = make_sources(n_rows)
+    dim_emp = etl.build_dim_employee(access_data, sql_data)
+    dim_cust = etl.build_dim_customer(access_data, sql_data)
+    dim_date = etl.build_dim_date()
+    orders = etl.stack_orders(access_data, sql_data)
+
+    results = []
+
+    if n_rows <= legacy_max:
+        old, t_old = timed(legacy_resolve_keys, orders.copy(), dim_emp, dim_cust, dim_date)
+        results.append(("avant (apply)", t_old))
+    else:
+        old = None
+
+    new, t_new = timed(etl.resolve_keys, orders.copy(), dim_emp, dim_cust, dim_date)
+    results.append(("après (vectorisé)", t_new))
+
+    # les deux versions doivent donner les mêmes clés
+    if old is not None:
+        key_cols = ["order_date_key", "ship_date_key", "employee_key", "customer_key"]
+        for col in key_cols:
+            a = pd.to_numeric(old[col]).astype("Int64")
+            if not a.equals(new[col]):
+                raise AssertionError(f"clés différentes sur {col}")
+
+    for label, seconds in results:
+        print(f"  {n_rows:>10,} lignes | {label:<18} | {seconds:8.2f} s | {n_rows / seconds:12,.0f} lignes/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="benchmark résolution des clés de fact_orders")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument(
+        "--legacy-max",
+        type=int,
+        default=1_000_000,
+        help="taille max pour l'ancienne version (trop lente au-delà)",
+    )
+    args = parser.parse_args()
+
+    print("résolution des clés fact_orders (synthétique)")
+    for n in args.sizes:
+        bench(n, args.legacy_max)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+import columnar
+import etl
+from synthetic import make_sources
+
+
+# =========================
+# CSV vs PARQUET : taille et temps de chargement
+# =========================
+def dir_size(path):
+    path = Path(path)
+    if path.is_file():
+        return path.stat().st_size
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+
+def row(label, size, write_s, read_s):
+    size_txt = f"{size / 1024:10,.0f} Ko" if size is not None else " " * 13
+    write_txt = f"{write_s:7.2f} s" if write_s is not None else " " * 9
+    print(f"  {label:<42} {size_txt} | écriture {write_txt} | lecture {read_s:7.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="comparaison csv / parquet (taille, temps de chargement)")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="nombre de commandes synthétiques")
+    args = parser.parse_args()
+
+    access_data, sql_data = make_sources(args.rows)
+    dim_emp = etl.build_dim_employee(access_data, sql_data)
+    dim_cust = etl.build_dim_customer(access_data, sql_data)
+    dim_date = etl.build_dim_date()
+    fact = etl.build_fact_orders(access_data, sql_data, dim_emp, dim_cust, dim_date)
+
+    out = Path(tempfile.mkdtemp(prefix="bench_formats_"))
+    try:
+        print(f"dim_date ({len(dim_date):,} lignes)")
+        csv_file = out / "dim_date.csv"
+        _, w = timed(lambda: dim_date.to_csv(csv_file, index=False))
+        _, r = timed(lambda: pd.read_csv(csv_file, parse_dates=["date"]))
+        row("csv", dir_size(csv_file), w, r)
+
+        pq_file = out / "dim_date.parquet"
+        _, w = timed(lambda: columnar.write_parquet(dim_date, pq_file))
+        _, r = timed(lambda: columnar.read_parquet(pq_file))
+        row("parquet", dir_size(pq_file), w, r)
+
+        print(f"\nfact_orders ({len(fact):,} lignes)")
+        csv_file = out / "fact_orders.csv"
+        _, w = timed(lambda: fact.to_csv(csv_file, index=False))
+        _, r = timed(lambda: pd.read_csv(csv_file))
+        row("csv (tout)", dir_size(csv_file), w, r)
+
+        needed = ["order_date_key", "employee_key", "nb_commandes_livrees"]
+        _, r = timed(lambda: pd.read_csv(csv_file, usecols=needed))
+        row("csv (3 colonnes)", None, None, r)
+
+        pq_dir = out / "fact_orders"
+        _, w = timed(lambda: columnar.write_fact_partitioned(fact, pq_dir))
+        _, r = timed(lambda: columnar.read_fact(pq_dir))
+        row("parquet partitionné (tout)", dir_size(pq_dir), w, r)
+
+        _, r = timed(lambda: columnar.read_fact(pq_dir, columns=needed))
+        row("parquet (3 colonnes)", None, None, r)
+
+        year = int(fact["order_date_key"].dropna().max()) // 10000
+        one_year, r = timed(
+            lambda: columnar.read_fact(pq_dir, columns=needed, date_from=year * 10000 + 101, date_to=year * 10000 + 1231)
+        )
+        row(f"parquet (3 colonnes, {year} seulement, {len(one_year):,} l.)", None, None, r)
+    finally:
+        shutil.rmtree(out, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import argparse
+import json
+import platform
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+import dashboard_queries as queries
+import etl
+import quality
+import warehouse
+from pipeline import Pipeline
+from synthetic import make_scaled_sources
+
+
+# =========================
+# SUITE DE BENCHMARKS (données synthétiques, résultats json)
+# =========================
+# facteurs d'échelle par rapport aux volumes northwind actuels (878 commandes)
+DEFAULT_SCALES = [1, 100, 10_000]
+REPORT_DIR = Path("data") / "reports"
+# écart toléré avant de signaler une régression (--compare) ; les étapes plus
+# courtes que MIN_SECONDS sont trop bruitées pour être comparées
+DEFAULT_THRESHOLD = 0.20
+MIN_SECONDS = 0.05
+
+
+def git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def scd_dims(dim_emp, dim_cust):
+    """
+    dimensions complétées des colonnes SCD comme dans l'etl (DDL du DW)
+    """
+    out = {}
+    for name, df, key_col, tracked in (
+        ("dim_employee", dim_emp, "employee_key", etl.EMPLOYEE_TRACKED),
+        ("dim_customer", dim_cust, "customer_key", etl.CUSTOMER_TRACKED),
+    ):
+        natural = ["source_system", key_col.replace("_key", "_id_source")]
+        out[name], _ = etl.scd2_merge(df, pd.DataFrame(), key_col, natural, tracked, "2000-01-01")
+    return out
+
+
+def run_scale(scale, tmp_dir):
+    """
+    une passe complète à un facteur d'échelle ; renvoie le rapport du Pipeline
+    """
+    access_data, sql_data = make_scaled_sources(scale)
+    orders_in = [access_data["orders"], sql_data["orders"]]
+    run = Pipeline(f"bench_x{scale}")
+
+    with run.step("build_dim_employee", rows_in=[access_data["employees"], sql_data["employees"]]) as step:
+        dim_emp = etl.build_dim_employee(access_data, sql_data)
+        step.set_rows(rows_out=dim_emp)
+
+    with run.step("build_dim_customer", rows_in=[access_data["customers"], sql_data["customers"]]) as step:
+        dim_cust = etl.build_dim_customer(access_data, sql_data)
+        step.set_rows(rows_out=dim_cust)
+
+    with run.step("build_dim_date") as step:
+        dim_date = etl.build_dim_date()
+        step.set_rows(rows_out=dim_date)
+
+    with run.step("build_fact_orders", rows_in=orders_in) as step:
+        orders = etl.build_order_lines(access_data, sql_data, dim_emp, dim_cust, dim_date)
+        step.set_rows(rows_out=orders)
+
+    with run.step("validate_orders", rows_in=orders) as step:
+        valid, _, _ = quality.validate_orders(orders)
+        fact = etl.fact_from_orders(valid)
+        step.set_rows(rows_out=fact)
+
+    tables = dict(scd_dims(dim_emp, dim_cust), dim_date=dim_date, fact_orders=fact)
+    db_path = Path(tmp_dir) / f"bench_x{scale}.sqlite"
+    conn = sqlite3.connect(db_path)
+    with run.step("sqlite_load", rows_in=tables) as step:
+        warehouse.load_star_schema(conn, tables)
+        step.set_rows(rows_out=tables)
+
+    # requête du graphe 3d du dashboard sur toute la période (regroupement fait par sqlite)
+    min_key, max_key = queries.date_bounds(conn)
+    filters = {"date_from": min_key, "date_to": max_key, "employee_keys": None}
+    with run.step("dashboard_load_summary") as step:
+        summary = queries.load_summary(conn, filters)
+        step.set_rows(rows_out=summary)
+    conn.close()
+
+    return run.report()
+
+
+def best_of(reports):
+    """
+    plusieurs passes d'une même échelle -> meilleur temps par étape
+    """
+    best = {}
+    for report in reports:
+        for step in report["steps"]:
+            kept = best.get(step["step"])
+            if kept is None or step["wall_s"] < kept["wall_s"]:
+                best[step["step"]] = step
+    return list(best.values())
+
+
+def compare(results, baseline, threshold):
+    """
+    affiche le rapport temps / référence par (échelle, étape) ; renvoie les régressions
+    """
+    before = {(r["scale"], r["step"]): r["wall_s"] for r in baseline["results"]}
+    regressions = []
+    print(f"\ncomparaison avec {baseline.get('commit') or '?'} ({baseline.get('created_at')}) :")
+    for r in results:
+        ref = before.get((r["scale"], r["step"]))
+        if not ref:
+            continue
+        ratio = r["wall_s"] / ref
+        flag = " <- régression" if ratio > 1 + threshold and ref >= MIN_SECONDS else ""
+        print(f"  x{r['scale']:<7} {r['step']:<22} {ref:8.3f} s -> {r['wall_s']:8.3f} s ({ratio:5.2f}x){flag}")
+        if flag:
+            regressions.append(r)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="suite de benchmarks etl / dw / dashboard sur données synthétiques")
+    parser.add_argument("--scales", type=float, nargs="+", default=DEFAULT_SCALES, help="facteurs d'échelle")
+    parser.add_argument("--repeat", type=int, default=1, help="passes par échelle (meilleur temps gardé)")
+    parser.add_argument("--output", type=Path, default=None, help="fichier json des résultats")
+    parser.add_argument("--compare", type=Path, default=None, help="json de référence (commit précédent)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="ralentissement toléré (0.2 = +20 %%)")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales:
+            scale = int(scale) if float(scale).is_integer() else scale
+            print(f"\néchelle x{scale}")
+            reports = [run_scale(scale, tmp) for _ in range(args.repeat)]
+            for step in best_of(reports):
+                rows = step["rows_out"] or step["rows_in"]
+                results.append(
+                    dict(
+                        scale=scale,
+                        step=step["step"],
+                        wall_s=step["wall_s"],
+                        cpu_s=step["cpu_s"],
+                        peak_rss_mb=step["peak_rss_mb"],
+                        rows_in=step["rows_in"],
+                        rows_out=step["rows_out"],
+                        rows_per_s=round(rows / step["wall_s"]) if rows and step["wall_s"] else None,
+                    )
+                )
+
+    commit = git_commit()
+    created_at = datetime.now().isoformat(timespec="seconds")
+    suite = {
+        "commit": commit,
+        "created_at": created_at,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+    output = args.output or REPORT_DIR / f"bench_suite_{commit or datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(suite, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nrésultats -> {output.resolve()}")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
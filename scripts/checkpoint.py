@@ -0,0 +1,129 @@
+import hashlib
+import json
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+
+# =========================
+# CHECKPOINTS ENTRE ETAPES (reprise avec --resume)
+# =========================
+# une étape = sorties (DataFrames, éventuellement dans des dict) + hash de ses entrées.
+# les DataFrames sont écrits en pickle : lecture / écriture rapides et types conservés
+# tels quels (colonnes d'ids mélangés int / texte comprises).
+MANIFEST = "manifest.json"
+
+
+def content_hash(*values):
+    """
+    empreinte sha1 du contenu : DataFrames (valeurs, colonnes, types), dict, listes, scalaires
+    """
+    h = hashlib.sha1()
+
+    def feed(value):
+        if isinstance(value, pd.DataFrame):
+            h.update(repr(list(value.columns)).encode())
+            h.update(repr([str(t) for t in value.dtypes]).encode())
+            if len(value):
+                h.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+        elif isinstance(value, dict):
+            for key in sorted(value):
+                h.update(repr(key).encode())
+                feed(value[key])
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                feed(item)
+        else:
+            h.update(repr(value).encode())
+
+    for value in values:
+        feed(value)
+    return h.hexdigest()
+
+
+class Checkpoints:
+    """
+    out = checkpoints.run("transform_dims", input_hash, compute)
+    resume=False : compute() est toujours exécuté, ses sorties sont enregistrées.
+    resume=True  : si l'étape a déjà été enregistrée avec le même input_hash,
+                   ses sorties sont relues au lieu d'être recalculées.
+    """
+
+    def __init__(self, root, resume=False):
+        self.root = Path(root)
+        self.resume = resume
+        self.manifest = {}
+        manifest_file = self.root / MANIFEST
+        if manifest_file.exists():
+            self.manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+
+    def run(self, stage, input_hash, compute):
+        entry = self.manifest.get(stage)
+        if self.resume and entry is not None and entry["input_hash"] == input_hash:
+            try:
+                outputs = self.load(stage, entry)
+                print(f"  reprise : {stage} relu depuis le checkpoint du {entry['saved_at']}")
+                return outputs
+            except FileNotFoundError:
+                pass
+
+        outputs = compute()
+        self.save(stage, input_hash, outputs)
+        return outputs
+
+    def save(self, stage, input_hash, outputs):
+        stage_dir = self.root / stage
+        tmp_dir = self.root / f"{stage}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+
+        def write(value, path):
+            if isinstance(value, pd.DataFrame):
+                value.to_pickle(tmp_dir / f"{path}.pkl")
+                return {"frame": path}
+            if isinstance(value, dict):
+                return {"dict": {key: write(v, f"{path}.{key}" if path else key) for key, v in value.items()}}
+            return {"value": value}
+
+        layout = write(outputs, "")
+
+        # remplacement du dossier de l'étape seulement une fois tout écrit
+        shutil.rmtree(stage_dir, ignore_errors=True)
+        tmp_dir.rename(stage_dir)
+        self.manifest[stage] = {
+            "input_hash": input_hash,
+            "output_hash": content_hash(outputs),
+            "layout": layout,
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        self.write_manifest()
+
+    def load(self, stage, entry):
+        stage_dir = self.root / stage
+
+        def read(node):
+            if "frame" in node:
+                return pd.read_pickle(stage_dir / f"{node['frame']}.pkl")
+            if "dict" in node:
+                return {key: read(child) for key, child in node["dict"].items()}
+            return node["value"]
+
+        return read(entry["layout"])
+
+    def output_hash(self, stage):
+        return self.manifest[stage]["output_hash"]
+
+    def write_manifest(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f"{MANIFEST}.tmp"
+        tmp.write_text(json.dumps(self.manifest, indent=2), encoding="utf-8")
+        tmp.replace(self.root / MANIFEST)
+
+    def clear(self):
+        """
+        run terminé : les checkpoints ne servent plus
+        """
+        shutil.rmtree(self.root, ignore_errors=True)
+        self.manifest = {}
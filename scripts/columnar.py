@@ -0,0 +1,183 @@
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # format parquet optionnel
+    pa = None
+    ds = None
+    pq = None
+
+
+# =========================
+# FORMAT COLONNAIRE (PARQUET)
+# =========================
+# colonnes de partition de la table de faits (dérivées de order_date_key yyyymmdd)
+FACT_PARTITIONS = ["order_year", "order_month"]
+
+
+def require_pyarrow():
+    if pa is None:
+        raise ImportError("pyarrow est nécessaire pour le format parquet (pip install pyarrow)")
+
+
+def arrow_safe(df):
+    """
+    colonnes object à types mélangés (ex. ids access int + sql server texte) -> texte
+    """
+    mixed = [
+        col
+        for col in df.columns
+        if df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True).startswith("mixed")
+    ]
+    if not mixed:
+        return df
+    return df.astype({col: "string" for col in mixed})
+
+
+def chunk_table(chunk, schema=None):
+    """
+    bloc pandas -> table arrow au schéma des blocs précédents (schema=None : premier bloc).
+    une colonne entièrement vide du premier bloc (type null) est déclarée en texte ; les
+    colonnes des blocs suivants sont converties au schéma (vide -> n'importe quel type,
+    nombres / dates -> texte) au lieu d'échouer sur un cast vers null.
+    """
+    table = pa.Table.from_pandas(arrow_safe(chunk), preserve_index=False)
+    if schema is None:
+        schema = pa.schema(
+            [field.with_type(pa.large_string()) if pa.types.is_null(field.type) else field for field in table.schema],
+            metadata=table.schema.metadata,
+        )
+    return pa.Table.from_arrays([table.column(field.name).cast(field.type) for field in schema], schema=schema)
+
+
+def write_parquet_atomic(chunks, output_file):
+    """
+    écrit des chunks DataFrame dans un seul fichier parquet (un row group par chunk),
+    via un fichier temporaire renommé à la fin.
+    """
+    require_pyarrow()
+    output_file = Path(output_file)
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+
+    writer = None
+    rows = 0
+    try:
+        for chunk in chunks:
+            table = chunk_table(chunk, None if writer is None else writer.schema)
+            if writer is None:
+                writer = pq.ParquetWriter(tmp_file, table.schema)
+            writer.write_table(table)
+            rows += len(chunk)
+        if writer is None:
+            raise ValueError(f"aucune donnée à écrire dans {output_file.name}")
+        writer.close()
+        writer = None
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        tmp_file.unlink(missing_ok=True)
+        raise
+    return rows
+
+
+def write_parquet(df, output_file):
+    return write_parquet_atomic([df], output_file)
+
+
+def add_fact_partitions(fact):
+    """
+    order_year / order_month calculés depuis order_date_key (yyyymmdd)
+    """
+    keys = pd.to_numeric(fact["order_date_key"], errors="coerce").astype("Int64")
+    fact = fact.copy()
+    fact["order_year"] = keys // 10000
+    fact["order_month"] = keys // 100 % 100
+    return fact
+
+
+def write_fact_partitioned(fact, root):
+    """
+    fact_orders en dataset parquet partitionné order_year=YYYY/order_month=M.
+    écrit dans un dossier temporaire puis remplace l'ancien dataset.
+    """
+    return write_fact_partitioned_chunks([fact], root)
+
+
+def write_fact_partitioned_chunks(chunks, root):
+    """
+    write_fact_partitioned pour des blocs de fact_orders (un jeu de fichiers par bloc,
+    schéma du premier bloc, voir chunk_table) : un seul bloc en mémoire à la fois
+    """
+    require_pyarrow()
+    root = Path(root)
+    tmp_root = root.with_name(root.name + ".tmp")
+    old_root = root.with_name(root.name + ".old")
+    shutil.rmtree(tmp_root, ignore_errors=True)
+    shutil.rmtree(old_root, ignore_errors=True)
+    tmp_root.mkdir(parents=True)
+
+    schema = None
+    rows = 0
+    for n, chunk in enumerate(chunks):
+        table = chunk_table(add_fact_partitions(chunk), schema)
+        schema = table.schema
+        pq.write_to_dataset(
+            table, tmp_root, partition_cols=FACT_PARTITIONS, basename_template=f"part-{n}-{{i}}.parquet"
+        )
+        rows += len(chunk)
+
+    if root.exists():
+        root.rename(old_root)
+    tmp_root.rename(root)
+    shutil.rmtree(old_root, ignore_errors=True)
+    return rows
+
+
+# =========================
+# LECTURE (bench_formats.py)
+# =========================
+# aucune étape de l'etl ni le dashboard ne relisent la couche parquet (le dashboard lit le
+# DW sqlite ou sa copie duckdb) : ces lectures servent à bench_formats.py, qui mesure
+# l'effet de l'élagage des colonnes et des partitions.
+def read_parquet(path, columns=None):
+    """
+    lecture d'un fichier parquet, seulement les colonnes demandées
+    """
+    require_pyarrow()
+    return pd.read_parquet(path, columns=columns)
+
+
+def read_fact(root, columns=None, date_from=None, date_to=None):
+    """
+    lecture de fact_orders partitionnée : seules les colonnes et les
+    partitions (année / mois) couvrant [date_from, date_to] sont lues.
+    date_from / date_to : date_key yyyymmdd ou None.
+    """
+    require_pyarrow()
+    partitioning = ds.partitioning(
+        pa.schema([(col, pa.int32()) for col in FACT_PARTITIONS]), flavor="hive"
+    )
+    dataset = ds.dataset(root, format="parquet", partitioning=partitioning)
+
+    # filtre sur les colonnes de partition -> les dossiers hors période ne sont pas ouverts
+    condition = None
+    if date_from is not None:
+        date_from = int(date_from)
+        cond = (ds.field("order_year") >= date_from // 10000) & (ds.field("order_date_key") >= date_from)
+        condition = cond
+    if date_to is not None:
+        date_to = int(date_to)
+        cond = (ds.field("order_year") <= date_to // 10000) & (ds.field("order_date_key") <= date_to)
+        condition = cond if condition is None else condition & cond
+
+    if columns is None:
+        columns = [name for name in dataset.schema.names if name not in FACT_PARTITIONS]
+
+    return dataset.to_table(columns=list(columns), filter=condition).to_pandas()
@@ -0,0 +1,334 @@
+import os
+import sqlite3
+import threading
+import time
+
+try:
+    import pyodbc
+except ImportError:  # pas de pilote odbc : seules les connexions de substitution (sqlite) marchent
+    pyodbc = None
+
+
+# =========================
+# CONNEXIONS AUX BASES SOURCES (pool, reprises, lecture par lots, mesures)
+# =========================
+# un Pool par base : une connexion rendue (close()) reste ouverte et est resservie au
+# prochain connect() au lieu d'être rouverte (ouvrir une connexion odbc access / sql server
+# coûte plus cher que la plupart des requêtes de l'etl). une connexion du pool s'utilise
+# et se ferme comme une connexion DB-API normale : le code appelant ne change pas.
+DEFAULT_POOL_SIZE = 4  # connexions inactives gardées par pool
+DEFAULT_ARRAYSIZE = 10_000  # lignes par fetchmany() sans argument (pyodbc : 1 par défaut)
+RETRIES = 3  # nouvelles tentatives après une erreur passagère
+BACKOFF_S = 0.5  # attente avant la première reprise, doublée à chaque essai
+MAX_BACKOFF_S = 8.0
+PING_AFTER_S = 30.0  # connexion inactive depuis plus longtemps : vérifiée avant d'être resservie
+
+_pools = []
+
+
+def require_pyodbc():
+    if pyodbc is None:
+        raise ImportError("pyodbc est nécessaire pour se connecter à access / sql server (pip install pyodbc)")
+
+
+def sqlserver_factory(server, database):
+    conn_str = (
+        r"DRIVER={ODBC Driver 17 for SQL Server};"
+        rf"SERVER={server};"
+        rf"DATABASE={database};"
+        r"Trusted_Connection=yes;"
+    )
+
+    def connect():
+        require_pyodbc()
+        return pyodbc.connect(conn_str)
+
+    return connect
+
+
+def access_factory(db_path):
+    conn_str = (
+        r"DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};"
+        rf"DBQ={db_path};"
+    )
+
+    def connect():
+        require_pyodbc()
+        return pyodbc.connect(conn_str)
+
+    return connect
+
+
+def sqlite_standin(db_path):
+    """
+    connexion de substitution pour tester sans odbc : base sqlite locale avec les mêmes
+    tables. utilisable depuis plusieurs threads (le pool la resert au thread suivant).
+    """
+    return lambda: sqlite3.connect(db_path, check_same_thread=False)
+
+
+def is_transient(exc):
+    """
+    erreur qui peut disparaître en réessayant : connexion refusée ou coupée, base verrouillée
+    """
+    if pyodbc is not None and isinstance(exc, (pyodbc.OperationalError, pyodbc.InterfaceError)):
+        return True
+    if isinstance(exc, sqlite3.OperationalError):
+        message = str(exc)
+        return "locked" in message or "busy" in message
+    # pd.read_sql sur sqlite3 : erreur d'origine enveloppée dans un DatabaseError pandas
+    if exc.__cause__ is not None:
+        return is_transient(exc.__cause__)
+    return False
+
+
+def with_retry(fn, retries=RETRIES, backoff=BACKOFF_S, label=""):
+    """
+    fn() ; après une erreur passagère, nouvel essai au bout de backoff, 2 x backoff...
+    (plafonné à MAX_BACKOFF_S). les autres erreurs remontent tout de suite.
+    """
+    delay = backoff
+    for attempt in range(retries + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == retries or not is_transient(e):
+                raise
+            print(f"  {label} : erreur passagère ({e}), nouvel essai dans {delay:.1f} s ({attempt + 1}/{retries})")
+            time.sleep(delay)
+            delay = min(delay * 2, MAX_BACKOFF_S)
+
+
+class Pool:
+    """
+    pool = Pool("sqlserver", sqlserver_factory(server, database))
+    cnx = pool.connect()   # connexion inactive du pool, sinon nouvelle connexion (avec reprises)
+    ...
+    cnx.close()            # rendue au pool (rollback), pas fermée
+    thread-safe : une connexion n'est prêtée qu'à un appelant à la fois.
+    hooks : fonctions hook(pool, phase, sql, secondes, lignes) appelées après chaque
+    execute / executemany / fetch (ex. QueryLog).
+    """
+
+    def __init__(
+        self,
+        name,
+        factory,
+        size=DEFAULT_POOL_SIZE,
+        arraysize=DEFAULT_ARRAYSIZE,
+        retries=RETRIES,
+        backoff=BACKOFF_S,
+    ):
+        self.name = name
+        self.factory = factory
+        self.size = size
+        self.arraysize = arraysize
+        self.retries = retries
+        self.backoff = backoff
+        self.hooks = []
+        self.opened = 0
+        self.reused = 0
+        self._idle = []  # [(connexion, rendue à)]
+        self._lock = threading.Lock()
+        _pools.append(self)
+
+    def use(self, factory):
+        """
+        autre source de connexions (ex. sqlite_standin pour tester) ; les connexions
+        inactives de l'ancienne sont fermées
+        """
+        self.close_all()
+        self.factory = factory
+
+    def connect(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                raw, released_at = self._idle.pop()
+            if time.monotonic() - released_at < PING_AFTER_S or self._alive(raw):
+                with self._lock:
+                    self.reused += 1
+                return PooledConnection(self, raw)
+            self._discard(raw)
+
+        raw = with_retry(self.factory, self.retries, self.backoff, label=f"connexion {self.name}")
+        with self._lock:
+            self.opened += 1
+        return PooledConnection(self, raw)
+
+    def release(self, raw):
+        try:
+            # transaction ouverte par une lecture (pyodbc : autocommit désactivé) terminée
+            raw.rollback()
+        except Exception:
+            self._discard(raw)
+            return
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append((raw, time.monotonic()))
+                return
+        self._discard(raw)
+
+    def notify(self, phase, sql, seconds, rows=None):
+        for hook in self.hooks:
+            hook(self.name, phase, sql, seconds, rows)
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for raw, _ in idle:
+            self._discard(raw)
+
+    @staticmethod
+    def _alive(raw):
+        try:
+            cursor = raw.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _discard(raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+
+class PooledConnection:
+    """
+    connexion DB-API prêtée par un Pool : close() la rend au pool. curseurs avec
+    l'arraysize du pool, requêtes mesurées (Pool.hooks). le reste (commit, rollback...)
+    passe directement à la connexion.
+    """
+
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+
+    def cursor(self):
+        cursor = self._raw.cursor()
+        cursor.arraysize = self._pool.arraysize
+        return TimedCursor(self._pool, cursor)
+
+    def close(self):
+        if self._raw is not None:
+            raw, self._raw = self._raw, None
+            self._pool.release(raw)
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+
+class TimedCursor:
+    """
+    curseur DB-API dont execute / executemany / fetch* sont mesurés
+    """
+
+    def __init__(self, pool, cursor):
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_sql", None)
+
+    def execute(self, sql, *params):
+        t0 = time.perf_counter()
+        self._cursor.execute(sql, *params)
+        object.__setattr__(self, "_sql", sql)
+        self._pool.notify("execute", sql, time.perf_counter() - t0)
+        return self
+
+    def executemany(self, sql, rows):
+        t0 = time.perf_counter()
+        self._cursor.executemany(sql, rows)
+        object.__setattr__(self, "_sql", sql)
+        n_rows = len(rows) if hasattr(rows, "__len__") else None
+        self._pool.notify("executemany", sql, time.perf_counter() - t0, n_rows)
+        return self
+
+    def fetchone(self):
+        t0 = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._pool.notify("fetch", self._sql, time.perf_counter() - t0, 0 if row is None else 1)
+        return row
+
+    def fetchmany(self, size=None):
+        t0 = time.perf_counter()
+        rows = self._cursor.fetchmany(self._cursor.arraysize if size is None else size)
+        self._pool.notify("fetch", self._sql, time.perf_counter() - t0, len(rows))
+        return rows
+
+    def fetchall(self):
+        t0 = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._pool.notify("fetch", self._sql, time.perf_counter() - t0, len(rows))
+        return rows
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name, value):
+        # ex. cursor.fast_executemany = True (pyodbc)
+        setattr(self._cursor, name, value)
+
+
+class QueryLog:
+    """
+    hook de Pool : temps cumulé (exécution + lecture des lignes) et lignes par requête.
+    log = QueryLog(); add_hook(log) ... log.print_summary()
+    """
+
+    def __init__(self):
+        self.stats = {}  # (pool, requête) -> [exécutions, secondes, lignes]
+        self._lock = threading.Lock()
+
+    def __call__(self, pool, phase, sql, seconds, rows=None):
+        key = (pool, " ".join(str(sql).split()))
+        with self._lock:
+            stat = self.stats.setdefault(key, [0, 0.0, 0])
+            if phase != "fetch":
+                stat[0] += 1
+            stat[1] += seconds
+            stat[2] += rows or 0
+
+    def print_summary(self, top=10):
+        if not self.stats:
+            return
+        print("requêtes les plus longues :")
+        ranked = sorted(self.stats.items(), key=lambda item: item[1][1], reverse=True)
+        for (pool, sql), (n, seconds, rows) in ranked[:top]:
+            print(f"  {pool:<14} {seconds:7.2f} s {n:>5} exéc. {rows:>10} lignes  {sql[:80]}")
+        for pool in _pools:
+            if pool.opened or pool.reused:
+                print(f"  pool {pool.name} : {pool.opened} connexions ouvertes, {pool.reused} réutilisées")
+
+
+def add_hook(hook):
+    for pool in _pools:
+        pool.hooks.append(hook)
+
+
+def remove_hook(hook):
+    for pool in _pools:
+        if hook in pool.hooks:
+            pool.hooks.remove(hook)
+
+
+def close_all():
+    """
+    fin de script : ferme les connexions inactives de tous les pools
+    """
+    for pool in _pools:
+        pool.close_all()
+
+
+# un processus créé par fork (pool de processus de parallel_transform sous linux) ne doit
+# pas hériter des connexions ouvertes : le parent ferme ses connexions inactives avant
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=close_all)
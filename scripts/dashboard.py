@@ -1,91 +1,210 @@
+import os
 import sqlite3
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 import plotly.express as px
+import plotly.graph_objects as go
+
+import dashboard_queries as queries
+import duckdb_store
+from dashboard_cache import VersionedData
 
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 
 DB_PATH = PROJECT_ROOT / "data" / "final" / "northwind_dw.sqlite"
+DUCKDB_PATH = PROJECT_ROOT / "data" / "final" / "northwind_dw.duckdb"
+
+# moteur des requêtes : "sqlite" (DW de l'etl) ou "duckdb" (copie colonnaire du DW,
+# écrite par python scripts\etl.py --outputs files excel duckdb)
+BACKEND = os.environ.get("DASHBOARD_BACKEND", "sqlite")
+
+# graphe 3d : nombre de points max avant regroupement (niveau de détail)
+POINT_BUDGET = 20_000
+# niveaux de regroupement des dates, du plus fin au plus grossier
+LOD_LEVELS = [("semaine", "W"), ("mois", "M"), ("trimestre", "Q"), ("année", "Y")]
+
+# résultats de requêtes gardés en mémoire (toutes versions / sessions confondues)
+CACHE_ENTRIES = 64
+PAGE_SIZES = [50, 100, 500, 1000]
+DEFAULT_PAGE_SIZE = 100
 
 
 
 def get_connection():
+    if BACKEND == "duckdb":
+        return duckdb_store.connect(DUCKDB_PATH)
     return sqlite3.connect(str(DB_PATH))
 
 
-@st.cache_data
-def load_fact_joined():
-    query = """
-    SELECT
-        d.date AS order_date,
-        e.employee_key,
-        c.customer_key,
-        TRIM(COALESCE(e.FirstName, '') || ' ' || COALESCE(e.LastName, '')) AS employee_name,
-        COALESCE(c.CompanyName, '(sans nom)') AS customer_name,
-        COALESCE(e.RegionDescription, '(sans région)') AS region,
-        f.nb_commandes_livrees,
-        f.nb_commandes_non_livrees
-    FROM fact_orders f
-    LEFT JOIN dim_employee e ON f.employee_key = e.employee_key
-    LEFT JOIN dim_customer c ON f.customer_key = c.customer_key
-    LEFT JOIN dim_date d      ON f.order_date_key = d.date_key
+def default_filters(min_key, max_key) -> dict:
+    return {"date_from": int(min_key), "date_to": int(max_key), "employee_keys": None}
+
+
+def warm_default_view(fetch):
     """
-    with get_connection() as cnx:
-        df = pd.read_sql(query, cnx)
+    préchargement de la vue d'ouverture pour une nouvelle version du DW
+    """
+    min_key, max_key = fetch(queries.date_bounds)
+    if min_key is None:
+        return
+    filters = default_filters(min_key, max_key)
+    fetch(queries.employee_options, filters["date_from"], filters["date_to"])
+    fetch(queries.load_kpis, filters)
+    fetch(queries.count_detail, filters)
+    fetch(queries.load_detail_page, filters, 1, DEFAULT_PAGE_SIZE, "order_date", True)
+    fetch(queries.load_summary, filters)
+    fetch(queries.load_monthly, filters)
+
+
+# filtres appliqués en SQL (dashboard_queries) : seules les lignes de la sélection
+# sont lues, le tableau détail est paginé côté base.
+# résultats partagés par toutes les sessions (cache_resource, pas de copie picklée
+# par session) dans un LRU indexé par (version du DW, requête, filtres).
+# lecture seule : ne pas modifier les frames renvoyés.
+@st.cache_resource
+def get_data() -> VersionedData:
+    return VersionedData(get_connection, warmup=warm_default_view, max_entries=CACHE_ENTRIES)
+
+
+def load_date_bounds():
+    return get_data().get(queries.date_bounds)
+
+
+def load_employee_options(date_from: int, date_to: int) -> pd.DataFrame:
+    return get_data().get(queries.employee_options, date_from, date_to)
+
+
+def load_summary(filters: dict) -> pd.DataFrame:
+    return get_data().get(queries.load_summary, filters)
+
+
+def load_kpis(filters: dict):
+    return get_data().get(queries.load_kpis, filters)
+
+
+def count_detail(filters: dict) -> int:
+    return get_data().get(queries.count_detail, filters)
+
+
+def load_detail_page(filters: dict, page: int, page_size: int, sort_by: str, ascending: bool) -> pd.DataFrame:
+    return get_data().get(queries.load_detail_page, filters, page, page_size, sort_by, ascending)
+
 
-    # IMPORTANT : order_date doit être datetime
-    df["order_date"] = pd.to_datetime(df["order_date"], errors="coerce")
-    df = df.dropna(subset=["order_date"]).copy()
+def load_monthly(filters: dict) -> pd.DataFrame:
+    return get_data().get(queries.load_monthly, filters)
 
-    df["employee_name"] = df["employee_name"].fillna("").str.strip()
-    df.loc[df["employee_name"] == "", "employee_name"] = "(employé inconnu)"
 
-    df["region"] = df["region"].fillna("(sans région)").astype(str)
+def date_key(d) -> int:
+    return d.year * 10000 + d.month * 100 + d.day
 
-    # s'assure que les kpis sont numériques
-    df["nb_commandes_livrees"] = pd.to_numeric(df["nb_commandes_livrees"], errors="coerce").fillna(0).astype(int)
-    df["nb_commandes_non_livrees"] = pd.to_numeric(df["nb_commandes_non_livrees"], errors="coerce").fillna(0).astype(int)
 
-    return df
+def key_to_date(key: int):
+    return pd.to_datetime(str(int(key)), format="%Y%m%d").date()
 
 
-def compute_summary(df: pd.DataFrame) -> pd.DataFrame:
-    grouped = (
-        df.groupby(
-            ["order_date", "employee_key", "employee_name", "customer_key", "customer_name", "region"],
-            dropna=False,
-        )[["nb_commandes_livrees", "nb_commandes_non_livrees"]]
-        .sum()
-        .reset_index()
+def customer_quotas(counts: np.ndarray, budget: int) -> np.ndarray:
+    """
+    points gardés par client, budget au total : un par client si le budget le permet,
+    le reste au prorata des points du client (plus forts restes)
+    """
+    if len(counts) < budget:
+        base, spare = np.ones_like(counts), counts - 1
+    else:
+        # plus de clients que de points : pas de minimum par client
+        base, spare = np.zeros_like(counts), counts
+    remaining = budget - base.sum()
+    exact = spare * remaining / spare.sum()
+    quota = np.floor(exact).astype(counts.dtype)
+    leftover = remaining - quota.sum()
+    quota[np.argsort(quota - exact, kind="stable")[:leftover]] += 1
+    return base + quota
+
+
+def reduce_points(summary: pd.DataFrame, budget: int, seed: int = 0):
+    """
+    ramène summary sous budget points pour le graphe 3d :
+    dates regroupées par semaine / mois / trimestre / année (sommes des kpis),
+    puis échantillon stratifié par client si l'année dépasse encore le budget.
+    renvoie (points, niveau).
+    """
+    if len(summary) <= budget:
+        return summary, "jour"
+
+    keys = ["employee_key", "employee_name", "customer_key", "customer_name", "region"]
+    measures = ["nb_commandes_livrees", "nb_commandes_non_livrees", "total_commandes"]
+    for level, freq in LOD_LEVELS:
+        binned = summary.assign(order_date=summary["order_date"].dt.to_period(freq).dt.start_time)
+        points = binned.groupby(["order_date"] + keys, dropna=False, observed=True)[measures].sum().reset_index()
+        if len(points) <= budget:
+            return points, level
+
+    # chaque client garde la même proportion de points, budget compris
+    points = points.sample(frac=1, random_state=seed)
+    customer = points.groupby("customer_name", dropna=False, observed=True).ngroup().to_numpy()
+    quota = customer_quotas(np.bincount(customer), budget)
+    points = points[points.groupby(customer).cumcount().to_numpy() < quota[customer]]
+    return points.sort_values("order_date", ignore_index=True), f"{level}, échantillon par client"
+
+
+def scatter_3d(points: pd.DataFrame) -> go.Figure:
+    """
+    une seule trace webgl, couleur par client via un tableau de couleurs
+    (px.scatter_3d avec color= crée une trace par client)
+    """
+    palette = px.colors.qualitative.Plotly
+    codes, _ = pd.factorize(points["customer_name"], sort=True)
+    colors = [palette[code % len(palette)] for code in codes]
+
+    customdata = points[
+        ["employee_name", "customer_name", "region", "nb_commandes_livrees", "nb_commandes_non_livrees", "total_commandes"]
+    ].to_numpy()
+    fig = go.Figure(
+        go.Scatter3d(
+            x=points["order_date"],
+            y=points["employee_name"],
+            z=points["customer_name"],
+            mode="markers",
+            marker=dict(size=3, color=colors),
+            customdata=customdata,
+            hovertemplate=(
+                "date : %{x|%Y-%m-%d}<br>employé : %{customdata[0]}<br>client : %{customdata[1]}<br>"
+                "région : %{customdata[2]}<br>livrées : %{customdata[3]}<br>non livrées : %{customdata[4]}<br>"
+                "total : %{customdata[5]}<extra></extra>"
+            ),
+        )
     )
-    grouped["total_commandes"] = grouped["nb_commandes_livrees"] + grouped["nb_commandes_non_livrees"]
-    return grouped
+    fig.update_layout(height=700)
+    return fig
 
 
 def main():
     st.set_page_config(page_title="Dashboard Northwind DW", layout="wide")
     st.title("Dashboard")
 
-    if not DB_PATH.exists():
-        st.error(f"Base SQLite introuvable : {DB_PATH.resolve()}\n\nLance d'abord l'ETL.")
+    db_path = DUCKDB_PATH if BACKEND == "duckdb" else DB_PATH
+    if not db_path.exists():
+        st.error(f"Base {BACKEND} introuvable : {db_path.resolve()}\n\nLance d'abord l'ETL.")
         return
 
-    with st.spinner("chargement des données…"):
-        df_fact = load_fact_joined()
+    if get_data().refresh():
+        st.sidebar.caption("nouvelle version du DW en cours de chargement…")
+    st.sidebar.caption(f"version du DW : {get_data().version} ({BACKEND})")
 
-    if df_fact.empty:
+    min_key, max_key = load_date_bounds()
+    if min_key is None:
         st.error("aucune donnée. vérifiez l'etl.")
         return
 
     st.sidebar.header("filtres")
 
     # filtre dates
-    min_date = df_fact["order_date"].min().date()
-    max_date = df_fact["order_date"].max().date()
+    min_date = key_to_date(min_key)
+    max_date = key_to_date(max_key)
 
     date_range = st.sidebar.date_input(
         "période de commandes",
@@ -100,29 +219,28 @@ def main():
     else:
         start_date = end_date = date_range
 
-    mask_date = (df_fact["order_date"] >= pd.to_datetime(start_date)) & (
-        df_fact["order_date"] <= pd.to_datetime(end_date)
-    )
-    df_filtered = df_fact[mask_date].copy()
+    filters = default_filters(date_key(start_date), date_key(end_date))
 
-    # filtre employés
-    employee_list = sorted(df_filtered["employee_name"].dropna().unique())
+    # filtre employés (clés envoyées dans le WHERE)
+    options = load_employee_options(filters["date_from"], filters["date_to"])
+    employee_list = sorted(options["employee_name"].dropna().unique())
     employee_filter = st.sidebar.multiselect("employé(s)", options=employee_list, default=employee_list)
-    if employee_filter:
-        df_filtered = df_filtered[df_filtered["employee_name"].isin(employee_filter)]
+    point_budget = st.sidebar.number_input(
+        "points max graphe 3d", min_value=500, max_value=500_000, value=POINT_BUDGET, step=5_000
+    )
+    if employee_filter and set(employee_filter) != set(employee_list):
+        selected = options[options["employee_name"].isin(employee_filter)]
+        filters["employee_keys"] = tuple(int(k) for k in selected["employee_key"].dropna())
+        filters["with_unknown"] = bool(selected["employee_key"].isna().any())
 
-    
+    with st.spinner("chargement des données…"):
+        total_livrees, total_non_livrees, total_commandes = load_kpis(filters)
 
-    summary = compute_summary(df_filtered)
-    if summary.empty:
+    if total_commandes == 0:
         st.info("aucune donnée pour cette sélection.")
         return
 
     # KPIs
-    total_livrees = int(summary["nb_commandes_livrees"].sum())
-    total_non_livrees = int(summary["nb_commandes_non_livrees"].sum())
-    total_commandes = int(summary["total_commandes"].sum())
-
     c1, c2, c3 = st.columns(3)
     c1.metric("total commandes", total_commandes)
     c2.metric("commandes livrées", total_livrees)
@@ -135,23 +253,18 @@ def main():
     # =====================================================
     st.subheader("détail période x employé x client")
 
-    detail = summary.sort_values(["order_date", "employee_name", "customer_name"]).copy()
-    detail["order_date"] = pd.to_datetime(detail["order_date"]).dt.date
-
-    st.dataframe(
-        detail[
-            [
-                "order_date",
-                "employee_name",
-                "customer_name",
-                "region",
-                "nb_commandes_livrees",
-                "nb_commandes_non_livrees",
-                "total_commandes",
-            ]
-        ],
-        use_container_width=True,
-    )
+    n_rows = count_detail(filters)
+    t1, t2, t3, t4 = st.columns(4)
+    sort_by = t1.selectbox("trier par", options=list(queries.DETAIL_SORTS), index=0)
+    ascending = t2.selectbox("ordre", options=["croissant", "décroissant"]) == "croissant"
+    page_size = t3.selectbox("lignes par page", options=PAGE_SIZES, index=PAGE_SIZES.index(DEFAULT_PAGE_SIZE))
+    n_pages = max(1, -(-n_rows // page_size))
+    page = t4.number_input("page", min_value=1, max_value=n_pages, value=1, step=1)
+
+    detail = load_detail_page(filters, int(page), int(page_size), sort_by, ascending)
+    st.caption(f"page {int(page)} / {n_pages} ({n_rows} lignes)")
+
+    st.dataframe(detail, use_container_width=True)
 
     st.markdown("---")
 
@@ -160,37 +273,17 @@ def main():
     # =====================================================
     st.subheader("analyse 3d : période x employé x client")
 
-    summary_3d = summary.copy()
-    summary_3d["date_str"] = pd.to_datetime(summary_3d["order_date"]).dt.strftime("%Y-%m-%d")
-
-    fig_3d = px.scatter_3d(
-        summary_3d,
-        x="order_date",
-        y="employee_name",
-        z="customer_name",
-        color="customer_name",
-        hover_data={
-            "date_str": True,
-            "employee_name": True,
-            "customer_name": True,
-            "region": True,
-            "nb_commandes_livrees": True,
-            "nb_commandes_non_livrees": True,
-            "total_commandes": True,
-            "order_date": False,
-        },
-        labels={
-            "order_date": "date",
-            "employee_name": "employé",
-            "customer_name": "client",
-            "region": "région",
-            "date_str": "date",
-        },
-        height=700,
-    )
+    # regroupement fait par le moteur (sqlite ou duckdb)
+    summary = load_summary(filters)
+
+    points, level = reduce_points(summary, int(point_budget))
+    if len(points) < len(summary):
+        st.caption(
+            f"niveau de détail : {len(summary):,} points réduits à {len(points):,} "
+            f"(regroupement par {level}, budget {int(point_budget):,})"
+        )
 
- 
-    fig_3d.update_traces(marker=dict(size=3))
+    fig_3d = scatter_3d(points)
 
     fig_3d.update_layout(
         scene=dict(
@@ -209,14 +302,7 @@ def main():
     # =====================================================
     st.subheader("volume de commandes par mois")
 
-    monthly = summary.copy()
-    monthly["year_month"] = pd.to_datetime(monthly["order_date"]).dt.to_period("M").dt.to_timestamp()
-
-    monthly_agg = (
-        monthly.groupby("year_month", as_index=False)["total_commandes"]
-        .sum()
-        .sort_values("year_month")
-    )
+    monthly_agg = load_monthly(filters)
 
     fig_month = px.line(
         monthly_agg,
@@ -0,0 +1,110 @@
+import threading
+from collections import OrderedDict
+from contextlib import closing
+
+import warehouse
+
+
+# =========================
+# CACHE DU DASHBOARD (clé = version du DW + requête + filtres)
+# =========================
+def freeze(value):
+    """
+    arguments -> clé hashable (les filtres sont des dict)
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+class LRUCache:
+    """
+    cache borné : au-delà de max_entries, l'entrée la moins récemment lue est retirée
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, compute):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+
+        # calcul hors verrou : une requête lente ne bloque pas les autres sessions
+        value = compute()
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return value
+
+    def keep_only(self, version):
+        with self.lock:
+            for key in [k for k in self.entries if k[0] != version]:
+                del self.entries[key]
+
+
+class VersionedData:
+    """
+    résultats de requêtes partagés entre les sessions, indexés par la version
+    de chargement écrite par l'etl (warehouse.record_load_version).
+
+    quand une nouvelle version apparaît, warmup(fetch) recharge la vue par défaut
+    dans un thread ; les sessions continuent sur l'ancienne version jusqu'à la
+    fin du préchargement, puis basculent sur la nouvelle.
+    """
+
+    def __init__(self, connect, warmup=None, max_entries=64):
+        self.connect = connect
+        self.warmup = warmup
+        self.cache = LRUCache(max_entries)
+        self.version = None
+        self.swap_thread = None
+        self.lock = threading.Lock()
+
+    def db_version(self):
+        with closing(self.connect()) as cnx:
+            return warehouse.read_load_version(cnx)
+
+    def fetch_for(self, version, fn, *args):
+        def compute():
+            with closing(self.connect()) as cnx:
+                return fn(cnx, *args)
+
+        return self.cache.get((version, fn.__name__, freeze(args)), compute)
+
+    def get(self, fn, *args):
+        """
+        fn(cnx, *args) pour la version active (calcul au premier appel seulement).
+        les frames renvoyés sont partagés : lecture seule.
+        """
+        return self.fetch_for(self.version, fn, *args)
+
+    def refresh(self):
+        """
+        à appeler à chaque exécution du script : détecte une nouvelle version
+        et lance la bascule en arrière-plan. renvoie True si une bascule est en cours.
+        """
+        current = self.db_version()
+        with self.lock:
+            if self.version is None:
+                self.version = current
+            if current == self.version:
+                return False
+            if self.swap_thread is None or not self.swap_thread.is_alive():
+                self.swap_thread = threading.Thread(target=self.swap, args=(current,), daemon=True)
+                self.swap_thread.start()
+            return True
+
+    def swap(self, version):
+        if self.warmup is not None:
+            self.warmup(lambda fn, *args: self.fetch_for(version, fn, *args))
+        with self.lock:
+            self.version = version
+        self.cache.keep_only(version)
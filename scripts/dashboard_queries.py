@@ -0,0 +1,302 @@
+import sqlite3
+
+import pandas as pd
+
+
+# =========================
+# REQUETES DU DASHBOARD (filtres -> SQL paramétré)
+# =========================
+# SQL commun à sqlite et duckdb (duckdb_store) : paramètres ?, pas de colonne nue
+# dans un GROUP BY, pas de division entière implicite.
+# filtres = {
+#     "date_from": 19960704,          date_key yyyymmdd inclus
+#     "date_to": 19980506,            date_key yyyymmdd inclus
+#     "employee_keys": (1, 2) | None, None = tous les employés
+#     "with_unknown": False,          inclut les commandes sans employé
+# }
+AGG_DAILY = "agg_orders_daily"
+AGG_MONTHLY = "agg_orders_monthly"
+
+EMPLOYEE_NAME = (
+    "COALESCE(NULLIF(TRIM(COALESCE(e.FirstName, '') || ' ' || COALESCE(e.LastName, '')), ''), "
+    "'(employé inconnu)')"
+)
+CUSTOMER_NAME = "COALESCE(c.CompanyName, '(sans nom)')"
+REGION = "COALESCE(e.RegionDescription, '(sans région)')"
+# yyyymmdd -> yyyymm : "/" est une division entière en sqlite, décimale en duckdb
+YEAR_MONTH = "(f.order_date_key - f.order_date_key % 100) / 100"
+
+DIM_JOINS = """
+    LEFT JOIN dim_employee e ON f.employee_key = e.employee_key
+    LEFT JOIN dim_customer c ON f.customer_key = c.customer_key
+"""
+
+# colonnes triables du tableau de détail -> expression SQL
+DETAIL_SORTS = {
+    "order_date": "order_date_key",
+    "employee_name": "employee_name",
+    "customer_name": "customer_name",
+    "region": "region",
+    "nb_commandes_livrees": "nb_commandes_livrees",
+    "nb_commandes_non_livrees": "nb_commandes_non_livrees",
+    "total_commandes": "total_commandes",
+}
+
+
+def read_frame(cnx, query, params=()):
+    """
+    DataFrame du résultat, sur une connexion sqlite3 ou duckdb
+    (duckdb : résultat colonnaire converti directement, sans tuples python)
+    """
+    if isinstance(cnx, sqlite3.Connection):
+        return pd.read_sql(query, cnx, params=params)
+    return cnx.execute(query, params).df()
+
+
+def has_table(cnx, name):
+    row = cnx.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)).fetchone()
+    return row is not None
+
+
+def fact_source(cnx):
+    """
+    grain jour x employé x client : l'agrégat journalier suffit, sinon la fact
+    """
+    return AGG_DAILY if has_table(cnx, AGG_DAILY) else "fact_orders"
+
+
+def where_clause(filters, date_col="f.order_date_key", date_div=1):
+    """
+    (clause WHERE, paramètres) pour les filtres.
+    date_div=100 : la colonne date est en yyyymm (agrégat mensuel).
+    """
+    clauses = [f"{date_col} BETWEEN ? AND ?"]
+    params = [int(filters["date_from"]) // date_div, int(filters["date_to"]) // date_div]
+
+    keys = filters.get("employee_keys")
+    if keys is not None:
+        emp = []
+        if keys:
+            emp.append(f"f.employee_key IN ({', '.join('?' for _ in keys)})")
+            params.extend(int(k) for k in keys)
+        if filters.get("with_unknown"):
+            emp.append("f.employee_key IS NULL")
+        clauses.append("(" + " OR ".join(emp) + ")" if emp else "0 = 1")
+
+    return " AND ".join(clauses), params
+
+
+def date_bounds(cnx):
+    """
+    (date_key min, date_key max) des commandes, (None, None) si vide
+    """
+    src = fact_source(cnx)
+    return cnx.execute(f"SELECT MIN(order_date_key), MAX(order_date_key) FROM {src}").fetchone()
+
+
+def employee_options(cnx, date_from, date_to):
+    """
+    employés ayant des commandes sur la période : employee_key, employee_name
+    """
+    src = fact_source(cnx)
+    query = f"""
+    SELECT DISTINCT f.employee_key, {EMPLOYEE_NAME} AS employee_name
+    FROM {src} f
+    LEFT JOIN dim_employee e ON f.employee_key = e.employee_key
+    WHERE f.order_date_key BETWEEN ? AND ?
+    """
+    return read_frame(cnx, query, params=[int(date_from), int(date_to)])
+
+
+# mesures en int32 : elles sont ensuite additionnées (total, regroupements du graphe 3d)
+# dans leur propre type, un int8 / int16 déborderait
+MEASURES = ("nb_commandes_livrees", "nb_commandes_non_livrees", "total_commandes")
+
+
+def compact_rows(df):
+    """
+    représentation compacte des lignes du dashboard :
+    noms / région en category (dictionnaire + codes), clés et mesures en int32,
+    date gardée en date_key int32 plutôt qu'en Timestamp.
+    """
+    df = df.astype(
+        {
+            "order_date_key": "int32",
+            "employee_key": "Int32",
+            "customer_key": "Int32",
+            "employee_name": "category",
+            "customer_name": "category",
+            "region": "category",
+        }
+    )
+    for col in MEASURES:
+        if col in df.columns:
+            df[col] = df[col].fillna(0).astype("int32")
+    return df
+
+
+def memory_per_row(df):
+    """
+    octets par ligne (chaînes comprises)
+    """
+    return df.memory_usage(deep=True).sum() / max(len(df), 1)
+
+
+def load_rows(cnx, filters):
+    """
+    lignes filtrées de la fact au grain jour x employé x client, en représentation
+    compacte (compact_rows) ; mesure mémoire de bench_dashboard_memory
+    """
+    src = fact_source(cnx)
+    where, params = where_clause(filters)
+    query = f"""
+    SELECT
+        f.order_date_key,
+        f.employee_key,
+        f.customer_key,
+        {EMPLOYEE_NAME} AS employee_name,
+        {CUSTOMER_NAME} AS customer_name,
+        {REGION} AS region,
+        f.nb_commandes_livrees,
+        f.nb_commandes_non_livrees
+    FROM {src} f
+    {DIM_JOINS}
+    WHERE {where}
+    """
+    return compact_rows(read_frame(cnx, query, params=params))
+
+
+def load_kpis(cnx, filters):
+    """
+    (livrées, non livrées, total) sur la sélection
+    """
+    src = fact_source(cnx)
+    where, params = where_clause(filters)
+    row = cnx.execute(
+        f"""
+        SELECT COALESCE(SUM(f.nb_commandes_livrees), 0), COALESCE(SUM(f.nb_commandes_non_livrees), 0)
+        FROM {src} f
+        WHERE {where}
+        """,
+        params,
+    ).fetchone()
+    livrees, non_livrees = int(row[0]), int(row[1])
+    return livrees, non_livrees, livrees + non_livrees
+
+
+def detail_select(src, where, with_keys=False):
+    keys = "f.employee_key, f.customer_key," if with_keys else ""
+    return f"""
+    SELECT
+        f.order_date_key,
+        {keys}
+        MIN({EMPLOYEE_NAME}) AS employee_name,
+        MIN({CUSTOMER_NAME}) AS customer_name,
+        MIN({REGION}) AS region,
+        SUM(f.nb_commandes_livrees) AS nb_commandes_livrees,
+        SUM(f.nb_commandes_non_livrees) AS nb_commandes_non_livrees,
+        SUM(f.nb_commandes_livrees) + SUM(f.nb_commandes_non_livrees) AS total_commandes
+    FROM {src} f
+    {DIM_JOINS}
+    WHERE {where}
+    GROUP BY f.order_date_key, f.employee_key, f.customer_key
+    """
+
+
+SUMMARY_COLUMNS = [
+    "order_date",
+    "employee_key",
+    "employee_name",
+    "customer_key",
+    "customer_name",
+    "region",
+    "nb_commandes_livrees",
+    "nb_commandes_non_livrees",
+    "total_commandes",
+]
+
+
+def load_summary(cnx, filters):
+    """
+    points du graphe 3d regroupés en SQL au grain jour x employé x client,
+    total compris
+    """
+    src = fact_source(cnx)
+    where, params = where_clause(filters)
+    query = f"""
+    {detail_select(src, where, with_keys=True)}
+    ORDER BY f.order_date_key, f.employee_key NULLS LAST, f.customer_key NULLS LAST
+    """
+    df = compact_rows(read_frame(cnx, query, params=params))
+    df.insert(0, "order_date", pd.to_datetime(df.pop("order_date_key").astype(str), format="%Y%m%d"))
+    return df[SUMMARY_COLUMNS]
+
+
+def count_detail(cnx, filters):
+    src = fact_source(cnx)
+    where, params = where_clause(filters)
+    query = f"""
+    SELECT COUNT(*) FROM (
+        SELECT 1 FROM {src} f WHERE {where}
+        GROUP BY f.order_date_key, f.employee_key, f.customer_key
+    )
+    """
+    return int(cnx.execute(query, params).fetchone()[0])
+
+
+def load_detail_page(cnx, filters, page, page_size, sort_by="order_date", ascending=True):
+    """
+    une page du tableau détail, triée et découpée en SQL (LIMIT / OFFSET)
+    """
+    if sort_by not in DETAIL_SORTS:
+        raise ValueError(f"tri inconnu : {sort_by}")
+
+    src = fact_source(cnx)
+    where, params = where_clause(filters)
+    direction = "ASC" if ascending else "DESC"
+    query = f"""
+    {detail_select(src, where)}
+    ORDER BY {DETAIL_SORTS[sort_by]} {direction}, order_date_key, employee_name, customer_name
+    LIMIT ? OFFSET ?
+    """
+    page = max(1, int(page))
+    df = read_frame(cnx, query, params=params + [int(page_size), (page - 1) * int(page_size)])
+    df.insert(0, "order_date", pd.to_datetime(df.pop("order_date_key").astype(str), format="%Y%m%d").dt.date)
+    return df
+
+
+def covers_whole_months(date_from, date_to):
+    start = pd.to_datetime(str(int(date_from)), format="%Y%m%d")
+    end = pd.to_datetime(str(int(date_to)), format="%Y%m%d")
+    return start.day == 1 and end.is_month_end
+
+
+def load_monthly(cnx, filters):
+    """
+    volume de commandes par mois. agrégat mensuel si la période couvre des
+    mois entiers, sinon regroupement SQL du grain journalier.
+    """
+    if has_table(cnx, AGG_MONTHLY) and covers_whole_months(filters["date_from"], filters["date_to"]):
+        where, params = where_clause(filters, date_col="f.year_month", date_div=100)
+        query = f"""
+        SELECT f.year_month, SUM(f.total_commandes) AS total_commandes
+        FROM {AGG_MONTHLY} f
+        WHERE {where}
+        GROUP BY f.year_month
+        ORDER BY f.year_month
+        """
+    else:
+        src = fact_source(cnx)
+        where, params = where_clause(filters)
+        query = f"""
+        SELECT
+            {YEAR_MONTH} AS year_month,
+            SUM(f.nb_commandes_livrees) + SUM(f.nb_commandes_non_livrees) AS total_commandes
+        FROM {src} f
+        WHERE {where}
+        GROUP BY {YEAR_MONTH}
+        ORDER BY year_month
+        """
+    monthly = read_frame(cnx, query, params=params)
+    monthly["year_month"] = pd.to_datetime(monthly["year_month"].astype(int).astype(str), format="%Y%m")
+    return monthly
@@ -0,0 +1,91 @@
+import os
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+
+import warehouse
+
+try:
+    import duckdb
+except ImportError:  # moteur colonnaire optionnel
+    duckdb = None
+
+
+# =========================
+# COPIE DUCKDB DU DW (moteur colonnaire du dashboard)
+# =========================
+# mêmes tables et mêmes noms que le DW sqlite : les requêtes de dashboard_queries
+# tournent telles quelles sur l'un ou l'autre moteur.
+DASHBOARD_TABLES = [
+    "dim_employee",
+    "dim_customer",
+    "fact_orders",
+    warehouse.AGG_DAILY,
+    warehouse.AGG_MONTHLY,
+    warehouse.LOAD_VERSION_TABLE,
+]
+# tables triées par date à la copie : les min / max par bloc de duckdb (zone maps)
+# écartent alors les blocs hors de la période filtrée
+SORT_KEYS = {
+    "fact_orders": "order_date_key",
+    warehouse.AGG_DAILY: "order_date_key",
+    warehouse.AGG_MONTHLY: "year_month",
+}
+CHUNK_ROWS = 500_000
+
+
+def require_duckdb():
+    if duckdb is None:
+        raise ImportError("duckdb est nécessaire pour le moteur colonnaire (pip install duckdb)")
+
+
+def connect(duckdb_path):
+    require_duckdb()
+    return duckdb.connect(str(duckdb_path), read_only=True)
+
+
+def export_from_sqlite(sqlite_path, duckdb_path, tables=DASHBOARD_TABLES, chunk_rows=CHUNK_ROWS):
+    """
+    copie des tables du DW sqlite dans un fichier duckdb, par blocs de chunk_rows.
+    écrit dans un fichier temporaire renommé à la fin (le dashboard lit
+    l'ancienne copie jusque-là). renvoie le nombre de lignes copiées.
+    """
+    require_duckdb()
+    duckdb_path = Path(duckdb_path)
+    tmp_path = duckdb_path.with_name(duckdb_path.stem + ".tmp" + duckdb_path.suffix)
+    tmp_path.unlink(missing_ok=True)
+
+    src = sqlite3.connect(sqlite_path)
+    dst = duckdb.connect(str(tmp_path))
+    n_rows = 0
+    try:
+        for table in tables:
+            if not warehouse.table_exists(src, table):
+                continue
+            order = f" ORDER BY {SORT_KEYS[table]}" if table in SORT_KEYS else ""
+            created = False
+            for chunk in pd.read_sql(f"SELECT * FROM {table}{order}", src, chunksize=chunk_rows):
+                # textes et ids mélangés (int access / texte sql server) : type texte fixe
+                # d'un bloc à l'autre
+                chunk = chunk.astype({c: "string" for c in chunk.columns if chunk[c].dtype == object})
+                if created:
+                    dst.execute(f"INSERT INTO {table} SELECT * FROM chunk")
+                else:
+                    dst.execute(f"CREATE TABLE {table} AS SELECT * FROM chunk")
+                    created = True
+                n_rows += len(chunk)
+            if not created:
+                empty = pd.read_sql(f"SELECT * FROM {table} LIMIT 0", src)
+                dst.execute(f"CREATE TABLE {table} AS SELECT * FROM empty")
+        dst.execute("CHECKPOINT")
+    except BaseException:
+        dst.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+    finally:
+        src.close()
+    dst.close()
+
+    os.replace(tmp_path, duckdb_path)
+    return n_rows
@@ -1,8 +1,22 @@
-import pyodbc
+import argparse
+import time
+from datetime import date
 import pandas as pd
 from pathlib import Path
 import sqlite3
 
+import columnar
+import connections
+import duckdb_store
+import excel_export
+import quality
+import warehouse
+from checkpoint import Checkpoints, content_hash
+from pipeline import Pipeline
+from parallel_extract import DEFAULT_WORKERS, fingerprint, print_timings, run_tasks, select_all, table_columns
+from parallel_transform import DEFAULT_TRANSFORM_WORKERS, print_partition_timings, resolve_in_pool
+from source_mapping import map_columns, resolve_columns, select_list, source_column
+
 
 # =========================
 # CONFIG 
@@ -16,6 +30,8 @@ SQLSERVER_DB = "Northwind"
 BASE_DIR = Path("data")
 PROCESSED_DIR = BASE_DIR / "processed"
 FINAL_DIR = BASE_DIR / "final"
+REPORT_DIR = BASE_DIR / "reports"
+CHECKPOINT_DIR = BASE_DIR / "checkpoints"
 
 PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 FINAL_DIR.mkdir(parents=True, exist_ok=True)
@@ -23,423 +39,1291 @@ FINAL_DIR.mkdir(parents=True, exist_ok=True)
 
 EXCEL_OUTPUT = FINAL_DIR / "northwind_dw.xlsx"
 DW_DB_PATH = FINAL_DIR / "northwind_dw.sqlite"
+FACT_PARQUET_DIR = FINAL_DIR / "fact_orders"
+DUCKDB_PATH = FINAL_DIR / "northwind_dw.duckdb"
+
+# formats des fichiers processed / final : csv, parquet
+OUTPUT_FORMATS = {"csv": ("csv",), "parquet": ("parquet",), "both": ("csv", "parquet")}
+# sorties de data/final en plus du DW sqlite (toujours chargé) : fichiers (--format), excel
+# et copie duckdb du DW pour le dashboard (optionnelle, duckdb requis)
+OUTPUT_TARGETS = ("files", "excel", "duckdb")
+DEFAULT_OUTPUTS = ("files", "excel")
+
+# attributs suivis en SCD type 2 (un changement = nouvelle version du membre)
+EMPLOYEE_TRACKED = ["LastName", "FirstName", "Title", "City", "Country", "RegionDescription"]
+CUSTOMER_TRACKED = ["CompanyName", "ContactName", "City", "Country", "PostalCode", "Address", "Phone"]
+
+SCD_BEGIN = "1900-01-01"
+SCD_END = "9999-12-31"
+
+# dim_date : plage générée au premier run, étendue ensuite à l'année près si besoin
+DIM_DATE_START = "1996-01-01"
+DIM_DATE_END = "2030-12-31"
+FISCAL_YEAR_START_MONTH = 7  # exercice fiscal juillet -> juin (année fiscale = année de fin)
 
 
 # =========================
 # CONNECTIONS
 # =========================
+# pools partagés par toutes les étapes (connections.py) : connexions réutilisées,
+# reprises sur erreur passagère, requêtes mesurables (--query-timings).
+# pour tester sans odbc : ACCESS_POOL.use(connections.sqlite_standin("access.db"))
+ACCESS_POOL = connections.Pool("access", connections.access_factory(ACCESS_DB_PATH))
+SQLSERVER_POOL = connections.Pool("sqlserver", connections.sqlserver_factory(SQLSERVER_SERVER, SQLSERVER_DB))
+
+
 def conn_access():
-    conn_str = (
-        r"DRIVER={Microsoft Access Driver (*.mdb, *.accdb)};"
-        rf"DBQ={ACCESS_DB_PATH};"
-    )
-    return pyodbc.connect(conn_str)
+    return ACCESS_POOL.connect()
 
 
 def conn_sqlserver():
-    conn_str = (
-        r"DRIVER={ODBC Driver 17 for SQL Server};"
-        rf"SERVER={SQLSERVER_SERVER};"
-        rf"DATABASE={SQLSERVER_DB};"
-        r"Trusted_Connection=yes;"
-    )
-    return pyodbc.connect(conn_str)
+    return SQLSERVER_POOL.connect()
 
 
 # =========================
 # EXTRACT
 # =========================
-def extract_access():
-    cnx = conn_access()
+def read_orders(cnx, source, orders_from=None):
+    """
+    Orders complète, ou seulement à partir de l'order id orders_from (mode incrémental)
+    """
+    if orders_from is None:
+        return pd.read_sql("SELECT * FROM Orders", cnx)
+
+    # le nom de la colonne id change selon la source (OrderID / Order ID)
+    id_col = source_column(source, "orders", table_columns(cnx, "Orders"), "order_id_source")
+    return pd.read_sql(f"SELECT * FROM Orders WHERE [{id_col}] >= ?", cnx, params=[orders_from])
+
+
+def access_tasks(orders_from=None):
+    return [
+        ("access.employees", conn_access, select_all("Employees")),
+        ("access.customers", conn_access, select_all("Customers")),
+        ("access.orders", conn_access, lambda cnx: read_orders(cnx, "access", orders_from)),
+        # si dispo dans ce fichier Access
+        ("access.region", conn_access, select_all("Region", optional=True)),
+        ("access.territories", conn_access, select_all("Territories", optional=True)),
+        ("access.emp_terr", conn_access, select_all("EmployeeTerritories", optional=True)),
+    ]
 
-    df_emp = pd.read_sql("SELECT * FROM Employees", cnx)
-    df_cust = pd.read_sql("SELECT * FROM Customers", cnx)
-    df_orders = pd.read_sql("SELECT * FROM Orders", cnx)
 
-    # si dispo dans ce fichier Access
-    try:
-        df_region = pd.read_sql("SELECT * FROM Region", cnx)
-        df_territories = pd.read_sql("SELECT * FROM Territories", cnx)
-        df_emp_terr = pd.read_sql("SELECT * FROM EmployeeTerritories", cnx)
-    except Exception:
-        df_region = pd.DataFrame()
-        df_territories = pd.DataFrame()
-        df_emp_terr = pd.DataFrame()
+def sqlserver_tasks(orders_from=None):
+    return [
+        ("sqlserver.employees", conn_sqlserver, select_all("Employees")),
+        ("sqlserver.customers", conn_sqlserver, select_all("Customers")),
+        ("sqlserver.orders", conn_sqlserver, lambda cnx: read_orders(cnx, "sqlserver", orders_from)),
+    ]
 
-    cnx.close()
 
-    return {
-        "employees": df_emp,
-        "customers": df_cust,
-        "orders": df_orders,
-        "region": df_region,
-        "territories": df_territories,
-        "emp_terr": df_emp_terr,
-    }
+def fingerprint_tasks():
+    """
+    empreinte (lignes, clé max, hash) de chaque table extraite, sans l'extraire
+    quand la source sait la calculer (sql server)
+    """
+    return [
+        ("access.employees", conn_access, fingerprint("Employees", ["ID", "EmployeeID"])),
+        ("access.customers", conn_access, fingerprint("Customers", ["ID", "CustomerID"])),
+        ("access.orders", conn_access, fingerprint("Orders", ["Order ID", "OrderID"])),
+        ("access.region", conn_access, fingerprint("Region", optional=True)),
+        ("access.territories", conn_access, fingerprint("Territories", optional=True)),
+        ("access.emp_terr", conn_access, fingerprint("EmployeeTerritories", optional=True)),
+        ("sqlserver.employees", conn_sqlserver, fingerprint("Employees", ["EmployeeID"], server_checksum=True)),
+        ("sqlserver.customers", conn_sqlserver, fingerprint("Customers", ["CustomerID"], server_checksum=True)),
+        ("sqlserver.orders", conn_sqlserver, fingerprint("Orders", ["OrderID"], server_checksum=True)),
+    ]
+
 
+def check_sources(workers=DEFAULT_WORKERS):
+    """
+    (empreintes actuelles, tables modifiées depuis le dernier run réussi)
+    """
+    fingerprints, _ = run_tasks(fingerprint_tasks(), workers)
+    conn = sqlite3.connect(DW_DB_PATH)
+    previous = warehouse.read_fingerprints(conn)
+    conn.close()
 
-def extract_sqlserver():
-    cnx = conn_sqlserver()
+    changed = warehouse.changed_tables(fingerprints, previous)
+    for name in changed:
+        before = previous.get(name)
+        now = fingerprints.get(name)
+        print(
+            f"  {name:<22} modifiée : {before['rows'] if before else '-'} -> {now['rows'] if now else '-'} lignes"
+        )
+    return fingerprints, changed
 
-    df_emp = pd.read_sql("SELECT * FROM Employees", cnx)
-    df_cust = pd.read_sql("SELECT * FROM Customers", cnx)
-    df_orders = pd.read_sql("SELECT * FROM Orders", cnx)
 
-    cnx.close()
+def extract_inputs(fingerprints, with_orders=True):
+    """
+    empreintes des tables lues par l'étape extract : son entrée pour --resume
+    (with_orders=False : chargement par blocs, Orders lue pendant le chargement)
+    """
+    if fingerprints is None:
+        return None
+    return {name: fp for name, fp in fingerprints.items() if with_orders or not name.endswith(".orders")}
 
-    return {
-        "employees": df_emp,
-        "customers": df_cust,
-        "orders": df_orders,
-    }
+
+def split_by_source(results, source):
+    prefix = f"{source}."
+    return {name[len(prefix):]: df for name, df in results.items() if name.startswith(prefix)}
+
+
+def extract_access(orders_from=None, workers=DEFAULT_WORKERS):
+    results, _ = run_tasks(access_tasks(orders_from), workers)
+    return split_by_source(results, "access")
+
+
+def extract_sqlserver(orders_from=None, workers=DEFAULT_WORKERS):
+    results, _ = run_tasks(sqlserver_tasks(orders_from), workers)
+    return split_by_source(results, "sqlserver")
+
+
+def extract_all(access_from=None, sql_from=None, workers=DEFAULT_WORKERS, with_orders=True):
+    """
+    access + sql server en parallèle (une connexion par table en cours),
+    temps par table affichés.
+    with_orders=False : tout sauf Orders (chargement par blocs, lue au fil du curseur)
+    """
+    tasks = access_tasks(access_from) + sqlserver_tasks(sql_from)
+    if not with_orders:
+        tasks = [task for task in tasks if not task[0].endswith(".orders")]
+    t0 = time.perf_counter()
+    results, timings = run_tasks(tasks, workers)
+    print_timings(results, timings, time.perf_counter() - t0)
+    return split_by_source(results, "access"), split_by_source(results, "sqlserver")
 
 
 # =========================
 # TRANSFORM 
 # =========================
 def build_dim_employee(access_data, sql_data):
-    emp_a = access_data["employees"].copy()
-    emp_a["source_system"] = "access"
+    dim_emp = pd.concat(
+        [
+            map_columns(access_data["employees"], "access", "employees"),
+            map_columns(sql_data["employees"], "sqlserver", "employees"),
+        ],
+        ignore_index=True,
+    ).drop_duplicates()
+    dim_emp.insert(0, "employee_key", range(1, len(dim_emp) + 1))
+    return dim_emp
 
-    if "EmployeeID" in emp_a.columns:
-        id_col_a = "EmployeeID"
-    elif "ID" in emp_a.columns:
-        id_col_a = "ID"
-    else:
-        raise KeyError("pas de colonne id/employeeid trouvée dans access")
 
-    if "LastName" in emp_a.columns:
-        ln_col_a = "LastName"
-    elif "Last Name" in emp_a.columns:
-        ln_col_a = "Last Name"
-    else:
-        ln_col_a = None
+def build_dim_customer(access_data, sql_data):
+    dim_cust = pd.concat(
+        [
+            map_columns(access_data["customers"], "access", "customers"),
+            map_columns(sql_data["customers"], "sqlserver", "customers"),
+        ],
+        ignore_index=True,
+    ).drop_duplicates()
+    dim_cust.insert(0, "customer_key", range(1, len(dim_cust) + 1))
+    return dim_cust
 
-    if "FirstName" in emp_a.columns:
-        fn_col_a = "FirstName"
-    elif "First Name" in emp_a.columns:
-        fn_col_a = "First Name"
-    else:
-        fn_col_a = None
 
-    rename_a = {id_col_a: "employee_id_source"}
-    if ln_col_a:
-        rename_a[ln_col_a] = "LastName"
-    if fn_col_a:
-        rename_a[fn_col_a] = "FirstName"
+DIM_DATE_COLUMNS = [
+    "date_key", "date", "year", "quarter", "month", "day", "year_month", "month_name",
+    "day_of_week", "is_weekend", "iso_year", "iso_week", "iso_day_of_week",
+    "fiscal_year", "fiscal_quarter", "fiscal_month",
+]
 
-    emp_a = emp_a.rename(columns=rename_a)
 
-    for col in ["LastName", "FirstName", "Title", "City", "Country"]:
-        if col not in emp_a.columns:
-            emp_a[col] = None
+def build_dim_date(start=DIM_DATE_START, end=DIM_DATE_END):
+    dates = pd.date_range(start=start, end=end, freq="D")
+    dim_date = pd.DataFrame({"date": dates})
 
-    emp_s = sql_data["employees"].copy()
-    emp_s["source_system"] = "sqlserver"
+    year = dim_date["date"].dt.year
+    month = dim_date["date"].dt.month
+    day = dim_date["date"].dt.day
+
+    # clé yyyymmdd calculée (pas de strftime)
+    dim_date["date_key"] = year * 10000 + month * 100 + day
+    dim_date["year"] = year
+    dim_date["quarter"] = (month - 1) // 3 + 1
+    dim_date["month"] = month
+    dim_date["day"] = day
+    dim_date["year_month"] = year * 100 + month
+    dim_date["month_name"] = dim_date["date"].dt.month_name()
+    dim_date["day_of_week"] = dim_date["date"].dt.day_name()
+    dim_date["is_weekend"] = dim_date["date"].dt.dayofweek >= 5
 
-    if "EmployeeID" not in emp_s.columns:
-        raise KeyError("pas de colonne employeeid trouvée dans sql server")
+    iso = dim_date["date"].dt.isocalendar()
+    dim_date["iso_year"] = iso["year"].astype(int)
+    dim_date["iso_week"] = iso["week"].astype(int)
+    dim_date["iso_day_of_week"] = iso["day"].astype(int)
 
-    emp_s["employee_id_source"] = emp_s["EmployeeID"]
+    fiscal_month = (month - FISCAL_YEAR_START_MONTH) % 12 + 1
+    dim_date["fiscal_year"] = year + (month >= FISCAL_YEAR_START_MONTH).astype(int) * (FISCAL_YEAR_START_MONTH > 1)
+    dim_date["fiscal_quarter"] = (fiscal_month - 1) // 3 + 1
+    dim_date["fiscal_month"] = fiscal_month
 
-    for col in ["LastName", "FirstName", "Title", "City", "Country"]:
-        if col not in emp_s.columns:
-            emp_s[col] = None
+    return dim_date[DIM_DATE_COLUMNS]
 
-    # petit champ en plus (si tu veux)
-    emp_a["RegionDescription"] = None
-    emp_s["RegionDescription"] = emp_s.get("Region", None)
 
-    cols = [
-        "source_system",
-        "employee_id_source",
-        "LastName",
-        "FirstName",
-        "Title",
-        "City",
-        "Country",
-        "RegionDescription",
-    ]
+def key_to_timestamp(date_key):
+    date_key = int(date_key)
+    return pd.Timestamp(year=date_key // 10000, month=date_key // 100 % 100, day=date_key % 100)
 
-    dim_emp = pd.concat([emp_a[cols], emp_s[cols]], ignore_index=True).drop_duplicates()
-    dim_emp.insert(0, "employee_key", range(1, len(dim_emp) + 1))
-    return dim_emp
 
+def ensure_dim_date(conn, access_data, sql_data):
+    """
+    dim_date persistante dans le DW : générée une fois, puis complétée (années
+    entières) seulement si des dates de commande / livraison sortent de sa plage.
+    renvoie (dim_date, modifiée ?).
+    """
+    orders = stack_orders(access_data, sql_data)
+    dates = pd.concat([to_dates(orders["OrderDate"]), to_dates(orders["ShippedDate"])]).dropna()
+    return extend_dim_date(conn, dates)
 
-def build_dim_customer(access_data, sql_data):
-    cust_a = access_data["customers"].copy()
-    cust_a["source_system"] = "access"
 
-    if "CustomerID" in cust_a.columns:
-        id_col_a = "CustomerID"
-    elif "ID" in cust_a.columns:
-        id_col_a = "ID"
-    else:
-        raise KeyError("pas de colonne id/customerid trouvée dans access")
+def extend_dim_date(conn, dates):
+    """
+    ensure_dim_date pour des dates déjà connues (ex. min / max des sources)
+    """
+    dim_date = pd.DataFrame()
+    if warehouse.table_exists(conn, "dim_date"):
+        dim_date = warehouse.read_table(conn, "dim_date")
+        if not dim_date.empty:
+            dim_date["date"] = pd.to_datetime(dim_date["date"])
+            dim_date["is_weekend"] = dim_date["is_weekend"].astype(bool)
+
+    rebuilt = dim_date.empty or list(dim_date.columns) != DIM_DATE_COLUMNS
+    if rebuilt:
+        dim_date = build_dim_date()
+
+    parts = []
+    if len(dates):
+        first = key_to_timestamp(dim_date["date_key"].min())
+        last = key_to_timestamp(dim_date["date_key"].max())
+        if dates.min() < first:
+            parts.append(build_dim_date(f"{dates.min().year}-01-01", first - pd.Timedelta(days=1)))
+        if dates.max() > last:
+            parts.append(build_dim_date(last + pd.Timedelta(days=1), f"{dates.max().year}-12-31"))
+
+    if rebuilt:
+        dim_date = pd.concat([dim_date] + parts, ignore_index=True).sort_values("date_key", ignore_index=True)
+        warehouse.load_star_schema(conn, {"dim_date": dim_date})
+    elif parts:
+        added = pd.concat(parts, ignore_index=True)
+        with conn:
+            added.to_sql("dim_date", conn, if_exists="append", index=False)
+        dim_date = pd.concat([dim_date, added], ignore_index=True).sort_values("date_key", ignore_index=True)
+        print(f"dim_date étendue : {len(added)} jours ajoutés")
+
+    return dim_date, rebuilt or bool(parts)
 
-    if "CompanyName" in cust_a.columns:
-        comp_col_a = "CompanyName"
-    elif "Company" in cust_a.columns:
-        comp_col_a = "Company"
-    else:
-        comp_col_a = None
 
-    if "ContactName" in cust_a.columns:
-        contact_col_a = "ContactName"
-    elif "Contact Name" in cust_a.columns:
-        contact_col_a = "Contact Name"
-    else:
-        contact_col_a = None
-
-    rename_a = {id_col_a: "customer_id_source"}
-    if comp_col_a:
-        rename_a[comp_col_a] = "CompanyName"
-    if contact_col_a:
-        rename_a[contact_col_a] = "ContactName"
-
-    cust_a = cust_a.rename(columns=rename_a)
-
-    for col in ["CompanyName", "ContactName", "City", "Country", "PostalCode", "Address", "Phone"]:
-        if col not in cust_a.columns:
-            cust_a[col] = None
-
-    cust_s = sql_data["customers"].copy()
-    cust_s["source_system"] = "sqlserver"
-
-    if "CustomerID" not in cust_s.columns:
-        raise KeyError("pas de colonne customerid trouvée dans sql server")
-
-    cust_s["customer_id_source"] = cust_s["CustomerID"]
-
-    for col in ["CompanyName", "ContactName", "City", "Country", "PostalCode", "Address", "Phone"]:
-        if col not in cust_s.columns:
-            cust_s[col] = None
-
-    cols = [
-        "source_system",
-        "customer_id_source",
-        "CompanyName",
-        "ContactName",
-        "City",
-        "Country",
-        "PostalCode",
-        "Address",
-        "Phone",
-    ]
+# =========================
+# SCD TYPE 2 (dimensions)
+# =========================
+def normalize_ids(values):
+    """
+    ids sources comparables entre l'extraction et le DW (1, 1.0 et "1" -> "1").
+    normalisation faite sur les valeurs distinctes seulement.
+    """
+    values = pd.Series(values)
+    codes, uniques = pd.factorize(values)
+    uniques = pd.Series(uniques, dtype=object)
 
-    dim_cust = pd.concat([cust_a[cols], cust_s[cols]], ignore_index=True).drop_duplicates()
-    dim_cust.insert(0, "customer_key", range(1, len(dim_cust) + 1))
-    return dim_cust
+    num = pd.to_numeric(uniques, errors="coerce")
+    norm = uniques.astype(str)
+    is_int = num.notna() & (num % 1 == 0)
+    norm[is_int] = num[is_int].astype("int64").astype(str)
 
+    out = norm.to_numpy(dtype=object)[codes] if len(norm) else codes.astype(object)
+    out[codes == -1] = None
+    return pd.Series(out, index=values.index)
 
-def build_dim_date(start="1996-01-01", end="2030-12-31"):
-    dates = pd.date_range(start=start, end=end, freq="D")
-    dim_date = pd.DataFrame({"date": dates})
 
-    dim_date["date_key"] = dim_date["date"].dt.strftime("%Y%m%d").astype(int)
-    dim_date["year"] = dim_date["date"].dt.year
-    dim_date["month"] = dim_date["date"].dt.month
-    dim_date["day"] = dim_date["date"].dt.day
-    dim_date["month_name"] = dim_date["date"].dt.month_name()
-    dim_date["day_of_week"] = dim_date["date"].dt.day_name()
-    dim_date["is_weekend"] = dim_date["day_of_week"].isin(["Saturday", "Sunday"])
+def attributes_hash(df, tracked_cols):
+    """
+    hash 64 bits des attributs suivis, calculé sur toute la colonne d'un coup
+    """
+    values = df[tracked_cols].astype("string").fillna("")
+    hashed = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    # int64 signé pour tenir dans un INTEGER sqlite
+    return pd.Series(hashed.view("int64"), index=df.index)
 
-    return dim_date[
-        ["date_key", "date", "year", "month", "day", "month_name", "day_of_week", "is_weekend"]
-    ]
+
+def scd2_merge(incoming, existing, key_col, natural_cols, tracked_cols, load_date):
+    """
+    SCD type 2 : compare les hash des attributs suivis avec la version courante du DW.
+    - membre inconnu     -> nouvelle clé, valide depuis SCD_BEGIN
+    - hash identique     -> rien (la clé existante est gardée)
+    - hash différent     -> version courante fermée à load_date + nouvelle version
+    renvoie (dimension complète, lignes à upsert)
+    """
+    incoming = incoming.drop(columns=[key_col], errors="ignore")
+    incoming = incoming.drop_duplicates(subset=natural_cols, keep="last").reset_index(drop=True)
+    incoming["row_hash"] = attributes_hash(incoming, tracked_cols)
+
+    if existing.empty:
+        dim = incoming.copy()
+        dim.insert(0, key_col, range(1, len(dim) + 1))
+        dim["valid_from"] = SCD_BEGIN
+        dim["valid_to"] = SCD_END
+        dim["is_current"] = 1
+        return dim, dim
+
+    existing = existing.copy()
+    if "row_hash" not in existing.columns:
+        # DW construit avant le SCD : une seule version par membre
+        existing["row_hash"] = attributes_hash(existing, tracked_cols)
+        existing["valid_from"] = SCD_BEGIN
+        existing["valid_to"] = SCD_END
+        existing["is_current"] = 1
+
+    current = existing[existing["is_current"] == 1]
+
+    left = incoming[natural_cols].copy()
+    right = current[natural_cols + [key_col, "row_hash"]].rename(columns={"row_hash": "old_hash"})
+    for col in natural_cols:
+        left[col] = normalize_ids(left[col]).to_numpy()
+        right[col] = normalize_ids(right[col]).to_numpy()
+    matched = left.merge(right, how="left", on=natural_cols)
+
+    old_key = pd.Series(matched[key_col].to_numpy(), index=incoming.index)
+    old_hash = pd.Series(matched["old_hash"].to_numpy(), index=incoming.index)
+
+    is_new = old_key.isna()
+    is_changed = ~is_new & (old_hash != incoming["row_hash"])
+
+    # fermeture des versions courantes modifiées
+    closed_keys = old_key[is_changed].astype("int64")
+    closing = existing[key_col].isin(closed_keys)
+    existing.loc[closing, "valid_to"] = load_date
+    existing.loc[closing, "is_current"] = 0
+
+    # nouvelles versions / nouveaux membres
+    next_key = int(existing[key_col].max()) + 1
+    added = incoming[is_new | is_changed].copy()
+    added.insert(0, key_col, range(next_key, next_key + len(added)))
+    added["valid_from"] = load_date
+    added.loc[is_new[added.index], "valid_from"] = SCD_BEGIN
+    added["valid_to"] = SCD_END
+    added["is_current"] = 1
+
+    dim = pd.concat([existing[added.columns], added], ignore_index=True)
+    changed = pd.concat([existing.loc[closing, added.columns], added], ignore_index=True)
+    return dim, changed
+
+
+def build_scd_dims(access_data, sql_data, conn, load_date):
+    """
+    dim_employee / dim_customer versionnées contre les dimensions déjà dans le DW
+    """
+    dim_emp, emp_changed = scd2_merge(
+        build_dim_employee(access_data, sql_data),
+        warehouse.read_table(conn, "dim_employee"),
+        "employee_key",
+        ["source_system", "employee_id_source"],
+        EMPLOYEE_TRACKED,
+        load_date,
+    )
+    dim_cust, cust_changed = scd2_merge(
+        build_dim_customer(access_data, sql_data),
+        warehouse.read_table(conn, "dim_customer"),
+        "customer_key",
+        ["source_system", "customer_id_source"],
+        CUSTOMER_TRACKED,
+        load_date,
+    )
+    return dim_emp, emp_changed, dim_cust, cust_changed
 
 
 # =========================
 # TRANSFORM (fact)
 # =========================
-def build_fact_orders(access_data, sql_data, dim_emp, dim_cust, dim_date):
-    ord_a = access_data["orders"].copy()
-    ord_a["source_system"] = "access"
+def to_dates(values):
+    """
+    colonne -> datetime64 en bloc. les textes sont lus en ISO 8601 (dates et
+    dates-heures mélangées), le reste au cas par cas ; NaT si illisible.
+    """
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    d = pd.to_datetime(values, errors="coerce", format="ISO8601")
+    bad = d.isna() & values.notna()
+    if bad.any():
+        d[bad] = pd.to_datetime(values[bad], errors="coerce", format="mixed")
+    return d
 
-    if "OrderID" in ord_a.columns:
-        order_id_col_a = "OrderID"
-    elif "Order ID" in ord_a.columns:
-        order_id_col_a = "Order ID"
-    else:
-        raise KeyError("pas de orderid/order id trouvée dans orders (access)")
 
-    if "EmployeeID" in ord_a.columns:
-        emp_id_col_a = "EmployeeID"
-    elif "Employee ID" in ord_a.columns:
-        emp_id_col_a = "Employee ID"
-    else:
-        emp_id_col_a = None
+def dates_to_keys(values, dim_date):
+    """
+    dates -> date_key yyyymmdd calculé directement (year*10000 + month*100 + day).
+    <NA> si la date est vide ou hors de dim_date.
+    """
+    d = to_dates(values).dt.normalize()
+    keys = (d.dt.year * 10000 + d.dt.month * 100 + d.dt.day).astype("Int64")
+    return keys.where(keys.isin(dim_date["date_key"]))
 
-    if "CustomerID" in ord_a.columns:
-        cust_id_col_a = "CustomerID"
-    elif "Customer ID" in ord_a.columns:
-        cust_id_col_a = "Customer ID"
-    else:
-        cust_id_col_a = None
 
-    if "OrderDate" in ord_a.columns:
-        order_date_col_a = "OrderDate"
-    elif "Order Date" in ord_a.columns:
-        order_date_col_a = "Order Date"
+def key_lookup(dim, dim_id_col, key_col):
+    """
+    correspondance (source_system, id source) -> clé de la dimension, préparée une fois
+    par run : dédoublonnée (ou toutes les versions si la dimension est en SCD 2), avec
+    une copie aux ids normalisés (normalize_ids) pour les ids de types mélangés
+    """
+    natural = ["source_system", dim_id_col]
+    # ids relus du DW (texte) et ids d'une nouvelle version (int) : comparés normalisés
+    normalized = dim[natural].assign(**{dim_id_col: normalize_ids(dim[dim_id_col]).to_numpy()})
+    versioned = "valid_from" in dim.columns and normalized.duplicated().any()
+    if versioned:
+        table = dim[natural + [key_col, "valid_from", "valid_to", "is_current"]].assign(
+            valid_from=pd.to_datetime(dim["valid_from"]),
+            valid_to=pd.to_datetime(dim["valid_to"]),
+        )
     else:
-        order_date_col_a = None
+        table = dim[natural + [key_col]].drop_duplicates(subset=natural)
+    return {
+        "id_col": dim_id_col,
+        "key_col": key_col,
+        "versioned": versioned,
+        "table": table,
+        "normalized": table.assign(**{dim_id_col: normalize_ids(table[dim_id_col]).to_numpy()}),
+    }
 
-    if "ShippedDate" in ord_a.columns:
-        ship_date_col_a = "ShippedDate"
-    elif "Shipped Date" in ord_a.columns:
-        ship_date_col_a = "Shipped Date"
-    else:
-        ship_date_col_a = None
-
-    rename_a = {order_id_col_a: "order_id_source"}
-    if emp_id_col_a:
-        rename_a[emp_id_col_a] = "EmployeeID"
-    if cust_id_col_a:
-        rename_a[cust_id_col_a] = "CustomerID"
-    if order_date_col_a:
-        rename_a[order_date_col_a] = "OrderDate"
-    if ship_date_col_a:
-        rename_a[ship_date_col_a] = "ShippedDate"
-
-    ord_a = ord_a.rename(columns=rename_a)
-
-    for col in ["order_id_source", "EmployeeID", "CustomerID", "OrderDate", "ShippedDate"]:
-        if col not in ord_a.columns:
-            ord_a[col] = None
-
-    ord_s = sql_data["orders"].copy()
-    ord_s["source_system"] = "sqlserver"
-
-    if "OrderID" not in ord_s.columns:
-        raise KeyError("pas de orderid trouvée dans orders (sql server)")
-
-    ord_s["order_id_source"] = ord_s["OrderID"]
-
-    for col in ["EmployeeID", "CustomerID", "OrderDate", "ShippedDate"]:
-        if col not in ord_s.columns:
-            ord_s[col] = None
-
-    common_cols = [
-        "source_system",
-        "order_id_source",
-        "EmployeeID",
-        "CustomerID",
-        "OrderDate",
-        "ShippedDate",
-    ]
 
-    orders = pd.concat([ord_a[common_cols], ord_s[common_cols]], ignore_index=True)
+def lookup_side(orders, id_col, lookup):
+    """
+    (ids des commandes, table de correspondance) comparables entre eux
+    """
+    left = orders[["source_system", id_col]].copy()
+    table = lookup["table"]
+    # ids access (int) et sql server (texte) mélangés, ou relus du DW en texte
+    if left[id_col].dtype != table[lookup["id_col"]].dtype or left[id_col].dtype == object:
+        left[id_col] = normalize_ids(left[id_col]).to_numpy()
+        table = lookup["normalized"]
+    return left, table
 
-    dim_date_index = dim_date.set_index("date")
 
-    def date_to_key(d):
-        if pd.isna(d):
-            return None
-        d2 = pd.to_datetime(d).normalize()
-        try:
-            return int(dim_date_index.loc[d2, "date_key"])
-        except KeyError:
-            return None
+def lookup_keys(orders, id_col, lookup, date_col=None):
+    """
+    (source_system, id source) -> clé de substitution via un merge sur toute la colonne.
+    si la dimension est versionnée (SCD 2), prend la version valide à date_col.
+    <NA> si l'id n'existe pas dans la dimension.
+    """
+    if lookup["versioned"]:
+        return lookup_versioned_keys(orders, id_col, lookup, date_col)
+
+    left, table = lookup_side(orders, id_col, lookup)
+    merged = left.merge(
+        table,
+        how="left",
+        left_on=["source_system", id_col],
+        right_on=["source_system", lookup["id_col"]],
+    )
+    return pd.Series(merged[lookup["key_col"]].to_numpy(), index=orders.index).astype("Int64")
 
-    orders["order_date_key"] = orders["OrderDate"].apply(date_to_key)
-    orders["ship_date_key"] = orders["ShippedDate"].apply(date_to_key)
 
-    emp_map = dim_emp.set_index(["source_system", "employee_id_source"])["employee_key"]
+def lookup_versioned_keys(orders, id_col, lookup, date_col):
+    """
+    lookup point-in-time : valid_from <= date < valid_to, version courante si pas de date
+    """
+    left, versions = lookup_side(orders, id_col, lookup)
+    left["_row"] = range(len(left))
+    left["_date"] = to_dates(orders[date_col]).to_numpy() if date_col else pd.NaT
+
+    merged = left.merge(
+        versions,
+        how="inner",
+        left_on=["source_system", id_col],
+        right_on=["source_system", lookup["id_col"]],
+    )
+    in_range = (merged["_date"] >= merged["valid_from"]) & (merged["_date"] < merged["valid_to"])
+    no_date = merged["_date"].isna() & (merged["is_current"] == 1)
+    merged = merged[in_range | no_date].drop_duplicates(subset="_row")
 
-    def map_emp(row):
-        return emp_map.get((row["source_system"], row["EmployeeID"]), None)
+    keys = pd.Series(pd.NA, index=range(len(left)), dtype="Int64")
+    keys[merged["_row"].to_numpy()] = merged[lookup["key_col"]].to_numpy()
+    return pd.Series(keys.to_numpy(), index=orders.index, dtype="Int64")
 
-    orders["employee_key"] = orders.apply(map_emp, axis=1)
 
-    cust_map = dim_cust.set_index(["source_system", "customer_id_source"])["customer_key"]
+def stack_orders(access_data, sql_data):
+    """
+    commandes access + sql server renommées (source_mapping) et empilées
+    """
+    return pd.concat(
+        [
+            map_columns(access_data["orders"], "access", "orders"),
+            map_columns(sql_data["orders"], "sqlserver", "orders"),
+        ],
+        ignore_index=True,
+    )
 
-    def map_cust(row):
-        return cust_map.get((row["source_system"], row["CustomerID"]), None)
 
-    orders["customer_key"] = orders.apply(map_cust, axis=1)
+def key_lookups(dim_emp, dim_cust, dim_date):
+    """
+    correspondances des trois dimensions de fact_orders, préparées une fois
+    """
+    return {
+        "dim_date": dim_date[["date_key"]],
+        "employee": key_lookup(dim_emp, "employee_id_source", "employee_key"),
+        "customer": key_lookup(dim_cust, "customer_id_source", "customer_key"),
+    }
+
+
+def apply_lookups(orders, lookups):
+    """
+    ajoute les clés date / employé / client à orders
+    """
+    # résolution des clés en bloc (colonnes entières, pas de apply ligne par ligne)
+    orders["order_date_key"] = dates_to_keys(orders["OrderDate"], lookups["dim_date"])
+    orders["ship_date_key"] = dates_to_keys(orders["ShippedDate"], lookups["dim_date"])
+    orders["employee_key"] = lookup_keys(orders, "EmployeeID", lookups["employee"], date_col="OrderDate")
+    orders["customer_key"] = lookup_keys(orders, "CustomerID", lookups["customer"], date_col="OrderDate")
+    return orders
+
+
+def resolve_keys(orders, dim_emp, dim_cust, dim_date):
+    return apply_lookups(orders, key_lookups(dim_emp, dim_cust, dim_date))
+
 
+FACT_COLUMNS = [
+    "source_system",
+    "order_id_source",
+    "customer_key",
+    "employee_key",
+    "order_date_key",
+    "ship_date_key",
+    "nb_commandes_livrees",
+    "nb_commandes_non_livrees",
+]
+
+
+def resolve_keys_parallel(orders, dim_emp, dim_cust, dim_date, workers):
+    """
+    resolve_keys par partition (source_system, année de commande) sur un pool de
+    processus ; même résultat que resolve_keys, temps par partition affichés
+    """
+    t0 = time.perf_counter()
+    years = to_dates(orders["OrderDate"]).dt.year.fillna(-1).astype("int64")
+    # correspondances préparées ici une seule fois, envoyées une fois à chaque processus
+    lookups = key_lookups(dim_emp, dim_cust, dim_date)
+    orders, timings = resolve_in_pool(orders, years, apply_lookups, (lookups,), workers)
+    print_partition_timings(timings, time.perf_counter() - t0)
+    return orders
+
+
+def build_order_lines(access_data, sql_data, dim_emp, dim_cust, dim_date, workers=DEFAULT_TRANSFORM_WORKERS):
+    """
+    commandes avec ids sources, clés résolues et mesures : entrée du contrôle qualité.
+    workers > 1 : résolution des clés en parallèle (resolve_keys_parallel)
+    """
+    orders = stack_orders(access_data, sql_data)
+    if workers > 1:
+        orders = resolve_keys_parallel(orders, dim_emp, dim_cust, dim_date, workers)
+    else:
+        orders = resolve_keys(orders, dim_emp, dim_cust, dim_date)
+    return add_measures(orders)
+
+
+def add_measures(orders):
     orders["nb_commandes_livrees"] = orders["ShippedDate"].notna().astype(int)
     orders["nb_commandes_non_livrees"] = orders["ShippedDate"].isna().astype(int)
+    return orders
 
-    fact = orders[
-        [
-            "source_system",
-            "order_id_source",
-            "customer_key",
-            "employee_key",
-            "order_date_key",
-            "ship_date_key",
-            "nb_commandes_livrees",
-            "nb_commandes_non_livrees",
-        ]
-    ].copy()
-
-    fact.insert(0, "fact_order_key", range(1, len(fact) + 1))
+
+def fact_from_orders(orders, first_key=1):
+    fact = orders[FACT_COLUMNS].reset_index(drop=True)
+    fact.insert(0, "fact_order_key", range(first_key, first_key + len(fact)))
     return fact
 
 
+def build_fact_orders(access_data, sql_data, dim_emp, dim_cust, dim_date):
+    """
+    fact_orders sans contrôle qualité (benchmarks)
+    """
+    return fact_from_orders(build_order_lines(access_data, sql_data, dim_emp, dim_cust, dim_date))
+
+
+def validate_fact(run, orders):
+    """
+    étape validate : contrôle qualité des commandes -> (fact_orders, quarantaine)
+    """
+    with run.step("validate", rows_in=orders) as step:
+        valid, quarantine, report = quality.validate_orders(orders)
+        fact = fact_from_orders(valid)
+        step.set_rows(rows_out=fact)
+        quality.print_report(report, len(orders))
+    if len(quarantine):
+        print(f"  {len(quarantine)} commandes en quarantaine (table {warehouse.QUARANTINE_TABLE} du DW)")
+    return fact, quarantine
+
+
 
 # =========================
 # LOAD
 # =========================
-def load_processed_dims(dim_emp, dim_cust, dim_date):
+def load_processed_dims(dim_emp, dim_cust, dim_date, formats=("csv",), date_changed=True):
+    """
+    data/processed : dimensions (csv et/ou parquet).
+    dim_date n'est réécrite que si elle a changé (ou si le fichier manque).
     """
-    data/processed : dimensions
+    dims = {"dim_employee": dim_emp, "dim_customer": dim_cust, "dim_date": dim_date}
+    for name, dim in dims.items():
+        for fmt in formats:
+            output_file = PROCESSED_DIR / f"{name}.{fmt}"
+            if name == "dim_date" and not date_changed and output_file.exists():
+                continue
+            if fmt == "csv":
+                dim.to_csv(output_file, index=False)
+            else:
+                columnar.write_parquet(dim, output_file)
+
+
+def load_final_fact_and_files(
+    dim_emp, dim_cust, dim_date, fact_orders, formats=("csv",), targets=DEFAULT_OUTPUTS, quarantine=None
+):
     """
-    dim_emp.to_csv(PROCESSED_DIR / "dim_employee.csv", index=False)
-    dim_cust.to_csv(PROCESSED_DIR / "dim_customer.csv", index=False)
-    dim_date.to_csv(PROCESSED_DIR / "dim_date.csv", index=False)
+    data/final : fact_orders + sqlite (+ excel si demandé).
+    le DW reçoit aussi watermarks, agrégats, quarantaine et une nouvelle version de chargement.
+    affiche le temps de chaque sortie.
+    """
+    timings = {}
+
+    if "files" in targets:
+        # fact en CSV dans final
+        if "csv" in formats:
+            t0 = time.perf_counter()
+            fact_orders.to_csv(FINAL_DIR / "fact_orders.csv", index=False)
+            timings["csv"] = time.perf_counter() - t0
+
+        # fact en parquet partitionné par année / mois de commande
+        if "parquet" in formats:
+            t0 = time.perf_counter()
+            columnar.write_fact_partitioned(fact_orders, FACT_PARQUET_DIR)
+            timings["parquet"] = time.perf_counter() - t0
+
+    # excel (dans final) : écriture en flux, feuilles découpées au-delà de la limite excel
+    if "excel" in targets:
+        t0 = time.perf_counter()
+        excel_export.write_excel(
+            {
+                "dim_employee": dim_emp,
+                "dim_customer": dim_cust,
+                "dim_date": dim_date,
+                "fact_orders": fact_orders,
+            },
+            EXCEL_OUTPUT,
+        )
+        timings["excel"] = time.perf_counter() - t0
+
+    # sqlite : schéma typé, clés primaires et index (warehouse.STAR_SCHEMA).
+    # dim_date est déjà à jour dans le DW (ensure_dim_date)
+    t0 = time.perf_counter()
+    conn = sqlite3.connect(DW_DB_PATH)
+    warehouse.load_star_schema(
+        conn,
+        {
+            "dim_employee": dim_emp,
+            "dim_customer": dim_cust,
+            "fact_orders": fact_orders,
+        },
+    )
+    warehouse.save_watermarks(conn)
+    warehouse.refresh_aggregates(conn)
+    if quarantine is not None:
+        warehouse.save_quarantine(conn, quarantine)
+
+    # en dernier : le dashboard bascule sur cette version
+    warehouse.record_load_version(conn, "full", len(fact_orders))
+    conn.close()
+    timings["sqlite"] = time.perf_counter() - t0
+
+    # duckdb : copie du DW une fois la nouvelle version enregistrée
+    # (une copie déjà présente est toujours rafraîchie : le dashboard la lit peut-être)
+    if "duckdb" in targets or DUCKDB_PATH.exists():
+        t0 = time.perf_counter()
+        duckdb_store.export_from_sqlite(DW_DB_PATH, DUCKDB_PATH)
+        timings["duckdb"] = time.perf_counter() - t0
+
+    print_output_timings(timings)
 
 
-def load_final_fact_and_files(dim_emp, dim_cust, dim_date, fact_orders):
+def print_output_timings(timings):
+    print("temps par sortie :")
+    for name, seconds in timings.items():
+        print(f"  {name:<10} {seconds:7.2f} s")
+
+
+# =========================
+# INCREMENTAL
+# =========================
+def assign_stable_keys(df, existing, key_col, natural_cols, next_key=None):
     """
-    data/final : fact_orders + sqlite + excel
+    garde la clé de substitution déjà attribuée dans le DW (par clé naturelle),
+    les nouveaux membres prennent max(clé) + 1, + 2...
     """
-    # fact en CSV dans final
-    fact_orders.to_csv(FINAL_DIR / "fact_orders.csv", index=False)
+    df = df.drop(columns=[key_col], errors="ignore").drop_duplicates(subset=natural_cols)
 
-    # excel (dans final)
-    with pd.ExcelWriter(EXCEL_OUTPUT, engine="openpyxl") as writer:
-        dim_emp.to_excel(writer, sheet_name="dim_employee", index=False)
-        dim_cust.to_excel(writer, sheet_name="dim_customer", index=False)
-        dim_date.to_excel(writer, sheet_name="dim_date", index=False)
-        fact_orders.to_excel(writer, sheet_name="fact_orders", index=False)
+    if existing.empty:
+        known = pd.DataFrame(columns=natural_cols + [key_col])
+    else:
+        known = existing[natural_cols + [key_col]].drop_duplicates(subset=natural_cols)
 
-  
-    conn = sqlite3.connect(DW_DB_PATH)
-    dim_emp.to_sql("dim_employee", conn, if_exists="replace", index=False)
-    dim_cust.to_sql("dim_customer", conn, if_exists="replace", index=False)
-    dim_date.to_sql("dim_date", conn, if_exists="replace", index=False)
-    fact_orders.to_sql("fact_orders", conn, if_exists="replace", index=False)
-    conn.close()
+    if next_key is None:
+        next_key = int(known[key_col].max()) + 1 if len(known) else 1
 
+    left = df[natural_cols].copy()
+    right = known.copy()
+    for col in natural_cols:
+        left[col] = normalize_ids(left[col]).to_numpy()
+        right[col] = normalize_ids(right[col]).to_numpy()
+
+    merged = left.merge(right, how="left", on=natural_cols)
+    keys = pd.Series(merged[key_col].to_numpy(), index=df.index).astype("Int64")
+
+    missing = keys.isna()
+    keys[missing] = range(next_key, next_key + int(missing.sum()))
+
+    df.insert(0, key_col, keys.astype("int64"))
+    return df
+
+
+def run_incremental(
+    run,
+    checkpoints,
+    workers=DEFAULT_WORKERS,
+    formats=("csv",),
+    changed=None,
+    transform_workers=DEFAULT_TRANSFORM_WORKERS,
+    fingerprints=None,
+):
+    """
+    extraction des commandes au-delà du watermark de chaque source,
+    upsert dans fact_orders et les dimensions (clés existantes conservées).
+    changed : tables sources modifiées (check_sources) ; si orders n'a pas bougé
+    dans une source, ses commandes non livrées ne sont pas ré-extraites.
+    fingerprints : empreintes des sources (check_sources), entrée de l'étape extract.
+    """
+    conn = sqlite3.connect(DW_DB_PATH)
+    watermarks = warehouse.read_watermarks(conn)
 
-def main():
-    print("extraction access...")
-    access_data = extract_access()
+    if not watermarks or not warehouse.table_exists(conn, "fact_orders"):
+        conn.close()
+        print("pas de watermark dans le DW -> chargement complet")
+        return False
 
-    print("extraction sql server...")
-    sql_data = extract_sqlserver()
+    access_from = warehouse.orders_from(
+        watermarks, "access", include_open=changed is None or "access.orders" in changed
+    )
+    sql_from = warehouse.orders_from(
+        watermarks, "sqlserver", include_open=changed is None or "sqlserver.orders" in changed
+    )
 
-    print("construction dimensions...")
-    dim_emp = build_dim_employee(access_data, sql_data)
-    dim_cust = build_dim_customer(access_data, sql_data)
-    dim_date = build_dim_date()
+    print(f"extraction access (orders >= {access_from}) + sql server (orders >= {sql_from})...")
+    # les entrées d'une étape : sorties des étapes précédentes + état du DW (version de chargement)
+    dw_version = warehouse.read_load_version(conn)
+
+    with run.step("extract") as step:
+        extracted = checkpoints.run(
+            "extract",
+            content_hash("incremental", access_from, sql_from, extract_inputs(fingerprints)),
+            lambda: dict(zip(("access", "sqlserver"), extract_all(access_from, sql_from, workers))),
+        )
+        access_data, sql_data = extracted["access"], extracted["sqlserver"]
+        step.set_rows(rows_out=[access_data, sql_data])
+
+    print("construction dimensions (SCD type 2)...")
+    with run.step("transform_dims") as step:
+        load_date = date.today().isoformat()
+
+        def build_dims():
+            dim_emp, emp_changed, dim_cust, cust_changed = build_scd_dims(access_data, sql_data, conn, load_date)
+            dim_date, date_changed = ensure_dim_date(conn, access_data, sql_data)
+            return dict(
+                dim_employee=dim_emp,
+                employee_changed=emp_changed,
+                dim_customer=dim_cust,
+                customer_changed=cust_changed,
+                dim_date=dim_date,
+                date_changed=date_changed,
+            )
+
+        dims = checkpoints.run(
+            "transform_dims", content_hash(checkpoints.output_hash("extract"), load_date, dw_version), build_dims
+        )
+        dim_emp, emp_changed = dims["dim_employee"], dims["employee_changed"]
+        dim_cust, cust_changed = dims["dim_customer"], dims["customer_changed"]
+        dim_date, date_changed = dims["dim_date"], dims["date_changed"]
+        step.set_rows(rows_out=[emp_changed, cust_changed])
+
+    print("construction fact_orders (delta)...")
+    with run.step("transform_fact", rows_in=[access_data["orders"], sql_data["orders"]]) as step:
+        orders = checkpoints.run(
+            "transform_fact",
+            content_hash(checkpoints.output_hash("extract"), checkpoints.output_hash("transform_dims"), dw_version),
+            lambda: dict(
+                orders=build_order_lines(access_data, sql_data, dim_emp, dim_cust, dim_date, transform_workers)
+            ),
+        )["orders"]
+        step.set_rows(rows_out=orders)
+
+    fact_delta, quarantine = validate_fact(run, orders)
+
+    print("upsert sqlite...")
+    with run.step("load_sqlite", rows_in=[emp_changed, cust_changed, fact_delta]) as step:
+        # clés des commandes déjà chargées conservées, les nouvelles à la suite
+        existing_facts = pd.read_sql(
+            "SELECT source_system, order_id_source, fact_order_key, order_date_key FROM fact_orders "
+            "WHERE (source_system = 'access' AND CAST(order_id_source AS INTEGER) >= ?) "
+            "OR (source_system = 'sqlserver' AND CAST(order_id_source AS INTEGER) >= ?)",
+            conn,
+            params=[access_from or 0, sql_from or 0],
+        )
+        next_key = conn.execute("SELECT COALESCE(MAX(fact_order_key), 0) + 1 FROM fact_orders").fetchone()[0]
+        fact_delta = assign_stable_keys(
+            fact_delta,
+            existing_facts,
+            "fact_order_key",
+            ["source_system", "order_id_source"],
+            next_key=next_key,
+        )
+
+        n_emp = warehouse.upsert(conn, "dim_employee", emp_changed, ["employee_key"])
+        n_cust = warehouse.upsert(conn, "dim_customer", cust_changed, ["customer_key"])
+        n_fact = warehouse.upsert(conn, "fact_orders", fact_delta, ["fact_order_key"])
+        # commande déjà chargée puis rejetée à la ré-extraction : elle quitte fact_orders,
+        # comme en chargement complet (ses dates sont dans existing_facts -> agrégats recalculés)
+        with conn:
+            n_rejected = warehouse.delete_orders(conn, "fact_orders", quarantine)
+        warehouse.save_quarantine(conn, quarantine, batch=orders)
+        warehouse.save_watermarks(conn)
+
+        # agrégats : seuls les jours / mois touchés (anciennes et nouvelles dates de commande)
+        changed_dates = pd.concat([existing_facts["order_date_key"], fact_delta["order_date_key"]])
+        warehouse.refresh_aggregates(conn, changed_dates.dropna().unique())
+        warehouse.record_load_version(conn, "incremental", n_fact)
+        conn.close()
+        step.set_rows(rows_out=n_emp + n_cust + n_fact)
+
+    with run.step("load_processed", rows_in=[dim_emp, dim_cust, dim_date]) as step:
+        load_processed_dims(dim_emp, dim_cust, dim_date, formats, date_changed)
+        step.set_rows(rows_out=[dim_emp, dim_cust, dim_date])
+
+    # une copie duckdb déjà utilisée par le dashboard suit le DW
+    if DUCKDB_PATH.exists():
+        print("copie duckdb du DW...")
+        with run.step("load_duckdb") as step:
+            step.set_rows(rows_out=duckdb_store.export_from_sqlite(DW_DB_PATH, DUCKDB_PATH))
+
+    print("\n ETL incrémental terminé")
+    print(f"dim_employee : {n_emp} lignes upsert")
+    print(f"dim_customer : {n_cust} lignes upsert")
+    print(f"fact_orders  : {n_fact} lignes upsert")
+    print(f"quarantaine  : {len(quarantine)} commandes rejetées ({n_rejected} retirées de fact_orders)")
+    print("(fact_orders.csv et l'excel ne sont régénérés qu'en chargement complet)")
+    return True
+
+
+def run_full(
+    run,
+    checkpoints,
+    workers=DEFAULT_WORKERS,
+    formats=("csv",),
+    outputs=DEFAULT_OUTPUTS,
+    transform_workers=DEFAULT_TRANSFORM_WORKERS,
+    fingerprints=None,
+):
+    print("extraction access + sql server...")
+    with run.step("extract") as step:
+        extracted = checkpoints.run(
+            "extract",
+            content_hash("full", extract_inputs(fingerprints)),
+            lambda: dict(zip(("access", "sqlserver"), extract_all(workers=workers))),
+        )
+        access_data, sql_data = extracted["access"], extracted["sqlserver"]
+        step.set_rows(rows_out=[access_data, sql_data])
+
+    print("construction dimensions (SCD type 2)...")
+    with run.step("transform_dims") as step:
+        load_date = date.today().isoformat()
+        conn = sqlite3.connect(DW_DB_PATH)
+        dw_version = warehouse.read_load_version(conn)
+
+        def build_dims():
+            dim_emp, _, dim_cust, _ = build_scd_dims(access_data, sql_data, conn, load_date)
+            dim_date, date_changed = ensure_dim_date(conn, access_data, sql_data)
+            return dict(dim_employee=dim_emp, dim_customer=dim_cust, dim_date=dim_date, date_changed=date_changed)
+
+        dims = checkpoints.run(
+            "transform_dims", content_hash(checkpoints.output_hash("extract"), load_date, dw_version), build_dims
+        )
+        conn.close()
+        dim_emp, dim_cust = dims["dim_employee"], dims["dim_customer"]
+        dim_date, date_changed = dims["dim_date"], dims["date_changed"]
+        step.set_rows(rows_out=[dim_emp, dim_cust])
 
     print("construction fact_orders...")
-    fact_orders = build_fact_orders(access_data, sql_data, dim_emp, dim_cust, dim_date)
+    with run.step("transform_fact", rows_in=[access_data["orders"], sql_data["orders"]]) as step:
+        orders = checkpoints.run(
+            "transform_fact",
+            content_hash(checkpoints.output_hash("extract"), checkpoints.output_hash("transform_dims")),
+            lambda: dict(
+                orders=build_order_lines(access_data, sql_data, dim_emp, dim_cust, dim_date, transform_workers)
+            ),
+        )["orders"]
+        step.set_rows(rows_out=orders)
+
+    fact_orders, quarantine = validate_fact(run, orders)
 
     print("load processed (dimensions)...")
-    load_processed_dims(dim_emp, dim_cust, dim_date)
+    with run.step("load_processed", rows_in=[dim_emp, dim_cust, dim_date]) as step:
+        load_processed_dims(dim_emp, dim_cust, dim_date, formats, date_changed)
+        step.set_rows(rows_out=[dim_emp, dim_cust, dim_date])
 
-    print("load final (fact + sqlite + excel)...")
-    load_final_fact_and_files(dim_emp, dim_cust, dim_date, fact_orders)
+    print(f"load final (sqlite + {' + '.join(outputs)})...")
+    with run.step("load_final", rows_in=fact_orders) as step:
+        load_final_fact_and_files(dim_emp, dim_cust, dim_date, fact_orders, formats, outputs, quarantine)
+        step.set_rows(rows_out=fact_orders)
 
     print("\n ETL terminé")
     print(f"PROCESSED-> {PROCESSED_DIR.resolve()}")
     print(f"FINAL    -> {FINAL_DIR.resolve()}")
     print(f"SQLite   -> {DW_DB_PATH.resolve()}")
-    print(f"Excel    -> {EXCEL_OUTPUT.resolve()}")
+    if "excel" in outputs:
+        print(f"Excel    -> {EXCEL_OUTPUT.resolve()}")
+    if DUCKDB_PATH.exists():
+        print(f"DuckDB   -> {DUCKDB_PATH.resolve()}")
+
+
+# =========================
+# CHARGEMENT PAR BLOCS (fact_orders hors mémoire)
+# =========================
+# les commandes ne sont jamais chargées en entier : elles passent du curseur de la source
+# au DW par blocs de chunk_rows lignes (renommage, clés, contrôle qualité, ajout).
+# pic mémoire : un bloc + les dimensions et leurs correspondances.
+DEFAULT_CHUNK_ROWS = 200_000
+FACT_KEY_COLUMNS = ["customer_key", "employee_key", "order_date_key", "ship_date_key"]
+
+
+def orders_columns(cnx, source):
+    """
+    correspondance des colonnes de Orders, résolue une fois pour le schéma de la source
+    """
+    return resolve_columns(source, "orders", table_columns(cnx, "Orders"))
+
+
+def source_order_dates(cnx, source):
+    """
+    dates de commande / livraison extrêmes de la source : MIN / MAX calculés
+    côté serveur, sans lire les commandes
+    """
+    resolved = orders_columns(cnx, source)
+    cols = [resolved[c] for c in ("OrderDate", "ShippedDate") if resolved[c]]
+    if not cols:
+        return pd.Series(dtype="datetime64[ns]")
+    cursor = cnx.cursor()
+    cursor.execute("SELECT " + ", ".join(f"MIN([{c}]), MAX([{c}])" for c in cols) + " FROM Orders")
+    row = cursor.fetchone()
+    cursor.close()
+    return to_dates(pd.Series(list(row), dtype=object)).dropna()
+
+
+def source_dates(workers=DEFAULT_WORKERS):
+    results, _ = run_tasks(
+        [
+            ("access", conn_access, lambda cnx: source_order_dates(cnx, "access")),
+            ("sqlserver", conn_sqlserver, lambda cnx: source_order_dates(cnx, "sqlserver")),
+        ],
+        workers,
+    )
+    return pd.concat(list(results.values()))
+
+
+def iter_orders(connect, source, chunk_rows):
+    """
+    Orders d'une source par blocs de chunk_rows lignes lus au fil du curseur
+    (seules les colonnes utiles), renommés avec la correspondance résolue une fois
+    """
+    cnx = connect()
+    try:
+        resolved = orders_columns(cnx, source)
+        for chunk in pd.read_sql(f"SELECT {select_list(resolved)} FROM Orders", cnx, chunksize=chunk_rows):
+            yield map_columns(chunk, source, "orders", resolved)
+    finally:
+        cnx.close()
+
+
+def load_fact_chunked(conn, dim_emp, dim_cust, dim_date, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    fact_orders (et la quarantaine) rechargées dans le DW bloc par bloc.
+    renvoie (commandes lues, commandes chargées, rapport qualité cumulé)
+    """
+    lookups = key_lookups(dim_emp, dim_cust, dim_date)
+    # doublons : dans le bloc (quality.order_duplicated) et avec les blocs déjà chargés
+    checks = quality.with_loaded_orders(lambda orders: warehouse.loaded_orders(conn, orders))
+
+    warehouse.create_star_tables(conn, ["fact_orders"])
+    warehouse.create_quarantine(conn)
+    with conn:
+        conn.execute(f"DELETE FROM {warehouse.QUARANTINE_TABLE}")
+
+    n_read = n_loaded = 0
+    total = {}
+    with warehouse.bulk_load(conn):
+        for source, connect in (("access", conn_access), ("sqlserver", conn_sqlserver)):
+            for n, orders in enumerate(iter_orders(connect, source, chunk_rows), start=1):
+                t0 = time.perf_counter()
+                orders = add_measures(apply_lookups(orders, lookups))
+                valid, quarantine, report = quality.validate_orders(orders, checks)
+                fact = fact_from_orders(valid, first_key=n_loaded + 1)
+                with conn:
+                    fact.to_sql("fact_orders", conn, if_exists="append", index=False)
+                warehouse.save_quarantine(conn, quarantine, append=True)
+
+                n_read += len(orders)
+                n_loaded += len(fact)
+                for code, (n_bad, seconds) in report.items():
+                    before = total.get(code, (0, 0.0))
+                    total[code] = (before[0] + n_bad, before[1] + seconds)
+                print(
+                    f"  {source:<10} bloc {n:<5} {len(orders):>9} commandes {len(quarantine):>7} rejetées"
+                    f" {time.perf_counter() - t0:7.2f} s"
+                )
+        warehouse.create_star_indexes(conn, ["fact_orders"])
+    return n_read, n_loaded, total
+
+
+def read_fact_chunks(chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    fact_orders relue du DW par blocs, clés vides en <NA> comme dans le chemin en mémoire
+    """
+    conn = sqlite3.connect(DW_DB_PATH)
+    try:
+        for chunk in pd.read_sql("SELECT * FROM fact_orders ORDER BY fact_order_key", conn, chunksize=chunk_rows):
+            yield chunk.astype({col: "Int64" for col in FACT_KEY_COLUMNS})
+    finally:
+        conn.close()
+
+
+def load_final_files_chunked(
+    dim_emp, dim_cust, dim_date, formats=("csv",), targets=DEFAULT_OUTPUTS, chunk_rows=DEFAULT_CHUNK_ROWS
+):
+    """
+    data/final (+ copie duckdb) depuis fact_orders déjà chargée dans le DW, relue par blocs
+    """
+    timings = {}
+
+    if "files" in targets:
+        if "csv" in formats:
+            t0 = time.perf_counter()
+            output_file = FINAL_DIR / "fact_orders.csv"
+            for n, chunk in enumerate(read_fact_chunks(chunk_rows)):
+                chunk.to_csv(output_file, index=False, mode="w" if n == 0 else "a", header=n == 0)
+            timings["csv"] = time.perf_counter() - t0
+
+        if "parquet" in formats:
+            t0 = time.perf_counter()
+            columnar.write_fact_partitioned_chunks(read_fact_chunks(chunk_rows), FACT_PARQUET_DIR)
+            timings["parquet"] = time.perf_counter() - t0
+
+    if "excel" in targets:
+        t0 = time.perf_counter()
+        excel_export.write_excel(
+            {
+                "dim_employee": dim_emp,
+                "dim_customer": dim_cust,
+                "dim_date": dim_date,
+                "fact_orders": read_fact_chunks(chunk_rows),
+            },
+            EXCEL_OUTPUT,
+        )
+        timings["excel"] = time.perf_counter() - t0
+
+    if "duckdb" in targets or DUCKDB_PATH.exists():
+        t0 = time.perf_counter()
+        duckdb_store.export_from_sqlite(DW_DB_PATH, DUCKDB_PATH)
+        timings["duckdb"] = time.perf_counter() - t0
+
+    print_output_timings(timings)
+
+
+def run_chunked(
+    run,
+    checkpoints,
+    workers=DEFAULT_WORKERS,
+    formats=("csv",),
+    outputs=DEFAULT_OUTPUTS,
+    chunk_rows=DEFAULT_CHUNK_ROWS,
+    fingerprints=None,
+):
+    """
+    chargement complet par blocs : seules les tables des dimensions sont extraites
+    en entier, Orders est lue bloc par bloc pendant le chargement de fact_orders
+    """
+    print("extraction access + sql server (sans Orders)...")
+    with run.step("extract") as step:
+        extracted = checkpoints.run(
+            "extract",
+            content_hash("chunked", extract_inputs(fingerprints, with_orders=False)),
+            lambda: dict(zip(("access", "sqlserver"), extract_all(workers=workers, with_orders=False))),
+        )
+        access_data, sql_data = extracted["access"], extracted["sqlserver"]
+        step.set_rows(rows_out=[access_data, sql_data])
+
+    print("construction dimensions (SCD type 2)...")
+    with run.step("transform_dims") as step:
+        load_date = date.today().isoformat()
+        conn = sqlite3.connect(DW_DB_PATH)
+        dw_version = warehouse.read_load_version(conn)
+        # plage de dim_date : dates extrêmes des commandes, sans les lire
+        dates = source_dates(workers)
+
+        def build_dims():
+            dim_emp, _, dim_cust, _ = build_scd_dims(access_data, sql_data, conn, load_date)
+            dim_date, date_changed = extend_dim_date(conn, dates)
+            return dict(dim_employee=dim_emp, dim_customer=dim_cust, dim_date=dim_date, date_changed=date_changed)
+
+        dims = checkpoints.run(
+            "transform_dims",
+            content_hash(checkpoints.output_hash("extract"), load_date, dw_version, dates.min(), dates.max()),
+            build_dims,
+        )
+        conn.close()
+        dim_emp, dim_cust = dims["dim_employee"], dims["dim_customer"]
+        dim_date, date_changed = dims["dim_date"], dims["date_changed"]
+        step.set_rows(rows_out=[dim_emp, dim_cust])
+
+    print(f"chargement fact_orders par blocs de {chunk_rows} commandes...")
+    with run.step("load_fact") as step:
+        conn = sqlite3.connect(DW_DB_PATH)
+        warehouse.load_star_schema(conn, {"dim_employee": dim_emp, "dim_customer": dim_cust})
+        n_read, n_loaded, report = load_fact_chunked(conn, dim_emp, dim_cust, dim_date, chunk_rows)
+        warehouse.save_watermarks(conn)
+        warehouse.refresh_aggregates(conn)
+        # en dernier : le dashboard bascule sur cette version
+        warehouse.record_load_version(conn, "full", n_loaded)
+        conn.close()
+        step.set_rows(rows_in=n_read, rows_out=n_loaded)
+    quality.print_report(report, n_read)
+    if n_read > n_loaded:
+        print(f"  {n_read - n_loaded} commandes en quarantaine (table {warehouse.QUARANTINE_TABLE} du DW)")
+
+    print("load processed (dimensions)...")
+    with run.step("load_processed", rows_in=[dim_emp, dim_cust, dim_date]) as step:
+        load_processed_dims(dim_emp, dim_cust, dim_date, formats, date_changed)
+        step.set_rows(rows_out=[dim_emp, dim_cust, dim_date])
+
+    print(f"load final ({' + '.join(outputs)})...")
+    with run.step("load_final", rows_in=n_loaded) as step:
+        load_final_files_chunked(dim_emp, dim_cust, dim_date, formats, outputs, chunk_rows)
+        step.set_rows(rows_out=n_loaded)
+
+    print("\n ETL terminé (par blocs)")
+    print(f"PROCESSED-> {PROCESSED_DIR.resolve()}")
+    print(f"FINAL    -> {FINAL_DIR.resolve()}")
+    print(f"SQLite   -> {DW_DB_PATH.resolve()}")
+    if "excel" in outputs:
+        print(f"Excel    -> {EXCEL_OUTPUT.resolve()}")
+    if DUCKDB_PATH.exists():
+        print(f"DuckDB   -> {DUCKDB_PATH.resolve()}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ETL Northwind -> Data Warehouse SQLite")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="n'extrait que les commandes nouvelles / non livrées depuis le dernier run",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="nombre de tables extraites en parallèle (1 = séquentiel)",
+    )
+    parser.add_argument(
+        "--transform-workers",
+        type=int,
+        default=DEFAULT_TRANSFORM_WORKERS,
+        help="processus pour la résolution des clés de fact_orders, par source / année (1 = séquentiel)",
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=None,
+        help="chargement complet par blocs de N commandes lues au fil du curseur source "
+        f"(mémoire bornée par le bloc, ex. {DEFAULT_CHUNK_ROWS})",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(OUTPUT_FORMATS),
+        default="csv",
+        help="format des fichiers processed / final (parquet : fact partitionnée par année / mois)",
+    )
+    parser.add_argument(
+        "--outputs",
+        nargs="+",
+        choices=OUTPUT_TARGETS,
+        default=list(DEFAULT_OUTPUTS),
+        help="sorties de data/final en plus du DW sqlite (ex. --outputs files pour sauter l'excel, "
+        "--outputs files excel duckdb pour le dashboard en duckdb)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="reprend après un échec : les étapes dont les entrées n'ont pas changé sont relues depuis data/checkpoints",
+    )
+    parser.add_argument(
+        "--query-timings",
+        action="store_true",
+        help="affiche en fin de run les requêtes sources les plus longues et l'usage des pools de connexions",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="recharge même si aucune table source n'a changé depuis le dernier run",
+    )
+    args = parser.parse_args(argv)
+    formats = OUTPUT_FORMATS[args.format]
+
+    # mesures par étape -> table etl_run_history du DW + data/reports/*.json
+    run = Pipeline("etl_incremental" if args.incremental else "etl")
+    # sorties des étapes extract / transform gardées jusqu'à la fin du run
+    checkpoints = Checkpoints(CHECKPOINT_DIR, resume=args.resume)
+    query_log = connections.QueryLog()
+    if args.query_timings:
+        connections.add_hook(query_log)
+    try:
+        print("empreintes des tables sources...")
+        with run.step("fingerprint") as step:
+            fingerprints, changed = check_sources(args.workers)
+            step.set_rows(rows_in=sum(fp["rows"] for fp in fingerprints.values() if fp))
+
+        conn = sqlite3.connect(DW_DB_PATH)
+        loaded = warehouse.read_load_version(conn) > 0
+        conn.close()
+        if loaded and not changed and not args.force:
+            print("\n aucune table source modifiée depuis le dernier run -> rien à recharger (--force pour forcer)")
+            return
+
+        # empreintes = entrée de l'étape extract : une reprise (--resume) ré-extrait si une
+        # source a changé depuis le run en échec, sinon ses lignes seraient marquées chargées
+        if not (
+            args.incremental
+            and run_incremental(
+                run, checkpoints, args.workers, formats, changed, args.transform_workers, fingerprints
+            )
+        ):
+            run.name = "etl"
+            if args.chunk_rows:
+                run_chunked(run, checkpoints, args.workers, formats, args.outputs, args.chunk_rows, fingerprints)
+            else:
+                run_full(
+                    run, checkpoints, args.workers, formats, args.outputs, args.transform_workers, fingerprints
+                )
+
+        # empreintes enregistrées seulement après un run complet réussi
+        conn = sqlite3.connect(DW_DB_PATH)
+        warehouse.save_fingerprints(conn, fingerprints)
+        conn.close()
+        checkpoints.clear()
+    finally:
+        connections.close_all()
+        connections.remove_hook(query_log)
+        query_log.print_summary()
+        run.finish(DW_DB_PATH, REPORT_DIR)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,93 @@
+import os
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import Workbook
+
+
+# =========================
+# EXPORT EXCEL (écriture en flux)
+# =========================
+# limite d'une feuille excel, ligne d'en-tête comprise
+EXCEL_MAX_ROWS = 1_048_576
+CHUNK_SIZE = 50_000
+
+
+def sheet_parts(name, n_rows, max_rows=EXCEL_MAX_ROWS):
+    """
+    [(nom de feuille, début, fin)] : fact_orders, fact_orders_2, ... au-delà de max_rows
+    """
+    per_sheet = max_rows - 1
+    if n_rows <= per_sheet:
+        return [(name, 0, n_rows)]
+    parts = []
+    for i, start in enumerate(range(0, n_rows, per_sheet), start=1):
+        sheet = name if i == 1 else f"{name}_{i}"
+        parts.append((sheet[:31], start, min(start + per_sheet, n_rows)))
+    return parts
+
+
+def excel_rows(df, chunksize=CHUNK_SIZE):
+    """
+    lignes python prêtes pour openpyxl (NaN / NA -> cellule vide), par blocs
+    """
+    for start in range(0, len(df), chunksize):
+        chunk = df.iloc[start : start + chunksize].astype(object)
+        chunk = chunk.where(chunk.notna(), None)
+        yield from chunk.itertuples(index=False, name=None)
+
+
+def write_chunks(wb, name, chunks, max_rows=EXCEL_MAX_ROWS):
+    """
+    blocs de lignes (mêmes colonnes) écrits à la suite ; feuille suivante
+    (name_2, name_3...) quand la feuille en cours atteint max_rows
+    """
+    per_sheet = max_rows - 1
+    header = None
+    ws = None
+    n_sheets = 0
+    filled = 0
+    for chunk in chunks:
+        if header is None:
+            header = [str(col) for col in chunk.columns]
+        for row in excel_rows(chunk):
+            if ws is None or filled == per_sheet:
+                n_sheets += 1
+                ws = wb.create_sheet((name if n_sheets == 1 else f"{name}_{n_sheets}")[:31])
+                ws.append(header)
+                filled = 0
+            ws.append(row)
+            filled += 1
+
+    if ws is None and header is not None:
+        # blocs vides : feuille avec l'en-tête seul
+        ws = wb.create_sheet(name[:31])
+        ws.append(header)
+
+
+def write_excel(sheets, output_file, max_rows=EXCEL_MAX_ROWS):
+    """
+    sheets : {nom: DataFrame, ou itérable de blocs DataFrame}. classeur openpyxl en
+    mode write_only (les lignes sont écrites au fil de l'eau, pas de modèle de feuille
+    en mémoire), feuilles découpées au-delà de max_rows. fichier temporaire renommé à la fin.
+    """
+    output_file = Path(output_file)
+    tmp_file = output_file.with_name(output_file.stem + ".tmp" + output_file.suffix)
+
+    wb = Workbook(write_only=True)
+    for name, df in sheets.items():
+        if not isinstance(df, pd.DataFrame):
+            write_chunks(wb, name, df, max_rows)
+            continue
+        for sheet, start, end in sheet_parts(name, len(df), max_rows):
+            ws = wb.create_sheet(sheet)
+            ws.append([str(col) for col in df.columns])
+            for row in excel_rows(df.iloc[start:end]):
+                ws.append(row)
+
+    try:
+        wb.save(tmp_file)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        Path(tmp_file).unlink(missing_ok=True)
+        raise
@@ -1,7 +1,14 @@
+import argparse
+import os
+import time
 import pandas as pd
-import pyodbc
 from pathlib import Path
 
+import connections
+from columnar import write_parquet_atomic
+from parallel_extract import DEFAULT_WORKERS, run_tasks
+from pipeline import Pipeline
+
 
 CURRENT_FILE = Path(__file__).resolve()
 
@@ -18,6 +25,10 @@ RAW_DIR.mkdir(parents=True, exist_ok=True)
 
 print(f"Dossier RAW : {RAW_DIR.resolve()}")
 
+# historique des exécutions (etl_run_history du DW) et rapports json
+DW_DB_PATH = PROJECT_ROOT / "data" / "final" / "northwind_dw.sqlite"
+REPORT_DIR = PROJECT_ROOT / "data" / "reports"
+
 
 SQLSERVER_SERVER = r"localhost\SQLEXPRESS"
 SQLSERVER_DATABASE = "Northwind"
@@ -34,62 +45,145 @@ SQLSERVER_TABLES = [
     "Products",
 ]
 
+# lignes lues / écrites par paquet pendant l'export RAW
+CHUNK_SIZE = 50_000
+
 
 # ==================================================
 # CONNEXION SQL SERVER
 # ==================================================
+# pool partagé (connections.py) : une connexion par worker, réutilisée d'une table à l'autre
+SQLSERVER_POOL = connections.Pool(
+    "sqlserver", connections.sqlserver_factory(SQLSERVER_SERVER, SQLSERVER_DATABASE), size=DEFAULT_WORKERS
+)
+
+
 def connect_sqlserver():
-    conn_str = (
-        r"DRIVER={ODBC Driver 17 for SQL Server};"
-        rf"SERVER={SQLSERVER_SERVER};"
-        rf"DATABASE={SQLSERVER_DATABASE};"
-        r"Trusted_Connection=yes;"
-    )
-    return pyodbc.connect(conn_str)
+    return SQLSERVER_POOL.connect()
+
 
+def raw_file_name(table, fmt="csv"):
+    file_name = (
+        table.replace("[", "")
+        .replace("]", "")
+        .replace(" ", "_")
+        .lower()
+    )
+    return RAW_DIR / f"sqlserver_{file_name}.{fmt}"
 
 
-def extract_sqlserver_to_raw():
+def write_csv_atomic(chunks, output_file):
+    """
+    écrit les chunks les uns après les autres dans un fichier temporaire,
+    puis le renomme : jamais de fichier RAW à moitié écrit si l'export plante.
+    """
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+    rows = 0
+    try:
+        with open(tmp_file, "w", encoding="utf-8", newline="") as f:
+            for i, chunk in enumerate(chunks):
+                chunk.to_csv(f, index=False, header=(i == 0))
+                rows += len(chunk)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    return rows
+
+
+def export_table(table, chunksize=CHUNK_SIZE, fmt="csv"):
+    """
+    read(cnx) pour une tâche d'extraction : SELECT * -> fichier RAW (csv ou parquet).
+    lecture par paquets de chunksize lignes (mémoire bornée), 0 = table entière.
+    renvoie (lignes écrites, message). une erreur remonte telle quelle : l'export de la
+    table est rejoué si elle est passagère (run_tasks), sinon signalé dans le résumé.
+    """
+    def read(cnx):
+        query = f"SELECT * FROM {table}"
+        if chunksize:
+            chunks = pd.read_sql(query, cnx, chunksize=chunksize)
+        else:
+            chunks = [pd.read_sql(query, cnx)]
+
+        output_file = raw_file_name(table, fmt)
+        if fmt == "parquet":
+            rows = write_parquet_atomic(chunks, output_file)
+        else:
+            rows = write_csv_atomic(chunks, output_file)
+        return rows, f"✓ {output_file.name} ({rows} lignes)"
+
+    return read
+
+
+def extract_sqlserver_to_raw(
+    workers=DEFAULT_WORKERS,
+    chunksize=CHUNK_SIZE,
+    fmt="csv",
+    connect=connect_sqlserver,
+    tables=SQLSERVER_TABLES,
+):
     """
     Exporte les tables SQL Server vers data/raw/
-    (couche RAW du projet BI)
+    (couche RAW du projet BI), plusieurs tables en parallèle.
+    renvoie le nombre total de lignes exportées.
     """
     print(f"Export RAW SQL Server → {RAW_DIR.resolve()}")
 
     try:
-        conn = connect_sqlserver()
+        conn = connect()
+        conn.close()
         print(" Connexion SQL Server réussie")
     except Exception as e:
         print(f" Erreur de connexion SQL Server : {e}")
-        return
-
-    for table in SQLSERVER_TABLES:
-        try:
-            
-            file_name = (
-                table.replace("[", "")
-                .replace("]", "")
-                .replace(" ", "_")
-                .lower()
-            )
-
-            query = f"SELECT * FROM {table}"
-            df = pd.read_sql(query, conn)
+        return 0
 
-            output_file = RAW_DIR / f"sqlserver_{file_name}.csv"
-            df.to_csv(output_file, index=False, encoding="utf-8")
+    # une connexion par table en cours d'export ; une table en échec n'arrête pas les autres
+    tasks = [(table, connect, export_table(table, chunksize, fmt)) for table in tables]
 
-            print(f"  ✓ {table} → {output_file.name} ({len(df)} lignes)")
+    t0 = time.perf_counter()
+    results, timings = run_tasks(tasks, workers, keep_errors=True)
 
-        except Exception as e:
-            print(f"   Erreur sur {table} : {e}")
+    total = 0
+    for table, result in results.items():
+        if isinstance(result, Exception):
+            print(f"  {table} → Erreur : {result} [{timings[table]:.2f} s]")
+            continue
+        rows, status = result
+        total += rows
+        print(f"  {table} → {status} [{timings[table]:.2f} s]")
 
-    conn.close()
-    print("\nExport RAW SQL Server terminé")
+    print(f"\nExport RAW SQL Server terminé en {time.perf_counter() - t0:.2f} s")
+    return total
 
 
 # ==================================================
 # MAIN
 # ==================================================
 if __name__ == "__main__":
-    extract_sqlserver_to_raw()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="export RAW SQL Server -> data/raw")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="tables exportées en parallèle")
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=CHUNK_SIZE,
+        help="lignes lues par paquet (0 = table entière en mémoire)",
+    )
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv", help="format des fichiers RAW")
+    parser.add_argument(
+        "--query-timings", action="store_true", help="affiche les requêtes les plus longues en fin d'export"
+    )
+    args = parser.parse_args()
+
+    run = Pipeline("load_raw")
+    query_log = connections.QueryLog()
+    if args.query_timings:
+        connections.add_hook(query_log)
+    try:
+        with run.step("export_raw") as step:
+            rows = extract_sqlserver_to_raw(workers=args.workers, chunksize=args.chunksize, fmt=args.format)
+            step.set_rows(rows_out=rows)
+    finally:
+        connections.close_all()
+        connections.remove_hook(query_log)
+        query_log.print_summary()
+        run.finish(DW_DB_PATH, REPORT_DIR)
@@ -0,0 +1,132 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+from checkpoint import content_hash
+from connections import with_retry
+
+
+# =========================
+# EXTRACTION PARALLELE
+# =========================
+# une tâche = (nom, connect, read) :
+#   connect() -> connexion DB-API (pool de connections.py, ou sqlite3 pour tester en local)
+#   read(cnx) -> DataFrame
+# chaque tâche ouvre sa propre connexion dans son thread : aucune connexion partagée.
+
+DEFAULT_WORKERS = 4
+
+
+def select_all(table, optional=False):
+    """
+    read(cnx) pour SELECT * FROM table.
+    optional=True : DataFrame vide si la table n'existe pas dans la source.
+    """
+    def read(cnx):
+        try:
+            return pd.read_sql(f"SELECT * FROM {table}", cnx)
+        except Exception:
+            if optional:
+                return pd.DataFrame()
+            raise
+
+    return read
+
+
+def table_columns(cnx, table):
+    cursor = cnx.cursor()
+    try:
+        cursor.execute(f"SELECT * FROM {table} WHERE 1 = 0")
+        return [c[0] for c in cursor.description]
+    finally:
+        cursor.close()
+
+
+def fingerprint(table, key_candidates=(), server_checksum=False, optional=False):
+    """
+    read(cnx) -> {"rows", "max_key", "hash"} : empreinte de la table.
+    server_checksum=True (sql server) : une seule requête agrégée côté serveur,
+    COUNT(*) / MAX(clé) / CHECKSUM_AGG(BINARY_CHECKSUM(*)), aucune ligne rapatriée.
+    sinon (access, sqlite : pas de checksum agrégé) la table est lue et hashée localement.
+    optional=True : None si la table n'existe pas dans la source.
+    """
+    def read(cnx):
+        try:
+            columns = table_columns(cnx, table)
+        except Exception:
+            if optional:
+                return None
+            raise
+
+        key = next((c for c in key_candidates if c in columns), None)
+        max_key = f"MAX([{key}])" if key else "NULL"
+
+        if server_checksum:
+            try:
+                cursor = cnx.cursor()
+                cursor.execute(f"SELECT COUNT(*), {max_key}, CHECKSUM_AGG(BINARY_CHECKSUM(*)) FROM {table}")
+                rows, max_value, checksum = cursor.fetchone()
+                cursor.close()
+                return {"rows": int(rows), "max_key": None if max_value is None else str(max_value), "hash": str(checksum)}
+            except Exception:
+                pass  # pas de checksum sur cette source : hash local
+
+        df = pd.read_sql(f"SELECT * FROM {table}", cnx)
+        max_value = df[key].max() if key and len(df) else None
+        return {
+            "rows": len(df),
+            "max_key": None if max_value is None or pd.isna(max_value) else str(max_value),
+            "hash": content_hash(df),
+        }
+
+    return read
+
+
+def _run_task(task, keep_errors=False):
+    name, connect, read = task
+
+    def attempt():
+        cnx = connect()
+        try:
+            return read(cnx)
+        finally:
+            cnx.close()
+
+    # lectures seules : la tâche entière est rejouée après une erreur passagère
+    t0 = time.perf_counter()
+    try:
+        result = with_retry(attempt, label=name)
+    except Exception as e:
+        if not keep_errors:
+            raise
+        result = e
+    return name, result, time.perf_counter() - t0
+
+
+def run_tasks(tasks, workers=DEFAULT_WORKERS, keep_errors=False):
+    """
+    exécute les tâches sur un pool de threads (workers=1 : séquentiel).
+    renvoie ({nom: résultat}, {nom: secondes}) dans l'ordre des tâches.
+    keep_errors=True : l'exception d'une tâche en échec (après les reprises) est son
+    résultat, les autres tâches continuent.
+    """
+    workers = max(1, min(workers, len(tasks))) if tasks else 1
+
+    results = {}
+    timings = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for name, result, seconds in pool.map(partial(_run_task, keep_errors=keep_errors), tasks):
+            results[name] = result
+            timings[name] = seconds
+    return results, timings
+
+
+def print_timings(results, timings, wall):
+    for name, seconds in timings.items():
+        result = results[name]
+        rows = f"{len(result):>8} lignes" if isinstance(result, pd.DataFrame) else ""
+        print(f"  {name:<28} {rows} {seconds:7.2f} s")
+    slowest = max(timings.values()) if timings else 0.0
+    print(f"  total {wall:.2f} s (table la plus lente {slowest:.2f} s, somme {sum(timings.values()):.2f} s)")
@@ -0,0 +1,70 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+
+# =========================
+# TRANSFORMATION PARALLELE (pool de processus)
+# =========================
+# les commandes sont découpées par (source_system, année de commande). chaque processus
+# reçoit les dimensions une seule fois, à son démarrage (initializer), et ne fait que les
+# lire ; il renvoie seulement les colonnes de clés de chaque partition.
+# les partitions gardent l'index des commandes d'origine : le résultat est remis dans
+# l'ordre de départ, identique au chemin séquentiel.
+KEY_COLUMNS = ["order_date_key", "ship_date_key", "employee_key", "customer_key"]
+DEFAULT_TRANSFORM_WORKERS = 1
+
+_worker = {}
+
+
+def _init_worker(resolve, dims):
+    _worker["resolve"] = resolve
+    _worker["dims"] = dims
+
+
+def _resolve_partition(name, part):
+    t0 = time.perf_counter()
+    out = _worker["resolve"](part, *_worker["dims"])
+    return name, out[KEY_COLUMNS], time.perf_counter() - t0
+
+
+def partition_orders(orders, years):
+    """
+    [(nom "source.année", commandes)] triées par source puis année.
+    years : année de commande de chaque ligne (-1 si date vide ou illisible).
+    """
+    groups = orders.groupby([orders["source_system"], years], sort=True)
+    return [(f"{source}.{year}", part) for (source, year), part in groups]
+
+
+def resolve_in_pool(orders, years, resolve, dims, workers):
+    """
+    resolve(partition, *dims) sur chaque partition dans un pool de workers processus.
+    renvoie (orders avec les colonnes de clés, {partition: (lignes, secondes)}).
+    """
+    parts = partition_orders(orders, years)
+    if not parts:
+        return resolve(orders, *dims), {}
+    workers = max(1, min(workers, len(parts)))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(resolve, dims)) as pool:
+        futures = [pool.submit(_resolve_partition, name, part) for name, part in parts]
+        # résultats lus dans l'ordre de soumission : assemblage déterministe
+        results = [future.result() for future in futures]
+
+    keys = pd.concat([out for _, out, _ in results]).reindex(orders.index)
+    orders = orders.copy()
+    for col in KEY_COLUMNS:
+        orders[col] = keys[col]
+
+    timings = {name: (len(out), seconds) for name, out, seconds in results}
+    return orders, timings
+
+
+def print_partition_timings(timings, wall):
+    for name, (rows, seconds) in timings.items():
+        print(f"  {name:<20} {rows:>10} lignes {seconds:7.2f} s")
+    slowest = max((s for _, s in timings.values()), default=0.0)
+    total = sum(s for _, s in timings.values())
+    print(f"  total {wall:.2f} s (partition la plus lente {slowest:.2f} s, somme {total:.2f} s)")
@@ -0,0 +1,292 @@
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+import warehouse
+
+try:
+    import psutil
+except ImportError:  # mesure mémoire optionnelle hors unix
+    psutil = None
+
+
+# =========================
+# PIPELINE (étapes mesurées : temps, cpu, mémoire, lignes)
+# =========================
+RUN_HISTORY_TABLE = "etl_run_history"
+
+# linux : pic de rss du noyau (VmHWM), remis à zéro en écrivant "5" dans clear_refs
+PROC_STATUS = Path("/proc/self/status")
+PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+RSS_SAMPLE_S = 0.02  # ailleurs : intervalle d'échantillonnage du rss (psutil)
+
+
+def reset_rss_peak():
+    """
+    remet le pic de rss du processus à sa valeur actuelle ; False si impossible
+    """
+    try:
+        PROC_CLEAR_REFS.write_text("5")
+        return True
+    except OSError:
+        return False
+
+
+def rss_peak_mb():
+    """
+    pic de rss depuis le dernier reset_rss_peak (Mo), lu dans /proc/self/status
+    """
+    for line in PROC_STATUS.read_text().splitlines():
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1]) / 1024
+    return None
+
+
+class RssPeak:
+    """
+    pic de mémoire résidente pendant une étape (Mo), pas depuis le début du processus :
+    linux : pic du noyau remis à zéro au début de l'étape (exact) ;
+    sinon : rss échantillonné par un thread psutil (un pic plus court que RSS_SAMPLE_S
+    peut échapper) ; None si aucun des deux n'est disponible.
+    """
+
+    def __init__(self):
+        self.peak = None
+        self._kernel = False
+        self._stop = None
+        self._thread = None
+
+    def start(self):
+        self._kernel = reset_rss_peak()
+        if self._kernel or psutil is None:
+            return self
+        process = psutil.Process()
+        self.peak = process.memory_info().rss
+        self._stop = threading.Event()
+
+        def sample():
+            while not self._stop.wait(RSS_SAMPLE_S):
+                self.peak = max(self.peak, process.memory_info().rss)
+
+        self._thread = threading.Thread(target=sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._kernel:
+            return rss_peak_mb()
+        if self._thread is None:
+            return None
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, psutil.Process().memory_info().rss)
+        return self.peak / 1024 ** 2
+
+
+def count_rows(value):
+    """
+    lignes d'un DataFrame, d'un dict / liste de DataFrames, ou d'un entier
+    """
+    if value is None:
+        return None
+    if isinstance(value, pd.DataFrame):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(count_rows(v) or 0 for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(count_rows(v) or 0 for v in value)
+    return int(value)
+
+
+class Step:
+    """
+    mesures d'une étape ; rows_in / rows_out renseignés par le code de l'étape
+    """
+
+    def __init__(self, name, rows_in=None):
+        self.name = name
+        self.rows_in = count_rows(rows_in)
+        self.rows_out = None
+        self.status = "ok"
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.wall_s = None
+        self.cpu_s = None
+        self.peak_rss_mb = None
+
+    def set_rows(self, rows_in=None, rows_out=None):
+        if rows_in is not None:
+            self.rows_in = count_rows(rows_in)
+        if rows_out is not None:
+            self.rows_out = count_rows(rows_out)
+
+    def as_dict(self):
+        return {
+            "step": self.name,
+            "started_at": self.started_at,
+            "status": self.status,
+            "wall_s": round(self.wall_s, 3) if self.wall_s is not None else None,
+            "cpu_s": round(self.cpu_s, 3) if self.cpu_s is not None else None,
+            "peak_rss_mb": round(self.peak_rss_mb, 1) if self.peak_rss_mb is not None else None,
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+        }
+
+
+class Pipeline:
+    """
+    with run.step("extract") as step:
+        data = extract()
+        step.set_rows(rows_out=data)
+    run.finish(db_path, report_dir)  -> table etl_run_history + rapport json
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.steps = []
+        self.t0 = time.perf_counter()
+        self.cpu0 = time.process_time()
+
+    @contextmanager
+    def step(self, name, rows_in=None):
+        step = Step(name, rows_in)
+        self.steps.append(step)
+        rss = RssPeak().start()
+        t0 = time.perf_counter()
+        cpu0 = time.process_time()
+        try:
+            yield step
+        except BaseException:
+            step.status = "error"
+            raise
+        finally:
+            step.wall_s = time.perf_counter() - t0
+            step.cpu_s = time.process_time() - cpu0
+            step.peak_rss_mb = rss.stop()
+            print(f"  [{step.name}] {summary_line(step.as_dict())}")
+
+    def report(self):
+        status = "error" if any(s.status == "error" for s in self.steps) else "ok"
+        return {
+            "pipeline": self.name,
+            "run_id": self.run_id,
+            "status": status,
+            "wall_s": round(time.perf_counter() - self.t0, 3),
+            "cpu_s": round(time.process_time() - self.cpu0, 3),
+            "peak_rss_mb": max((s.peak_rss_mb for s in self.steps if s.peak_rss_mb is not None), default=None),
+            "steps": [s.as_dict() for s in self.steps],
+        }
+
+    def finish(self, db_path=None, report_dir=None):
+        """
+        écrit l'historique dans le DW (db_path) et le rapport json (report_dir)
+        """
+        report = self.report()
+        if db_path is not None:
+            conn = sqlite3.connect(db_path)
+            try:
+                print_comparison(report, previous_timings(conn, self.name, self.run_id))
+                save_run_history(conn, report)
+            finally:
+                conn.close()
+        if report_dir is not None:
+            report_dir = Path(report_dir)
+            report_dir.mkdir(parents=True, exist_ok=True)
+            report_file = report_dir / f"{self.name}_{self.run_id}.json"
+            report_file.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+            print(f"rapport d'exécution -> {report_file.resolve()}")
+        return report
+
+
+def summary_line(step):
+    rows = ""
+    if step["rows_in"] is not None or step["rows_out"] is not None:
+        rows_in = "-" if step["rows_in"] is None else step["rows_in"]
+        rows_out = "-" if step["rows_out"] is None else step["rows_out"]
+        rows = f" | lignes {rows_in} -> {rows_out}"
+    rss = f" | rss max {step['peak_rss_mb']:.0f} Mo" if step["peak_rss_mb"] is not None else ""
+    return f"{step['wall_s']:.2f} s (cpu {step['cpu_s']:.2f} s){rss}{rows}"
+
+
+def save_run_history(conn, report):
+    """
+    une ligne par étape dans etl_run_history (comparaison des runs entre eux)
+    """
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {RUN_HISTORY_TABLE} (
+            pipeline TEXT,
+            run_id TEXT,
+            step TEXT,
+            started_at TEXT,
+            status TEXT,
+            wall_s REAL,
+            cpu_s REAL,
+            peak_rss_mb REAL,
+            rows_in INTEGER,
+            rows_out INTEGER
+        )
+        """
+    )
+    with conn:
+        conn.executemany(
+            f"""
+            INSERT INTO {RUN_HISTORY_TABLE}
+                (pipeline, run_id, step, started_at, status, wall_s, cpu_s, peak_rss_mb, rows_in, rows_out)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    report["pipeline"],
+                    report["run_id"],
+                    s["step"],
+                    s["started_at"],
+                    s["status"],
+                    s["wall_s"],
+                    s["cpu_s"],
+                    s["peak_rss_mb"],
+                    s["rows_in"],
+                    s["rows_out"],
+                )
+                for s in report["steps"]
+            ],
+        )
+
+
+def previous_timings(conn, pipeline, run_id):
+    """
+    {étape: wall_s} du dernier run réussi avant run_id ({} si aucun)
+    """
+    if not warehouse.table_exists(conn, RUN_HISTORY_TABLE):
+        return {}
+    rows = conn.execute(
+        f"""
+        SELECT step, wall_s FROM {RUN_HISTORY_TABLE}
+        WHERE pipeline = ? AND run_id = (
+            SELECT MAX(run_id) FROM {RUN_HISTORY_TABLE}
+            WHERE pipeline = ? AND run_id < ? AND status = 'ok'
+        )
+        """,
+        (pipeline, pipeline, run_id),
+    ).fetchall()
+    return dict(rows)
+
+
+def print_comparison(report, previous):
+    """
+    écart de temps par étape avec le run précédent (repérage des régressions)
+    """
+    if not previous:
+        return
+    print("écart avec le run précédent :")
+    for step in report["steps"]:
+        before = previous.get(step["step"])
+        if not before or step["wall_s"] is None:
+            continue
+        print(f"  {step['step']:<20} {before:7.2f} s -> {step['wall_s']:7.2f} s ({(step['wall_s'] / before - 1) * 100:+.0f} %)")
@@ -0,0 +1,150 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+
+# =========================
+# CONTROLE QUALITE (entre transform et chargement du DW)
+# =========================
+# un contrôle = masque booléen calculé sur des colonnes entières (aucune boucle par ligne).
+# une commande qui échoue à au moins un contrôle part en quarantaine avec ses codes
+# de rejet (warehouse.save_quarantine) ; les autres continuent vers fact_orders.
+NATURAL_KEY = ["source_system", "order_id_source"]
+SOURCE_COLUMNS = ["EmployeeID", "CustomerID", "OrderDate", "ShippedDate"]
+
+
+def order_id_missing(orders):
+    return orders["order_id_source"].isna()
+
+
+def order_duplicated(orders):
+    """
+    la première occurrence de (source_system, order_id_source) est gardée.
+    ids numériques (cas normal) : une seule clé int64 source * n + id, bien plus
+    rapide que duplicated sur deux colonnes dont une de type object.
+    """
+    present = orders["order_id_source"].notna()
+    ids = pd.to_numeric(orders["order_id_source"], errors="coerce")
+    if ids[present].isna().any() or (ids[present] % 1 != 0).any():
+        return orders.duplicated(subset=NATURAL_KEY, keep="first") & present
+
+    codes, sources = pd.factorize(orders["source_system"])
+    key = ids.fillna(-1).to_numpy(dtype="int64") * (len(sources) + 1) + codes
+    if len(key):
+        # ids denses (cas des commandes) : comptage direct, sans table de hachage
+        span = int(key.max()) - int(key.min()) + 1
+        if span <= 10 * len(key) + 1_000_000 and np.bincount(key - key.min()).max() <= 1:
+            return np.zeros(len(key), dtype=bool)
+    return pd.Series(key).duplicated(keep="first").to_numpy() & present.to_numpy()
+
+
+def employee_unknown(orders):
+    """
+    employé renseigné dans la source mais absent de dim_employee
+    (un employé vide reste accepté : commande sans employé)
+    """
+    return missing_key(orders, "EmployeeID", "employee_key")
+
+
+def customer_unknown(orders):
+    return missing_key(orders, "CustomerID", "customer_key")
+
+
+def missing_key(orders, id_col, key_col):
+    """
+    id source renseigné et clé non résolue ; l'id (souvent de type object, lent à
+    tester) n'est examiné que sur les lignes sans clé
+    """
+    mask = orders[key_col].isna().to_numpy().copy()
+    if mask.any():
+        mask[mask] = pd.notna(orders[id_col].to_numpy()[mask])
+    return mask
+
+
+def order_date_missing(orders):
+    return orders["OrderDate"].isna()
+
+
+def order_date_out_of_range(orders):
+    """
+    date de commande illisible ou hors de dim_date (dates_to_keys -> <NA>)
+    """
+    return orders["OrderDate"].notna() & orders["order_date_key"].isna()
+
+
+def ship_date_out_of_range(orders):
+    return orders["ShippedDate"].notna() & orders["ship_date_key"].isna()
+
+
+def shipped_before_order(orders):
+    return (orders["ship_date_key"] < orders["order_date_key"]).fillna(False).astype(bool)
+
+
+# (code de rejet, contrôle), dans l'ordre d'exécution
+CHECKS = [
+    ("order_id_manquant", order_id_missing),
+    ("commande_en_double", order_duplicated),
+    ("employe_inconnu", employee_unknown),
+    ("client_inconnu", customer_unknown),
+    ("date_commande_manquante", order_date_missing),
+    ("date_commande_hors_plage", order_date_out_of_range),
+    ("date_livraison_hors_plage", ship_date_out_of_range),
+    ("livraison_avant_commande", shipped_before_order),
+]
+
+
+def with_loaded_orders(loaded, checks=CHECKS):
+    """
+    contrôles d'un bloc de commandes (chargement par blocs) : une commande déjà chargée
+    par un bloc précédent (loaded(orders) -> masque) compte aussi comme doublon
+    """
+    def duplicated(orders):
+        return np.asarray(order_duplicated(orders), dtype=bool) | np.asarray(loaded(orders), dtype=bool)
+
+    return [(code, duplicated if check is order_duplicated else check) for code, check in checks]
+
+
+def validate_orders(orders, checks=CHECKS):
+    """
+    orders : commandes avec ids sources et clés résolues (etl.build_order_lines).
+    renvoie (commandes valides, quarantaine, rapport {code: (lignes rejetées, secondes)}).
+    quarantaine : une ligne par commande rejetée, codes séparés par des virgules.
+    """
+    rejected = np.zeros(len(orders), dtype=bool)
+    masks = {}
+    report = {}
+    for code, check in checks:
+        t0 = time.perf_counter()
+        mask = np.asarray(check(orders), dtype=bool)
+        rejected |= mask
+        report[code] = (int(mask.sum()), time.perf_counter() - t0)
+        if report[code][0]:
+            masks[code] = mask
+
+    valid = orders[~rejected]
+
+    bad = orders[rejected]
+    reasons = pd.Series("", index=bad.index, dtype=object)
+    for code, mask in masks.items():
+        reasons = reasons + np.where(mask[rejected], code + ",", "")
+
+    quarantine = pd.DataFrame(
+        {
+            "source_system": bad["source_system"],
+            "order_id_source": pd.to_numeric(bad["order_id_source"], errors="coerce").astype("Int64"),
+            "reasons": reasons.str.rstrip(","),
+        }
+    )
+    for col in SOURCE_COLUMNS:
+        quarantine[col] = bad[col].astype("string")
+
+    return valid, quarantine.reset_index(drop=True), report
+
+
+def print_report(report, n_rows):
+    print(f"contrôle qualité ({n_rows} commandes) :")
+    for code, (n_bad, seconds) in report.items():
+        print(f"  {code:<26} {n_bad:>8} rejetées  {seconds:6.3f} s")
+    total = sum(seconds for _, seconds in report.values())
+    print(f"  total {total:.3f} s")
@@ -0,0 +1,122 @@
+from functools import lru_cache
+
+import pandas as pd
+
+
+# =========================
+# CORRESPONDANCE DES COLONNES SOURCES
+# =========================
+# par source et par table : colonne cible -> noms possibles dans la source, par ordre de
+# préférence ([] : colonne toujours vide pour cette source). la correspondance est résolue
+# une fois par schéma (liste des colonnes de la table), puis appliquée telle quelle à
+# chaque DataFrame ou bloc de lignes.
+SOURCE_COLUMNS = {
+    "access": {
+        "employees": {
+            "employee_id_source": ["EmployeeID", "ID"],
+            "LastName": ["LastName", "Last Name"],
+            "FirstName": ["FirstName", "First Name"],
+            "Title": ["Title"],
+            "City": ["City"],
+            "Country": ["Country"],
+            "RegionDescription": [],
+        },
+        "customers": {
+            "customer_id_source": ["CustomerID", "ID"],
+            "CompanyName": ["CompanyName", "Company"],
+            "ContactName": ["ContactName", "Contact Name"],
+            "City": ["City"],
+            "Country": ["Country"],
+            "PostalCode": ["PostalCode"],
+            "Address": ["Address"],
+            "Phone": ["Phone"],
+        },
+        "orders": {
+            "order_id_source": ["OrderID", "Order ID"],
+            "EmployeeID": ["EmployeeID", "Employee ID"],
+            "CustomerID": ["CustomerID", "Customer ID"],
+            "OrderDate": ["OrderDate", "Order Date"],
+            "ShippedDate": ["ShippedDate", "Shipped Date"],
+        },
+    },
+    "sqlserver": {
+        "employees": {
+            "employee_id_source": ["EmployeeID"],
+            "LastName": ["LastName"],
+            "FirstName": ["FirstName"],
+            "Title": ["Title"],
+            "City": ["City"],
+            "Country": ["Country"],
+            "RegionDescription": ["Region"],
+        },
+        "customers": {
+            "customer_id_source": ["CustomerID"],
+            "CompanyName": ["CompanyName"],
+            "ContactName": ["ContactName"],
+            "City": ["City"],
+            "Country": ["Country"],
+            "PostalCode": ["PostalCode"],
+            "Address": ["Address"],
+            "Phone": ["Phone"],
+        },
+        "orders": {
+            "order_id_source": ["OrderID"],
+            "EmployeeID": ["EmployeeID"],
+            "CustomerID": ["CustomerID"],
+            "OrderDate": ["OrderDate"],
+            "ShippedDate": ["ShippedDate"],
+        },
+    },
+}
+
+# colonne cible sans laquelle la table n'est pas exploitable
+REQUIRED = {
+    "employees": "employee_id_source",
+    "customers": "customer_id_source",
+    "orders": "order_id_source",
+}
+
+
+@lru_cache(maxsize=None)
+def _resolve(source, table, columns):
+    resolved = {}
+    for target, candidates in SOURCE_COLUMNS[source][table].items():
+        resolved[target] = next((c for c in candidates if c in columns), None)
+
+    required = REQUIRED.get(table)
+    if required and resolved[required] is None:
+        candidates = "/".join(SOURCE_COLUMNS[source][table][required])
+        raise KeyError(f"pas de colonne {candidates} trouvée dans {table} ({source})")
+    return resolved
+
+
+def resolve_columns(source, table, columns):
+    """
+    {colonne cible: colonne de la source, ou None si absente} pour ce schéma
+    """
+    return dict(_resolve(source, table, tuple(columns)))
+
+
+def source_column(source, table, columns, target):
+    return resolve_columns(source, table, columns)[target]
+
+
+def select_list(resolved):
+    """
+    colonnes sources à lire (SELECT [a], [b] ...) : seulement celles qui servent
+    """
+    return ", ".join(f"[{c}]" for c in dict.fromkeys(c for c in resolved.values() if c))
+
+
+def map_columns(df, source, table, resolved=None):
+    """
+    df (table source ou bloc de lignes) -> source_system + colonnes cibles, dans l'ordre
+    de SOURCE_COLUMNS ; une colonne absente de la source reste vide (None)
+    """
+    if resolved is None:
+        resolved = resolve_columns(source, table, df.columns)
+    out = pd.DataFrame(index=df.index)
+    out["source_system"] = source
+    for target, col in resolved.items():
+        out[target] = df[col] if col is not None else None
+    return out
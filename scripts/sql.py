@@ -1,13 +1,24 @@
+import argparse
+import math
+import os
 import pandas as pd
 import sqlite3
-import pyodbc
 import numpy as np
 from pathlib import Path
 
+import connections
+from pipeline import Pipeline
 
-PROJECT_ROOT = Path(__file__).resolve().parent
+
+CURRENT_FILE = Path(__file__).resolve()
+
+if CURRENT_FILE.parent.name == "scripts":
+    PROJECT_ROOT = CURRENT_FILE.parent.parent
+else:
+    PROJECT_ROOT = CURRENT_FILE.parent
 
 SQLITE_DB_PATH = PROJECT_ROOT / "data" / "final" / "northwind_dw.sqlite"
+REPORT_DIR = PROJECT_ROOT / "data" / "reports"
 
 SQLSERVER_SERVER = r"localhost\SQLEXPRESS"
 SQLSERVER_DATABASE = "Northwind_DWH"
@@ -18,41 +29,96 @@ SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 SCRIPTS_DIR.mkdir(parents=True, exist_ok=True)
 
 SQL_SCRIPT_PATH = SCRIPTS_DIR / "Fact_Orders_Insert.sql"
+BCP_DATA_PATH = SCRIPTS_DIR / "Fact_Orders.dat"
+BCP_SCRIPT_PATH = SCRIPTS_DIR / "Fact_Orders_BulkInsert.sql"
+
+STAGE_TABLE = f"{TARGET_TABLE}_stage"
 
+# mode upsert : types explicites, clé naturelle de la fact, hash du contenu.
+# fact_order_key est renumérotée à chaque chargement complet de l'etl : la table cible
+# garde ses propres clés (jamais modifiées, nouvelles lignes à la suite de son max),
+# hors du hash.
+FACT_TYPES = {
+    "fact_order_key": "INT",
+    "source_system": "NVARCHAR(20)",
+    "order_id_source": "INT",
+    "customer_key": "INT",
+    "employee_key": "INT",
+    "order_date_key": "INT",
+    "ship_date_key": "INT",
+    "nb_commandes_livrees": "INT",
+    "nb_commandes_non_livrees": "INT",
+    "row_hash": "BIGINT",
+}
+MERGE_KEYS = ["source_system", "order_id_source"]
+HASHED_COLUMNS = [c for c in FACT_TYPES if c not in ("fact_order_key", "row_hash")]
+UPSERT_BATCH_SIZE = 10_000
 
-if not SQLITE_DB_PATH.exists():
-    print(f" SQLite introuvable : {SQLITE_DB_PATH.resolve()}")
-    exit(1)
+# lignes par INSERT multi-lignes (SQL Server accepte 1000 lignes max par VALUES)
+INSERT_BATCH_SIZE = 1000
+MAX_ROWS_PER_VALUES = 1000
 
-try:
+
+# ==================================================
+# LECTURE SQLITE
+# ==================================================
+def read_fact():
     conn_sqlite = sqlite3.connect(SQLITE_DB_PATH)
     df = pd.read_sql("SELECT * FROM fact_orders", conn_sqlite)
     conn_sqlite.close()
-    print(f" Données lues depuis SQLite : {len(df)} lignes")
-except Exception as e:
-    print(f" Erreur lecture SQLite : {e}")
-    exit(1)
-
-
-for col, dtype in df.dtypes.items():
-    if np.issubdtype(dtype, np.integer) or np.issubdtype(dtype, np.floating):
-        df[col] = df[col].replace({np.nan: None})
-    elif np.issubdtype(dtype, np.datetime64):
-        df[col] = df[col].apply(
-            lambda x: x if pd.isna(x) or pd.Timestamp("1753-01-01") <= x <= pd.Timestamp("9999-12-31") else None
-        )
-    else:
-        df[col] = df[col].astype(str).replace({"nan": None, "None": None})
+    return df
 
 
-try:
-    conn_str = (
-        r"DRIVER={ODBC Driver 17 for SQL Server};"
-        rf"SERVER={SQLSERVER_SERVER};"
-        rf"DATABASE={SQLSERVER_DATABASE};"
-        r"Trusted_Connection=yes;"
-    )
-    conn = pyodbc.connect(conn_str)
+def iter_fact_rows(batch_size, table="fact_orders"):
+    """
+    (colonnes, générateur de paquets de lignes) lus au curseur :
+    jamais plus de batch_size lignes en mémoire, types sqlite conservés.
+    """
+    conn_sqlite = sqlite3.connect(SQLITE_DB_PATH)
+    cursor = conn_sqlite.execute(f"SELECT * FROM {table}")
+    columns = [c[0] for c in cursor.description]
+
+    def batches():
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            conn_sqlite.close()
+
+    return columns, batches()
+
+
+# ==================================================
+# CHARGEMENT SQL SERVER
+# ==================================================
+def clean_for_sqlserver(df):
+    for col, dtype in df.dtypes.items():
+        if np.issubdtype(dtype, np.integer) or np.issubdtype(dtype, np.floating):
+            df[col] = df[col].replace({np.nan: None})
+        elif np.issubdtype(dtype, np.datetime64):
+            df[col] = df[col].apply(
+                lambda x: x if pd.isna(x) or pd.Timestamp("1753-01-01") <= x <= pd.Timestamp("9999-12-31") else None
+            )
+        else:
+            df[col] = df[col].astype(str).replace({"nan": None, "None": None})
+    return df
+
+
+# une seule connexion par run : le pool sert surtout aux reprises et aux mesures
+SQLSERVER_POOL = connections.Pool(
+    "sqlserver_dwh", connections.sqlserver_factory(SQLSERVER_SERVER, SQLSERVER_DATABASE), size=1
+)
+
+
+def connect_sqlserver():
+    return SQLSERVER_POOL.connect()
+
+
+def load_sqlserver(df):
+    conn = connect_sqlserver()
     cursor = conn.cursor()
 
     cursor.execute(f"IF OBJECT_ID('{TARGET_TABLE}', 'U') IS NOT NULL DROP TABLE {TARGET_TABLE};")
@@ -81,29 +147,361 @@ try:
     cursor.executemany(insert_sql, df.values.tolist())
     conn.commit()
 
-    print(f" Données chargées dans SQL Server : {TARGET_TABLE}")
-
     cursor.close()
     conn.close()
 
-except Exception as e:
-    print(f" Erreur SQL Server : {e}")
-    exit(1)
 
+# ==================================================
+# MODE UPSERT (staging + MERGE)
+# ==================================================
+# conn : n'importe quelle connexion DB-API en paramètres "?" (pyodbc, sqlite3 pour tester).
+def iter_fact_frames(batch_size):
+    """
+    fact_orders par paquets, colonnes typées + row_hash du contenu (HASHED_COLUMNS)
+    """
+    conn_sqlite = sqlite3.connect(SQLITE_DB_PATH)
+    try:
+        for chunk in pd.read_sql("SELECT * FROM fact_orders", conn_sqlite, chunksize=batch_size):
+            for col, sql_type in FACT_TYPES.items():
+                if col in chunk.columns and sql_type in ("INT", "BIGINT"):
+                    chunk[col] = pd.to_numeric(chunk[col], errors="coerce").astype("Int64")
+            content = chunk[HASHED_COLUMNS]
+            hashed = pd.util.hash_pandas_object(content.astype("string").fillna(""), index=False)
+            chunk["row_hash"] = hashed.to_numpy().view("int64")
+            yield chunk[list(FACT_TYPES)]
+    finally:
+        conn_sqlite.close()
+
+
+def table_columns(cursor, table):
+    """
+    colonnes d'une table, None si elle n'existe pas (portable DB-API)
+    """
+    try:
+        cursor.execute(f"SELECT * FROM {table} WHERE 1 = 0")
+    except Exception:
+        return None
+    columns = [c[0] for c in cursor.description]
+    cursor.fetchall()
+    return columns
+
+
+def ensure_target(cursor, dialect):
+    """
+    crée la table cible + index unique sur la clé naturelle si besoin,
+    ajoute row_hash sur une table créée par le mode replace
+    """
+    columns = table_columns(cursor, TARGET_TABLE)
+    if columns is None:
+        cols_sql = ", ".join(f"[{c}] {t}" for c, t in FACT_TYPES.items())
+        cursor.execute(f"CREATE TABLE {TARGET_TABLE} ({cols_sql})")
+    elif "row_hash" not in columns:
+        cursor.execute(f"ALTER TABLE {TARGET_TABLE} ADD row_hash BIGINT")
+        if dialect != "sqlite":
+            # le mode replace crée source_system en NVARCHAR(MAX), non indexable
+            cursor.execute(f"ALTER TABLE {TARGET_TABLE} ALTER COLUMN [source_system] NVARCHAR(20)")
+
+    index = f"UX_{TARGET_TABLE}_natural_key"
+    keys = ", ".join(f"[{c}]" for c in MERGE_KEYS)
+    if dialect == "sqlite":
+        cursor.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {index} ON {TARGET_TABLE} ({keys})")
+    else:
+        cursor.execute(
+            f"IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = '{index}') "
+            f"CREATE UNIQUE INDEX {index} ON {TARGET_TABLE} ({keys})"
+        )
+
+
+def assign_keys_sql(dialect):
+    """
+    lignes de staging absentes de la cible : fact_order_key à la suite du max de la cible
+    (ordre de la clé naturelle) ; les lignes déjà présentes gardent leur clé (merge_sql)
+    """
+    on_sql = " AND ".join(f"t.[{c}] = s.[{c}]" for c in MERGE_KEYS)
+    order_sql = ", ".join(f"s.[{c}]" for c in MERGE_KEYS)
+    max_key = f"(SELECT COALESCE(MAX(fact_order_key), 0) FROM {TARGET_TABLE})"
+    if dialect == "sqlite":
+        return (
+            f"UPDATE {STAGE_TABLE} SET fact_order_key = n.new_key FROM ("
+            f"SELECT s.rowid AS stage_row, {max_key} + ROW_NUMBER() OVER (ORDER BY {order_sql}) AS new_key "
+            f"FROM {STAGE_TABLE} s WHERE NOT EXISTS (SELECT 1 FROM {TARGET_TABLE} t WHERE {on_sql})"
+            f") AS n WHERE {STAGE_TABLE}.rowid = n.stage_row"
+        )
+    return (
+        f"WITH n AS ("
+        f"SELECT s.fact_order_key, ROW_NUMBER() OVER (ORDER BY {order_sql}) AS rn "
+        f"FROM {STAGE_TABLE} s WHERE NOT EXISTS (SELECT 1 FROM {TARGET_TABLE} t WITH (HOLDLOCK) WHERE {on_sql})"
+        f") UPDATE n SET fact_order_key = {max_key} + rn;"
+    )
+
+
+def merge_sql(dialect):
+    cols = list(FACT_TYPES)
+    col_list = ", ".join(f"[{c}]" for c in cols)
+    # clé de la cible conservée sur les lignes modifiées
+    updates = [c for c in cols if c not in MERGE_KEYS and c != "fact_order_key"]
+
+    if dialect == "sqlite":
+        conflict = ", ".join(f"[{c}]" for c in MERGE_KEYS)
+        set_sql = ", ".join(f"[{c}] = excluded.[{c}]" for c in updates)
+        return (
+            f"INSERT INTO {TARGET_TABLE} ({col_list}) SELECT {col_list} FROM {STAGE_TABLE} WHERE true "
+            f"ON CONFLICT ({conflict}) DO UPDATE SET {set_sql} "
+            f"WHERE {TARGET_TABLE}.row_hash IS NULL OR {TARGET_TABLE}.row_hash <> excluded.row_hash"
+        )
+
+    on_sql = " AND ".join(f"t.[{c}] = s.[{c}]" for c in MERGE_KEYS)
+    set_sql = ", ".join(f"t.[{c}] = s.[{c}]" for c in updates)
+    values = ", ".join(f"s.[{c}]" for c in cols)
+    return (
+        f"MERGE {TARGET_TABLE} WITH (HOLDLOCK) AS t "
+        f"USING {STAGE_TABLE} AS s ON {on_sql} "
+        f"WHEN MATCHED AND (t.row_hash IS NULL OR t.row_hash <> s.row_hash) THEN UPDATE SET {set_sql} "
+        f"WHEN NOT MATCHED BY TARGET THEN INSERT ({col_list}) VALUES ({values});"
+    )
+
+
+def count_changes(cursor):
+    """
+    (nouvelles lignes, lignes modifiées) entre staging et cible
+    """
+    on_sql = " AND ".join(f"t.[{c}] = s.[{c}]" for c in MERGE_KEYS)
+    cursor.execute(
+        f"SELECT "
+        f"SUM(CASE WHEN t.[{MERGE_KEYS[0]}] IS NULL THEN 1 ELSE 0 END), "
+        f"SUM(CASE WHEN t.[{MERGE_KEYS[0]}] IS NOT NULL "
+        f"AND (t.row_hash IS NULL OR t.row_hash <> s.row_hash) THEN 1 ELSE 0 END) "
+        f"FROM {STAGE_TABLE} s LEFT JOIN {TARGET_TABLE} t ON {on_sql}"
+    )
+    new_rows, changed_rows = cursor.fetchone()
+    return int(new_rows or 0), int(changed_rows or 0)
+
+
+def upsert_fact(conn, dialect="sqlserver", batch_size=UPSERT_BATCH_SIZE):
+    """
+    1. fact_orders -> table de staging, par paquets (la cible n'est pas touchée)
+    2. clés des nouvelles lignes attribuées par la cible (assign_keys_sql)
+    3. un seul MERGE sur (source_system, order_id_source) : seules les lignes
+       nouvelles ou dont le row_hash a changé sont écrites
+    """
+    cursor = conn.cursor()
+    if hasattr(cursor, "fast_executemany"):
+        cursor.fast_executemany = True
+
+    ensure_target(cursor, dialect)
+
+    if table_columns(cursor, STAGE_TABLE) is not None:
+        cursor.execute(f"DROP TABLE {STAGE_TABLE}")
+    cols_sql = ", ".join(f"[{c}] {t}" for c, t in FACT_TYPES.items())
+    cursor.execute(f"CREATE TABLE {STAGE_TABLE} ({cols_sql})")
+    conn.commit()
+
+    col_list = ", ".join(f"[{c}]" for c in FACT_TYPES)
+    placeholders = ", ".join("?" for _ in FACT_TYPES)
+    insert_sql = f"INSERT INTO {STAGE_TABLE} ({col_list}) VALUES ({placeholders})"
+
+    staged = 0
+    for chunk in iter_fact_frames(batch_size):
+        rows = chunk.astype(object).where(chunk.notna(), None).values.tolist()
+        cursor.executemany(insert_sql, rows)
+        conn.commit()
+        staged += len(rows)
+
+    new_rows, changed_rows = count_changes(cursor)
+    cursor.execute(assign_keys_sql(dialect))
+    cursor.execute(merge_sql(dialect))
+    cursor.execute(f"DROP TABLE {STAGE_TABLE}")
+    conn.commit()
+    cursor.close()
+
+    return staged, new_rows, changed_rows
+
+
+# ==================================================
+# SCRIPTS DE REJEU (INSERT multi-lignes / BULK INSERT)
+# ==================================================
+def sql_literal(v):
+    """
+    valeur sqlite -> littéral T-SQL typé (nombres sans quotes, 20060122.0 -> 20060122)
+    """
+    if v is None:
+        return "NULL"
+    if isinstance(v, bool):
+        return "1" if v else "0"
+    if isinstance(v, int):
+        return str(v)
+    if isinstance(v, float):
+        if math.isnan(v):
+            return "NULL"
+        return str(int(v)) if v.is_integer() else repr(v)
+    val_escaped = str(v).replace("'", "''")
+    return f"N'{val_escaped}'"
+
+
+def bcp_field(v):
+    """
+    valeur sqlite -> champ texte pour BULK INSERT (vide = NULL avec KEEPNULLS)
+    """
+    if v is None or (isinstance(v, float) and math.isnan(v)):
+        return ""
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+    # pas d'échappement possible en bcp : tabulations / retours ligne remplacés
+    return str(v).replace("\t", " ").replace("\r", " ").replace("\n", " ")
+
+
+def atomic_open(path):
+    tmp_path = path.with_name(path.name + ".tmp")
+    return tmp_path, open(tmp_path, "w", encoding="utf-8", newline="\n")
+
+
+def write_insert_script(batch_size=INSERT_BATCH_SIZE, path=SQL_SCRIPT_PATH):
+    """
+    un INSERT ... VALUES (...), (...) par paquet de batch_size lignes,
+    écrit au fil de la lecture (mémoire constante)
+    """
+    batch_size = max(1, min(batch_size, MAX_ROWS_PER_VALUES))
+    columns, batches = iter_fact_rows(batch_size)
+    cols = ", ".join(f"[{c}]" for c in columns)
+
+    tmp_path, f = atomic_open(path)
+    rows = 0
+    try:
+        with f:
+            f.write(f"USE {SQLSERVER_DATABASE};\nGO\n\n")
+            for batch in batches:
+                values = ",\n".join("(" + ", ".join(sql_literal(v) for v in row) + ")" for row in batch)
+                f.write(f"INSERT INTO {TARGET_TABLE} ({cols}) VALUES\n{values};\n")
+                rows += len(batch)
+            f.write("GO\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return rows
+
+
+def write_bcp_files(batch_size=INSERT_BATCH_SIZE, data_path=BCP_DATA_PATH, script_path=BCP_SCRIPT_PATH):
+    """
+    fichier de données tabulé (bcp / BULK INSERT) + script BULK INSERT qui le charge
+    """
+    columns, batches = iter_fact_rows(batch_size)
+
+    tmp_path, f = atomic_open(data_path)
+    rows = 0
+    try:
+        with f:
+            for batch in batches:
+                f.write("".join("\t".join(bcp_field(v) for v in row) + "\n" for row in batch))
+                rows += len(batch)
+        os.replace(tmp_path, data_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    with open(script_path, "w", encoding="utf-8") as f:
+        f.write(f"USE {SQLSERVER_DATABASE};\nGO\n\n")
+        f.write(f"-- colonnes : {', '.join(columns)}\n")
+        f.write(
+            f"BULK INSERT {TARGET_TABLE}\n"
+            f"FROM '{data_path.resolve()}'\n"
+            "WITH (\n"
+            "    DATAFILETYPE = 'char',\n"
+            "    CODEPAGE = '65001',\n"
+            "    FIELDTERMINATOR = '\\t',\n"
+            "    ROWTERMINATOR = '0x0a',\n"
+            "    KEEPNULLS,\n"
+            "    TABLOCK\n"
+            ");\nGO\n"
+        )
+    return rows
+
+
+# ==================================================
+# MAIN
+# ==================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="chargement fact_orders -> SQL Server + script de rejeu")
+    parser.add_argument(
+        "--script-format",
+        choices=["insert", "bcp", "none"],
+        default="insert",
+        help="insert : INSERT multi-lignes, bcp : fichier de données + BULK INSERT",
+    )
+    parser.add_argument("--batch-size", type=int, default=INSERT_BATCH_SIZE, help="lignes par paquet")
+    parser.add_argument(
+        "--mode",
+        choices=["replace", "upsert"],
+        default="replace",
+        help="replace : DROP / CREATE + insert complet, upsert : staging + MERGE des lignes modifiées",
+    )
+    parser.add_argument("--script-only", action="store_true", help="ne charge pas SQL Server, génère seulement le script")
+    parser.add_argument(
+        "--query-timings", action="store_true", help="affiche les requêtes SQL Server les plus longues en fin de run"
+    )
+    args = parser.parse_args(argv)
+
+    if not SQLITE_DB_PATH.exists():
+        print(f" SQLite introuvable : {SQLITE_DB_PATH.resolve()}")
+        exit(1)
+
+    # mesures par étape -> etl_run_history du DW sqlite + data/reports/*.json
+    run = Pipeline(f"sql_{args.mode}")
+    query_log = connections.QueryLog()
+    if args.query_timings:
+        connections.add_hook(query_log)
+    try:
+        publish(run, args)
+    finally:
+        connections.close_all()
+        connections.remove_hook(query_log)
+        query_log.print_summary()
+        run.finish(SQLITE_DB_PATH, REPORT_DIR)
+
+
+def publish(run, args):
+    if not args.script_only and args.mode == "upsert":
+        try:
+            with run.step("upsert_sqlserver") as step:
+                conn = connect_sqlserver()
+                staged, new_rows, changed_rows = upsert_fact(conn, "sqlserver", args.batch_size)
+                conn.close()
+                step.set_rows(rows_in=staged, rows_out=new_rows + changed_rows)
+            print(f" Staging : {staged} lignes -> MERGE {TARGET_TABLE} : {new_rows} nouvelles, {changed_rows} modifiées")
+        except Exception as e:
+            print(f" Erreur SQL Server : {e}")
+            exit(1)
+    elif not args.script_only:
+        try:
+            with run.step("read_sqlite") as step:
+                df = read_fact()
+                step.set_rows(rows_out=df)
+            print(f" Données lues depuis SQLite : {len(df)} lignes")
+        except Exception as e:
+            print(f" Erreur lecture SQLite : {e}")
+            exit(1)
 
-with open(SQL_SCRIPT_PATH, "w", encoding="utf-8") as f:
-    f.write(f"USE {SQLSERVER_DATABASE};\nGO\n\n")
+        try:
+            with run.step("load_sqlserver", rows_in=df) as step:
+                load_sqlserver(clean_for_sqlserver(df))
+                step.set_rows(rows_out=df)
+            print(f" Données chargées dans SQL Server : {TARGET_TABLE}")
+        except Exception as e:
+            print(f" Erreur SQL Server : {e}")
+            exit(1)
 
-    for _, row in df.iterrows():
-        clean_values = []
-        for v in row:
-            if v is None or str(v).lower() == "nan":
-                clean_values.append("NULL")
-            else:
-                val_escaped = str(v).replace("'", "''")
-                clean_values.append(f"'{val_escaped}'")
+    if args.script_format == "insert":
+        with run.step("insert_script") as step:
+            rows = write_insert_script(args.batch_size)
+            step.set_rows(rows_out=rows)
+        print(f" Script SQL généré : {SQL_SCRIPT_PATH.resolve()} ({rows} lignes)")
+    elif args.script_format == "bcp":
+        with run.step("bcp_files") as step:
+            rows = write_bcp_files(args.batch_size)
+            step.set_rows(rows_out=rows)
+        print(f" Fichier BULK INSERT généré : {BCP_DATA_PATH.resolve()} ({rows} lignes)")
+        print(f" Script BULK INSERT : {BCP_SCRIPT_PATH.resolve()}")
 
-        values_str = ", ".join(clean_values)
-        f.write(f"INSERT INTO {TARGET_TABLE} VALUES ({values_str});\n")
 
-print(f" Script SQL généré : {SQL_SCRIPT_PATH.resolve()}")
+if __name__ == "__main__":
+    main()
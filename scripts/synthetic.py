@@ -0,0 +1,163 @@
+import numpy as np
+import pandas as pd
+
+
+# =========================
+# DONNEES SYNTHETIQUES (forme Access / SQL Server)
+# =========================
+# même forme que ce que renvoient etl.extract_access / etl.extract_sqlserver,
+# pour mesurer l'etl sans les vraies bases.
+
+ORDER_START = np.datetime64("1996-07-01")
+ORDER_DAYS = 3800  # ~ 1996 -> 2006
+
+# volumes des bases réelles (facteur d'échelle 1) : sql server 830 commandes /
+# 91 clients / 9 employés, access 48 commandes / 29 clients / 9 employés
+NORTHWIND_ORDERS = 878
+NORTHWIND_CUSTOMERS = 91
+NORTHWIND_EMPLOYEES = 9
+NORTHWIND_ACCESS_RATIO = 48 / 878
+
+
+def _access_employees(n, rng):
+    ids = np.arange(1, n + 1)
+    return pd.DataFrame(
+        {
+            "ID": ids,
+            "Company": "Northwind Traders",
+            "Last Name": [f"Nom{i}" for i in ids],
+            "First Name": [f"Prenom{i}" for i in ids],
+            "Job Title": rng.choice(["Sales Representative", "Sales Manager"], size=n),
+            "City": rng.choice(["Seattle", "Bellevue", "Redmond", "Kirkland"], size=n),
+            "Country/Region": "USA",
+        }
+    )
+
+
+def _access_customers(n, rng):
+    ids = np.arange(1, n + 1)
+    return pd.DataFrame(
+        {
+            "ID": ids,
+            "Company": [f"Company {i}" for i in ids],
+            "Last Name": [f"Client{i}" for i in ids],
+            "First Name": [f"Contact{i}" for i in ids],
+            "Address": [f"{i} 1st Street" for i in ids],
+            "City": rng.choice(["Seattle", "Boston", "Los Angeles", "New York"], size=n),
+            "Country/Region": "USA",
+        }
+    )
+
+
+def _sql_employees(n, rng):
+    ids = np.arange(1, n + 1)
+    return pd.DataFrame(
+        {
+            "EmployeeID": ids,
+            "LastName": [f"Last{i}" for i in ids],
+            "FirstName": [f"First{i}" for i in ids],
+            "Title": rng.choice(["Sales Representative", "Sales Manager"], size=n),
+            "City": rng.choice(["Seattle", "London", "Tacoma"], size=n),
+            "Region": rng.choice(["WA", None], size=n),
+            "Country": rng.choice(["USA", "UK"], size=n),
+        }
+    )
+
+
+def _sql_customer_ids(n):
+    # ids texte façon northwind (ALFKI, ANATR...) : 5 caractères, uniques
+    return [f"C{i:04d}" if i < 10000 else f"C{i}" for i in range(n)]
+
+
+def _sql_customers(n, rng):
+    ids = _sql_customer_ids(n)
+    return pd.DataFrame(
+        {
+            "CustomerID": ids,
+            "CompanyName": [f"Société {c}" for c in ids],
+            "ContactName": [f"Contact {c}" for c in ids],
+            "City": rng.choice(["Berlin", "México D.F.", "London", "Paris"], size=n),
+            "Country": rng.choice(["Germany", "Mexico", "UK", "France"], size=n),
+            "PostalCode": rng.integers(10000, 99999, size=n).astype(str),
+            "Address": [f"{i} rue du Commerce" for i in range(n)],
+            "Phone": "030-0074321",
+        }
+    )
+
+
+def _order_dates(n, rng, unshipped_ratio):
+    order_date = ORDER_START + rng.integers(0, ORDER_DAYS, size=n).astype("timedelta64[D]")
+    shipped = order_date + rng.integers(1, 30, size=n).astype("timedelta64[D]")
+    shipped = np.where(rng.random(n) < unshipped_ratio, np.datetime64("NaT"), shipped)
+    return pd.to_datetime(order_date), pd.to_datetime(shipped)
+
+
+def make_sources(
+    n_orders,
+    n_employees=9,
+    n_customers=29,
+    access_ratio=0.05,
+    unshipped_ratio=0.05,
+    orphan_ratio=0.0,
+    seed=42,
+):
+    """
+    Renvoie (access_data, sql_data) avec n_orders commandes au total.
+    orphan_ratio : part des commandes dont l'employé n'existe pas dans la dimension.
+    """
+    rng = np.random.default_rng(seed)
+
+    n_access = int(n_orders * access_ratio)
+    n_sql = n_orders - n_access
+
+    emp_a = _access_employees(n_employees, rng)
+    cust_a = _access_customers(n_customers, rng)
+    emp_s = _sql_employees(n_employees, rng)
+    cust_s = _sql_customers(n_customers, rng)
+
+    # access
+    a_order, a_ship = _order_dates(n_access, rng, unshipped_ratio)
+    ord_a = pd.DataFrame(
+        {
+            "Order ID": np.arange(1, n_access + 1),
+            "Employee ID": rng.integers(1, n_employees + 1, size=n_access),
+            "Customer ID": rng.integers(1, n_customers + 1, size=n_access),
+            "Order Date": a_order,
+            "Shipped Date": a_ship,
+        }
+    )
+
+    # sql server
+    s_order, s_ship = _order_dates(n_sql, rng, unshipped_ratio)
+    cust_ids = np.array(_sql_customer_ids(n_customers), dtype=object)
+    ord_s = pd.DataFrame(
+        {
+            "OrderID": np.arange(10248, 10248 + n_sql),
+            "CustomerID": cust_ids[rng.integers(0, n_customers, size=n_sql)],
+            "EmployeeID": rng.integers(1, n_employees + 1, size=n_sql),
+            "OrderDate": s_order,
+            "ShippedDate": s_ship,
+        }
+    )
+
+    if orphan_ratio > 0:
+        orphans = rng.random(n_sql) < orphan_ratio
+        ord_s.loc[orphans, "EmployeeID"] = n_employees + 1000
+
+    access_data = {"employees": emp_a, "customers": cust_a, "orders": ord_a}
+    sql_data = {"employees": emp_s, "customers": cust_s, "orders": ord_s}
+    return access_data, sql_data
+
+
+def make_scaled_sources(scale, seed=42):
+    """
+    sources au volume northwind x scale (commandes, clients et employés
+    multipliés ensemble), même graine = mêmes données d'un run à l'autre
+    """
+    return make_sources(
+        int(NORTHWIND_ORDERS * scale),
+        n_employees=max(1, int(NORTHWIND_EMPLOYEES * scale)),
+        n_customers=max(1, int(NORTHWIND_CUSTOMERS * scale)),
+        access_ratio=NORTHWIND_ACCESS_RATIO,
+        seed=seed,
+    )
@@ -0,0 +1,539 @@
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+
+# =========================
+# OUTILS SQLITE (DATA WAREHOUSE)
+# =========================
+WATERMARK_TABLE = "etl_watermark"
+
+
+def table_exists(conn, table):
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    return row is not None
+
+
+def read_table(conn, table, columns="*"):
+    """
+    table du DW en DataFrame (DataFrame vide si la table n'existe pas)
+    """
+    if not table_exists(conn, table):
+        return pd.DataFrame()
+    return pd.read_sql(f"SELECT {columns} FROM {table}", conn)
+
+
+def upsert(conn, table, df, key_cols):
+    """
+    insert ou remplace les lignes de df dans table, par clé key_cols.
+    passe par une table de staging : un DELETE + un INSERT en bloc, dans une transaction.
+    """
+    if df.empty:
+        return 0
+
+    if not table_exists(conn, table):
+        df.to_sql(table, conn, index=False)
+        conn.commit()
+        return len(df)
+
+    stage = f"_stage_{table}"
+    df.to_sql(stage, conn, if_exists="replace", index=False)
+
+    cols = ", ".join(f'"{c}"' for c in df.columns)
+    match = " AND ".join(f't."{c}" = s."{c}"' for c in key_cols)
+
+    with conn:
+        conn.execute(f'DELETE FROM "{table}" AS t WHERE EXISTS (SELECT 1 FROM "{stage}" s WHERE {match})')
+        conn.execute(f'INSERT INTO "{table}" ({cols}) SELECT {cols} FROM "{stage}"')
+        conn.execute(f'DROP TABLE "{stage}"')
+
+    return len(df)
+
+
+# =========================
+# SCHEMA EN ETOILE (DDL)
+# =========================
+STAR_SCHEMA = {
+    "dim_employee": """
+        CREATE TABLE dim_employee (
+            employee_key INTEGER PRIMARY KEY,
+            source_system TEXT NOT NULL,
+            employee_id_source INTEGER NOT NULL,
+            LastName TEXT,
+            FirstName TEXT,
+            Title TEXT,
+            City TEXT,
+            Country TEXT,
+            RegionDescription TEXT,
+            row_hash INTEGER,
+            valid_from TEXT,
+            valid_to TEXT,
+            is_current INTEGER
+        )
+    """,
+    "dim_customer": """
+        CREATE TABLE dim_customer (
+            customer_key INTEGER PRIMARY KEY,
+            source_system TEXT NOT NULL,
+            customer_id_source TEXT NOT NULL,
+            CompanyName TEXT,
+            ContactName TEXT,
+            City TEXT,
+            Country TEXT,
+            PostalCode TEXT,
+            Address TEXT,
+            Phone TEXT,
+            row_hash INTEGER,
+            valid_from TEXT,
+            valid_to TEXT,
+            is_current INTEGER
+        )
+    """,
+    "dim_date": """
+        CREATE TABLE dim_date (
+            date_key INTEGER PRIMARY KEY,
+            date TIMESTAMP NOT NULL,
+            year INTEGER,
+            quarter INTEGER,
+            month INTEGER,
+            day INTEGER,
+            year_month INTEGER,
+            month_name TEXT,
+            day_of_week TEXT,
+            is_weekend INTEGER,
+            iso_year INTEGER,
+            iso_week INTEGER,
+            iso_day_of_week INTEGER,
+            fiscal_year INTEGER,
+            fiscal_quarter INTEGER,
+            fiscal_month INTEGER
+        )
+    """,
+    "fact_orders": """
+        CREATE TABLE fact_orders (
+            fact_order_key INTEGER PRIMARY KEY,
+            source_system TEXT NOT NULL,
+            order_id_source INTEGER NOT NULL,
+            customer_key INTEGER,
+            employee_key INTEGER,
+            order_date_key INTEGER,
+            ship_date_key INTEGER,
+            nb_commandes_livrees INTEGER NOT NULL,
+            nb_commandes_non_livrees INTEGER NOT NULL
+        )
+    """,
+}
+
+# index créés après le chargement en bloc (par table : une partie du schéma peut être rechargée seule)
+STAR_INDEXES = {
+    "dim_employee": ["CREATE INDEX ix_dim_employee_natural ON dim_employee (source_system, employee_id_source)"],
+    "dim_customer": ["CREATE INDEX ix_dim_customer_natural ON dim_customer (source_system, customer_id_source)"],
+    "dim_date": ["CREATE INDEX ix_dim_date_year_month ON dim_date (year_month)"],
+    "fact_orders": [
+        "CREATE UNIQUE INDEX ux_fact_orders_natural ON fact_orders (source_system, order_id_source)",
+        "CREATE INDEX ix_fact_orders_order_date ON fact_orders (order_date_key)",
+        "CREATE INDEX ix_fact_orders_employee ON fact_orders (employee_key)",
+        "CREATE INDEX ix_fact_orders_customer ON fact_orders (customer_key)",
+    ],
+}
+
+
+@contextmanager
+def bulk_load(conn):
+    """
+    pragmas de chargement en bloc (WAL, pas de fsync, tri en mémoire),
+    remis en mode normal + ANALYZE à la fin
+    """
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -200000")
+    try:
+        yield conn
+    finally:
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("ANALYZE")
+        conn.commit()
+
+
+def create_star_tables(conn, names):
+    """
+    tables vides recréées avec le DDL typé (chargement par blocs : les lignes arrivent
+    ensuite en append). seuls les index uniques sont créés ici, ils servent pendant le
+    chargement ; les autres à la fin (create_star_indexes), une fois les lignes insérées.
+    """
+    with conn:
+        for name in names:
+            conn.execute(f"DROP TABLE IF EXISTS {name}")
+            conn.execute(STAR_SCHEMA[name])
+            for statement in STAR_INDEXES[name]:
+                if statement.startswith("CREATE UNIQUE"):
+                    conn.execute(statement)
+
+
+def create_star_indexes(conn, names):
+    with conn:
+        for name in names:
+            for statement in STAR_INDEXES[name]:
+                if not statement.startswith("CREATE UNIQUE"):
+                    conn.execute(statement)
+
+
+def load_star_schema(conn, tables):
+    """
+    tables : {nom: DataFrame} du schéma en étoile.
+    tables recréées avec le DDL typé, données insérées, puis index.
+    """
+    with bulk_load(conn):
+        with conn:
+            for name, df in tables.items():
+                conn.execute(f"DROP TABLE IF EXISTS {name}")
+                conn.execute(STAR_SCHEMA[name])
+        for name, df in tables.items():
+            df.to_sql(name, conn, if_exists="append", index=False, chunksize=50_000)
+        with conn:
+            for name in tables:
+                for statement in STAR_INDEXES[name]:
+                    conn.execute(statement)
+
+
+# =========================
+# WATERMARKS (mode incrémental)
+# =========================
+def read_watermarks(conn):
+    """
+    {source_system: (dernier order id chargé, plus petit order id encore non livré,
+    plus petit order id en quarantaine)}
+    """
+    if not table_exists(conn, WATERMARK_TABLE):
+        return {}
+    rows = conn.execute(
+        f"SELECT source_system, last_order_id, open_from FROM {WATERMARK_TABLE}"
+    ).fetchall()
+    # commandes rejetées : à revalider tant qu'elles sont en quarantaine (ex. employé arrivé depuis)
+    quarantined = {}
+    if table_exists(conn, QUARANTINE_TABLE):
+        quarantined = dict(
+            conn.execute(
+                f"SELECT source_system, MIN(CAST(order_id_source AS INTEGER)) FROM {QUARANTINE_TABLE} "
+                "WHERE order_id_source IS NOT NULL GROUP BY source_system"
+            ).fetchall()
+        )
+    return {src: (last_id, open_from, quarantined.get(src)) for src, last_id, open_from in rows}
+
+
+def save_watermarks(conn, fact_table="fact_orders"):
+    """
+    recalcule les watermarks depuis la table de faits (une requête groupée)
+    """
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {WATERMARK_TABLE} (
+            source_system TEXT PRIMARY KEY,
+            last_order_id INTEGER,
+            open_from INTEGER,
+            updated_at TEXT
+        )
+        """
+    )
+    now = datetime.now().isoformat(timespec="seconds")
+    with conn:
+        conn.execute(f"DELETE FROM {WATERMARK_TABLE}")
+        conn.execute(
+            f"""
+            INSERT INTO {WATERMARK_TABLE} (source_system, last_order_id, open_from, updated_at)
+            SELECT
+                source_system,
+                MAX(CAST(order_id_source AS INTEGER)),
+                MIN(CASE WHEN nb_commandes_non_livrees = 1 THEN CAST(order_id_source AS INTEGER) END),
+                ?
+            FROM {fact_table}
+            GROUP BY source_system
+            """,
+            (now,),
+        )
+
+
+def orders_from(watermarks, source_system, include_open=True):
+    """
+    premier order id à ré-extraire pour une source :
+    les nouvelles commandes + celles encore non livrées (qui peuvent avoir changé)
+    + celles en quarantaine (une dimension a pu changer, même si orders n'a pas bougé).
+    include_open=False : table orders inchangée depuis le run précédent, les commandes
+    non livrées ne sont pas relues.
+    None = pas de watermark, extraction complète.
+    """
+    if source_system not in watermarks:
+        return None
+    last_id, open_from, quarantined_from = watermarks[source_system]
+    if last_id is None:
+        return None
+    start = int(last_id) + 1
+    if include_open and open_from is not None:
+        start = min(start, int(open_from))
+    if quarantined_from is not None:
+        start = min(start, int(quarantined_from))
+    return start
+
+
+# =========================
+# EMPREINTES DES SOURCES (runs sans changement)
+# =========================
+FINGERPRINT_TABLE = "etl_source_fingerprint"
+
+
+def read_fingerprints(conn):
+    """
+    {table source: {"rows", "max_key", "hash"}} du dernier run réussi
+    """
+    if not table_exists(conn, FINGERPRINT_TABLE):
+        return {}
+    rows = conn.execute(f"SELECT source_table, row_count, max_key, row_hash FROM {FINGERPRINT_TABLE}").fetchall()
+    return {name: {"rows": count, "max_key": max_key, "hash": row_hash} for name, count, max_key, row_hash in rows}
+
+
+def save_fingerprints(conn, fingerprints):
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {FINGERPRINT_TABLE} (
+            source_table TEXT PRIMARY KEY,
+            row_count INTEGER,
+            max_key TEXT,
+            row_hash TEXT,
+            checked_at TEXT
+        )
+        """
+    )
+    now = datetime.now().isoformat(timespec="seconds")
+    with conn:
+        conn.execute(f"DELETE FROM {FINGERPRINT_TABLE}")
+        conn.executemany(
+            f"""
+            INSERT INTO {FINGERPRINT_TABLE} (source_table, row_count, max_key, row_hash, checked_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [(name, fp["rows"], fp["max_key"], fp["hash"], now) for name, fp in fingerprints.items() if fp is not None],
+        )
+
+
+def changed_tables(fingerprints, previous):
+    """
+    tables dont l'empreinte diffère du run précédent (ou nouvelles / disparues)
+    """
+    current = {name: fp for name, fp in fingerprints.items() if fp is not None}
+    names = set(current) | set(previous)
+    return sorted(name for name in names if current.get(name) != previous.get(name))
+
+
+# =========================
+# VERSION DE CHARGEMENT (invalidation du cache du dashboard)
+# =========================
+LOAD_VERSION_TABLE = "etl_load_version"
+
+
+def record_load_version(conn, mode, fact_rows):
+    """
+    une ligne par chargement terminé (complet ou incrémental) ; renvoie le numéro de version
+    """
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {LOAD_VERSION_TABLE} (
+            version INTEGER PRIMARY KEY AUTOINCREMENT,
+            mode TEXT,
+            fact_rows INTEGER,
+            loaded_at TEXT
+        )
+        """
+    )
+    now = datetime.now().isoformat(timespec="seconds")
+    with conn:
+        cursor = conn.execute(
+            f"INSERT INTO {LOAD_VERSION_TABLE} (mode, fact_rows, loaded_at) VALUES (?, ?, ?)",
+            (mode, int(fact_rows), now),
+        )
+    return cursor.lastrowid
+
+
+def read_load_version(conn):
+    """
+    dernière version chargée, 0 si le DW n'en a pas encore
+    """
+    if not table_exists(conn, LOAD_VERSION_TABLE):
+        return 0
+    return conn.execute(f"SELECT COALESCE(MAX(version), 0) FROM {LOAD_VERSION_TABLE}").fetchone()[0]
+
+
+# =========================
+# QUARANTAINE (commandes rejetées par le contrôle qualité)
+# =========================
+QUARANTINE_TABLE = "etl_quarantine"
+
+
+def create_quarantine(conn):
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {QUARANTINE_TABLE} (
+            source_system TEXT,
+            order_id_source INTEGER,
+            reasons TEXT,
+            EmployeeID TEXT,
+            CustomerID TEXT,
+            OrderDate TEXT,
+            ShippedDate TEXT,
+            quarantined_at TEXT
+        )
+        """
+    )
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS ix_{QUARANTINE_TABLE}_natural ON {QUARANTINE_TABLE} (source_system, order_id_source)"
+    )
+
+
+def save_quarantine(conn, quarantine, batch=None, append=False):
+    """
+    quarantine : sortie de quality.validate_orders.
+    batch None (chargement complet) : la quarantaine est remplacée.
+    sinon (incrémental) : seules les entrées des commandes du lot (clé naturelle)
+    sont remplacées ; une commande corrigée depuis sort de la quarantaine.
+    append=True (chargement par blocs) : lignes ajoutées, rien n'est supprimé.
+    """
+    create_quarantine(conn)
+    rows = quarantine.assign(quarantined_at=datetime.now().isoformat(timespec="seconds"))
+
+    with conn:
+        if batch is None and not append:
+            conn.execute(f"DELETE FROM {QUARANTINE_TABLE}")
+        elif batch is not None:
+            delete_orders(conn, QUARANTINE_TABLE, batch)
+        rows.to_sql(QUARANTINE_TABLE, conn, if_exists="append", index=False)
+    return len(rows)
+
+
+def delete_orders(conn, table, orders):
+    """
+    supprime de table les commandes de orders (clé naturelle source_system / order_id_source),
+    dans la transaction de l'appelant. renvoie le nombre de lignes supprimées.
+    """
+    keys = pd.DataFrame(
+        {
+            "source_system": orders["source_system"].to_numpy(),
+            "order_id_source": pd.to_numeric(orders["order_id_source"], errors="coerce").astype("Int64"),
+        }
+    ).drop_duplicates()
+    stage = f"_stage_delete_{table}"
+    keys.to_sql(stage, conn, if_exists="replace", index=False)
+    deleted = conn.execute(
+        f"""
+        DELETE FROM {table} AS t WHERE EXISTS (
+            SELECT 1 FROM {stage} s
+            WHERE t.source_system = s.source_system AND t.order_id_source = s.order_id_source
+        )
+        """
+    ).rowcount
+    conn.execute(f"DROP TABLE {stage}")
+    return deleted
+
+
+def loaded_orders(conn, orders, tables=("fact_orders", QUARANTINE_TABLE)):
+    """
+    masque des commandes du bloc déjà présentes (clé naturelle) dans fact_orders ou la
+    quarantaine : chargées par un bloc précédent. une requête par source et par table,
+    limitée à la plage d'ids du bloc (index sur la clé naturelle).
+    """
+    ids = pd.to_numeric(orders["order_id_source"], errors="coerce")
+    mask = pd.Series(False, index=orders.index)
+    for source in orders["source_system"].dropna().unique():
+        rows = (orders["source_system"] == source) & ids.notna()
+        if not rows.any():
+            continue
+        loaded = pd.concat(
+            [
+                pd.read_sql(
+                    f"SELECT order_id_source FROM {table} "
+                    "WHERE source_system = ? AND order_id_source BETWEEN ? AND ?",
+                    conn,
+                    params=[source, float(ids[rows].min()), float(ids[rows].max())],
+                )["order_id_source"]
+                for table in tables
+                if table_exists(conn, table)
+            ]
+            + [pd.Series(dtype="float64")]
+        )
+        mask[rows] = ids[rows].isin(loaded)
+    return mask
+
+
+# =========================
+# AGREGATS (cubes pré-calculés)
+# =========================
+# agg_orders_daily   : jour x employé x client (grain du tableau de bord)
+# agg_orders_monthly : mois (yyyymm) x employé x région
+AGG_DAILY = "agg_orders_daily"
+AGG_MONTHLY = "agg_orders_monthly"
+
+AGG_DAILY_SELECT = """
+    SELECT
+        f.order_date_key,
+        f.employee_key,
+        f.customer_key,
+        SUM(f.nb_commandes_livrees) AS nb_commandes_livrees,
+        SUM(f.nb_commandes_non_livrees) AS nb_commandes_non_livrees,
+        COUNT(*) AS total_commandes
+    FROM fact_orders f
+    {where}
+    GROUP BY f.order_date_key, f.employee_key, f.customer_key
+"""
+
+AGG_MONTHLY_SELECT = """
+    SELECT
+        f.order_date_key / 100 AS year_month,
+        f.employee_key,
+        COALESCE(e.RegionDescription, '(sans région)') AS region,
+        SUM(f.nb_commandes_livrees) AS nb_commandes_livrees,
+        SUM(f.nb_commandes_non_livrees) AS nb_commandes_non_livrees,
+        COUNT(*) AS total_commandes
+    FROM fact_orders f
+    LEFT JOIN dim_employee e ON f.employee_key = e.employee_key
+    {where}
+    GROUP BY f.order_date_key / 100, f.employee_key, COALESCE(e.RegionDescription, '(sans région)')
+"""
+
+
+def refresh_aggregates(conn, date_keys=None):
+    """
+    date_keys None : reconstruction complète des agrégats.
+    sinon : seuls les jours (agrégat journalier) et les mois (agrégat mensuel)
+    contenant ces date_key sont recalculés.
+    """
+    if date_keys is None or not table_exists(conn, AGG_DAILY) or not table_exists(conn, AGG_MONTHLY):
+        with conn:
+            for table, select in ((AGG_DAILY, AGG_DAILY_SELECT), (AGG_MONTHLY, AGG_MONTHLY_SELECT)):
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+                where = "WHERE f.order_date_key IS NOT NULL"
+                conn.execute(f"CREATE TABLE {table} AS {select.format(where=where)}")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS ix_{AGG_DAILY}_date ON {AGG_DAILY} (order_date_key)")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS ix_{AGG_MONTHLY}_month ON {AGG_MONTHLY} (year_month)")
+        return
+
+    days = sorted({int(k) for k in date_keys if pd.notna(k)})
+    if not days:
+        return
+
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS _agg_days (date_key INTEGER PRIMARY KEY)")
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS _agg_months (year_month INTEGER PRIMARY KEY)")
+    with conn:
+        conn.execute("DELETE FROM _agg_days")
+        conn.execute("DELETE FROM _agg_months")
+        conn.executemany("INSERT INTO _agg_days VALUES (?)", [(k,) for k in days])
+        conn.executemany("INSERT INTO _agg_months VALUES (?)", [(k,) for k in sorted({k // 100 for k in days})])
+
+        conn.execute(f"DELETE FROM {AGG_DAILY} WHERE order_date_key IN (SELECT date_key FROM _agg_days)")
+        where = "WHERE f.order_date_key IN (SELECT date_key FROM _agg_days)"
+        conn.execute(f"INSERT INTO {AGG_DAILY} {AGG_DAILY_SELECT.format(where=where)}")
+
+        conn.execute(f"DELETE FROM {AGG_MONTHLY} WHERE year_month IN (SELECT year_month FROM _agg_months)")
+        where = "WHERE f.order_date_key / 100 IN (SELECT year_month FROM _agg_months)"
+        conn.execute(f"INSERT INTO {AGG_MONTHLY} {AGG_MONTHLY_SELECT.format(where=where)}")
@@ -0,0 +1,102 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import connections  # noqa: E402
+import etl  # noqa: E402
+import synthetic  # noqa: E402
+
+
+# =========================
+# SOURCES DE SUBSTITUTION (sqlite) POUR LES TESTS
+# =========================
+# les bases access / sql server sont remplacées par deux fichiers sqlite de même forme
+# (synthetic.make_sources) derrière les pools de l'etl (connections.sqlite_standin) ;
+# l'etl tourne dans un dossier temporaire (data/ relatif au dossier courant).
+N_ORDERS = 2000
+DW_TABLES = [
+    "fact_orders",
+    "dim_employee",
+    "dim_customer",
+    "dim_date",
+    "agg_orders_daily",
+    "agg_orders_monthly",
+]
+
+
+def pytest_configure(config):
+    # pd.read_sql sur une connexion du pool (PooledConnection) : avertissement DB-API générique
+    config.addinivalue_line("filterwarnings", "ignore:pandas only supports SQLAlchemy:UserWarning")
+
+
+def write_source(path, data):
+    conn = sqlite3.connect(path)
+    for name, df in data.items():
+        df.to_sql(name.capitalize(), conn, if_exists="replace", index=False)
+    conn.close()
+
+
+def execute(path, sql, params=()):
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute(sql, params)
+    conn.close()
+
+
+def read_dw(query, params=()):
+    conn = sqlite3.connect(etl.DW_DB_PATH)
+    try:
+        return pd.read_sql(query, conn, params=params)
+    finally:
+        conn.close()
+
+
+def snapshot(tables=DW_TABLES):
+    """
+    tables du DW triées sur toutes leurs colonnes, pour comparer deux runs
+    """
+    out = {}
+    for table in tables:
+        df = read_dw(f"SELECT * FROM {table}")
+        out[table] = df.sort_values(list(df.columns)).reset_index(drop=True)
+    out["etl_quarantine"] = read_dw(
+        "SELECT source_system, order_id_source, reasons FROM etl_quarantine "
+        "ORDER BY source_system, order_id_source, reasons"
+    )
+    return out
+
+
+def fact_by_natural_key():
+    """
+    fact_orders sans sa clé de substitution, triée sur (source_system, order_id_source)
+    """
+    fact = read_dw("SELECT * FROM fact_orders").drop(columns="fact_order_key")
+    fact["order_id_source"] = fact["order_id_source"].astype(str)
+    return fact.sort_values(["source_system", "order_id_source"]).reset_index(drop=True)
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    """
+    {"access": chemin, "sqlserver": chemin} des sources sqlite ; etl.main utilisable tel quel
+    """
+    monkeypatch.chdir(tmp_path)
+    etl.PROCESSED_DIR.mkdir(parents=True)
+    etl.FINAL_DIR.mkdir(parents=True)
+
+    access_data, sql_data = synthetic.make_sources(N_ORDERS, orphan_ratio=0.02)
+    paths = {"access": tmp_path / "access.db", "sqlserver": tmp_path / "sqlserver.db"}
+    write_source(paths["access"], access_data)
+    write_source(paths["sqlserver"], sql_data)
+
+    connections.close_all()
+    monkeypatch.setattr(etl.ACCESS_POOL, "factory", connections.sqlite_standin(str(paths["access"])))
+    monkeypatch.setattr(etl.SQLSERVER_POOL, "factory", connections.sqlite_standin(str(paths["sqlserver"])))
+    yield paths
+    connections.close_all()
@@ -0,0 +1,23 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+import columnar  # noqa: E402
+
+
+def chunks():
+    # premier bloc sans aucune région : type arrow null si le schéma en venait tel quel
+    yield pd.DataFrame({"id": [1, 2], "r": [None, None], "order_date_key": [19970101, 19970102]})
+    yield pd.DataFrame({"id": [3, 4], "r": ["WA", None], "order_date_key": [19970201, 19980101]})
+
+
+def test_parquet_chunks_after_an_all_null_first_chunk(tmp_path):
+    assert columnar.write_parquet_atomic(chunks(), tmp_path / "orders.parquet") == 4
+    df = columnar.read_parquet(tmp_path / "orders.parquet")
+    assert df["r"].fillna("").tolist() == ["", "", "WA", ""]
+
+
+def test_partitioned_fact_chunks_after_an_all_null_first_chunk(tmp_path):
+    assert columnar.write_fact_partitioned_chunks(chunks(), tmp_path / "fact_orders") == 4
+    df = columnar.read_fact(tmp_path / "fact_orders").sort_values("id")
+    assert df["r"].fillna("").tolist() == ["", "", "WA", ""]
@@ -0,0 +1,98 @@
+import sqlite3
+
+import pytest
+
+import connections
+import load_raw
+
+
+def flaky_factory(path, failures, calls):
+    """
+    connect() qui échoue failures fois ("database is locked") avant de réussir
+    """
+
+    def connect():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise sqlite3.OperationalError("database is locked")
+        return sqlite3.connect(path, check_same_thread=False)
+
+    return connect
+
+
+def test_pool_retries_transient_connect_errors(tmp_path):
+    calls = []
+    pool = connections.Pool("test", flaky_factory(str(tmp_path / "db.sqlite"), 2, calls), backoff=0.01)
+    cnx = pool.connect()
+    cnx.close()
+    assert len(calls) == 3
+    assert pool.opened == 1
+
+
+def test_pool_gives_up_after_retries(tmp_path):
+    calls = []
+    pool = connections.Pool("test", flaky_factory(str(tmp_path / "db.sqlite"), 10, calls), retries=2, backoff=0.01)
+    with pytest.raises(sqlite3.OperationalError):
+        pool.connect()
+    assert len(calls) == 3
+
+
+def test_non_transient_error_is_not_retried():
+    calls = []
+
+    def fail():
+        calls.append(1)
+        raise sqlite3.OperationalError("no such table: x")
+
+    with pytest.raises(sqlite3.OperationalError):
+        connections.with_retry(fail, backoff=0.01)
+    assert len(calls) == 1
+
+
+def test_released_connection_is_reused(tmp_path):
+    pool = connections.Pool("test", connections.sqlite_standin(str(tmp_path / "db.sqlite")))
+    first = pool.connect()
+    raw = first._raw
+    first.close()
+    second = pool.connect()
+    assert second._raw is raw
+    assert (pool.opened, pool.reused) == (1, 1)
+    second.close()
+    pool.close_all()
+
+
+def test_query_log_records_pooled_queries(tmp_path):
+    pool = connections.Pool("test", connections.sqlite_standin(str(tmp_path / "db.sqlite")))
+    log = connections.QueryLog()
+    pool.hooks.append(log)
+    cnx = pool.connect()
+    cursor = cnx.cursor()
+    cursor.execute("SELECT 1 UNION ALL SELECT 2")
+    assert len(cursor.fetchall()) == 2
+    cnx.close()
+    pool.close_all()
+    executions, _, rows = log.stats[("test", "SELECT 1 UNION ALL SELECT 2")]
+    assert (executions, rows) == (1, 2)
+
+
+def test_raw_export_retries_transient_errors_and_reports_the_others(sources, tmp_path, monkeypatch):
+    monkeypatch.setattr(load_raw, "RAW_DIR", tmp_path / "raw")
+    (tmp_path / "raw").mkdir()
+
+    locked_once = {"Orders"}
+
+    class LockedOnce(sqlite3.Connection):
+        def cursor(self, *args):
+            if locked_once:
+                locked_once.clear()
+                raise sqlite3.OperationalError("database is locked")
+            return super().cursor(*args)
+
+    rows = load_raw.extract_sqlserver_to_raw(
+        workers=1,
+        tables=["Orders", "Missing"],
+        connect=lambda: sqlite3.connect(sources["sqlserver"], factory=LockedOnce),
+    )
+    assert rows == 1900
+    assert (tmp_path / "raw" / "sqlserver_orders.csv").exists()
+    assert not (tmp_path / "raw" / "sqlserver_missing.csv").exists()
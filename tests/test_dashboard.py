@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("streamlit")
+import dashboard  # noqa: E402
+
+
+def summary(n_customers, rows_per_customer):
+    """
+    un point par (client, année) : le regroupement par année ne réduit plus rien
+    """
+    rng = np.random.default_rng(0)
+    n = n_customers * rows_per_customer
+    customer = np.repeat(np.arange(n_customers), rows_per_customer)
+    return pd.DataFrame(
+        {
+            "order_date": pd.to_datetime(1996 + np.tile(np.arange(rows_per_customer), n_customers), format="%Y"),
+            "employee_key": 1,
+            "employee_name": "Davolio",
+            "customer_key": customer,
+            "customer_name": [f"client {c}" for c in customer],
+            "region": "WA",
+            "nb_commandes_livrees": rng.integers(0, 3, n),
+            "nb_commandes_non_livrees": rng.integers(0, 3, n),
+            "total_commandes": 1,
+        }
+    )
+
+
+@pytest.mark.parametrize("budget", [5000, 500])
+def test_reduce_points_stays_within_budget_with_more_customers_than_points(budget):
+    points, level = dashboard.reduce_points(summary(4550, 10), budget)
+    assert level == "année, échantillon par client"
+    assert len(points) == budget
+
+
+def test_reduce_points_keeps_every_customer_when_the_budget_allows():
+    points, _ = dashboard.reduce_points(summary(300, 10), 1000)
+    assert len(points) == 1000
+    assert points["customer_key"].nunique() == 300
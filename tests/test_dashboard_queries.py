@@ -0,0 +1,45 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+import dashboard_queries as queries
+import warehouse
+
+
+@pytest.fixture
+def dw():
+    """
+    DW minimal : une cellule jour x employé x client de 150 commandes (100 livrées)
+    """
+    fact = pd.DataFrame(
+        {
+            "fact_order_key": range(1, 151),
+            "source_system": "sqlserver",
+            "order_id_source": range(10248, 10398),
+            "customer_key": 1,
+            "employee_key": 1,
+            "order_date_key": 19970101,
+            "ship_date_key": [19970105] * 100 + [None] * 50,
+            "nb_commandes_livrees": [1] * 100 + [0] * 50,
+            "nb_commandes_non_livrees": [0] * 100 + [1] * 50,
+        }
+    )
+    conn = sqlite3.connect(":memory:")
+    fact.to_sql("fact_orders", conn, index=False)
+    pd.DataFrame({"employee_key": [1], "FirstName": ["Nancy"], "LastName": ["Davolio"], "RegionDescription": ["WA"]}).to_sql(
+        "dim_employee", conn, index=False
+    )
+    pd.DataFrame({"customer_key": [1], "CompanyName": ["Alfreds"]}).to_sql("dim_customer", conn, index=False)
+    warehouse.refresh_aggregates(conn)
+    yield conn
+    conn.close()
+
+
+def test_summary_totals_do_not_overflow_compact_measures(dw):
+    filters = {"date_from": 19970101, "date_to": 19971231, "employee_keys": None}
+    summary = queries.load_summary(dw, filters)
+    assert summary[["nb_commandes_livrees", "nb_commandes_non_livrees", "total_commandes"]].values.tolist() == [
+        [100, 50, 150]
+    ]
+    assert queries.load_kpis(dw, filters) == (100, 50, 150)
@@ -0,0 +1,199 @@
+import pandas as pd
+import pytest
+
+import etl
+from conftest import execute, fact_by_natural_key, read_dw, snapshot
+
+
+def add_access_order(sources, order_id, order_date="2001-03-15 00:00:00", shipped_date=None, employee_id=1):
+    execute(
+        sources["access"],
+        'INSERT INTO Orders ("Order ID", "Employee ID", "Customer ID", "Order Date", "Shipped Date") '
+        "VALUES (?, ?, 1, ?, ?)",
+        (order_id, employee_id, order_date, shipped_date),
+    )
+
+
+def assert_same_tables(expected, actual):
+    assert expected.keys() == actual.keys()
+    for table in expected:
+        pd.testing.assert_frame_equal(expected[table], actual[table], obj=table)
+
+
+def test_rerun_without_source_change_is_skipped(sources, capsys):
+    etl.main(["--outputs", "files"])
+    version = read_dw("SELECT MAX(version) AS v FROM etl_load_version")["v"][0]
+    capsys.readouterr()
+
+    etl.main(["--outputs", "files"])
+    assert "aucune table source modifiée" in capsys.readouterr().out
+    assert read_dw("SELECT MAX(version) AS v FROM etl_load_version")["v"][0] == version
+
+
+def test_incremental_matches_full_rebuild(sources):
+    etl.main(["--outputs", "files"])
+
+    # nouvelle commande access, commande sql server livrée depuis le dernier run
+    add_access_order(sources, 90001, shipped_date="2001-03-20 00:00:00")
+    open_order = read_dw(
+        "SELECT order_id_source FROM fact_orders "
+        "WHERE source_system = 'sqlserver' AND ship_date_key IS NULL LIMIT 1"
+    )["order_id_source"][0]
+    execute(
+        sources["sqlserver"],
+        "UPDATE Orders SET ShippedDate = datetime(OrderDate, '+3 days') WHERE OrderID = ?",
+        (int(open_order),),
+    )
+
+    etl.main(["--incremental", "--outputs", "files"])
+    incremental = fact_by_natural_key()
+    aggregates = snapshot(["agg_orders_daily", "agg_orders_monthly"])
+
+    etl.main(["--force", "--outputs", "files"])
+    pd.testing.assert_frame_equal(incremental, fact_by_natural_key())
+    aggregates_full = snapshot(["agg_orders_daily", "agg_orders_monthly"])
+    for table in ("agg_orders_daily", "agg_orders_monthly"):
+        pd.testing.assert_frame_equal(aggregates[table], aggregates_full[table], obj=table)
+
+
+def test_incremental_removes_a_loaded_order_that_fails_validation(sources):
+    etl.main(["--outputs", "files"])
+
+    # commande non livrée déjà dans fact_orders, livrée avant sa date de commande : rejetée
+    open_order = read_dw(
+        "SELECT order_id_source FROM fact_orders "
+        "WHERE source_system = 'sqlserver' AND ship_date_key IS NULL LIMIT 1"
+    )["order_id_source"][0]
+    execute(
+        sources["sqlserver"],
+        "UPDATE Orders SET ShippedDate = datetime(OrderDate, '-3 days') WHERE OrderID = ?",
+        (int(open_order),),
+    )
+
+    etl.main(["--incremental", "--outputs", "files"])
+    incremental = fact_by_natural_key()
+    tables = snapshot(["agg_orders_daily", "agg_orders_monthly"])
+    assert str(open_order) not in set(incremental.loc[incremental["source_system"] == "sqlserver", "order_id_source"])
+
+    etl.main(["--force", "--outputs", "files"])
+    pd.testing.assert_frame_equal(incremental, fact_by_natural_key())
+    assert_same_tables(snapshot(["agg_orders_daily", "agg_orders_monthly"]), tables)
+
+
+def test_incremental_loads_quarantined_order_once_its_employee_exists(sources):
+    # 90001 rejetée (employé 99 inconnu), 90002 chargée : 90001 est sous le watermark
+    add_access_order(sources, 90001, employee_id=99)
+    add_access_order(sources, 90002)
+    etl.main(["--outputs", "files"])
+    assert 90001 in set(read_dw("SELECT order_id_source FROM etl_quarantine")["order_id_source"])
+
+    execute(
+        sources["access"],
+        'INSERT INTO Employees (ID, Company, "Last Name", "First Name", "Job Title", City, "Country/Region") '
+        "VALUES (99, 'Northwind Traders', 'Nom99', 'Prenom99', 'Sales Representative', 'Seattle', 'USA')",
+    )
+    etl.main(["--incremental", "--outputs", "files"])
+    fact = fact_by_natural_key()
+    tables = snapshot(["agg_orders_daily", "agg_orders_monthly"])
+    assert "90001" in set(fact.loc[fact["source_system"] == "access", "order_id_source"])
+
+    etl.main(["--force", "--outputs", "files"])
+    pd.testing.assert_frame_equal(fact, fact_by_natural_key())
+    assert_same_tables(snapshot(["agg_orders_daily", "agg_orders_monthly"]), tables)
+
+
+def test_chunked_load_matches_in_memory_load(sources):
+    etl.main(["--force", "--outputs", "files"])
+    in_memory = snapshot()
+    fact_csv = (etl.FINAL_DIR / "fact_orders.csv").read_text(encoding="utf-8")
+
+    etl.main(["--force", "--outputs", "files", "--chunk-rows", "300"])
+    assert_same_tables(in_memory, snapshot())
+    assert (etl.FINAL_DIR / "fact_orders.csv").read_text(encoding="utf-8") == fact_csv
+
+
+def test_parallel_transform_matches_serial_transform(sources, capsys):
+    etl.main(["--force", "--outputs", "files", "--transform-workers", "1"])
+    serial = snapshot()
+    capsys.readouterr()
+
+    etl.main(["--force", "--outputs", "files", "--transform-workers", "2"])
+    # temps par partition : le pool de processus a bien servi
+    assert "partition la plus lente" in capsys.readouterr().out
+    assert_same_tables(serial, snapshot())
+
+
+@pytest.mark.parametrize("mode", [[], ["--chunk-rows", "300"]], ids=["in_memory", "chunked"])
+def test_scd2_attribute_changed_twice_across_full_runs(sources, mode):
+    etl.main(["--outputs", "files", *mode])
+    n_fact = len(read_dw("SELECT fact_order_key FROM fact_orders"))
+
+    for city in ("Paris", "Lyon"):
+        execute(sources["access"], "UPDATE Customers SET City = ? WHERE ID = 3", (city,))
+        etl.main(["--outputs", "files", *mode])
+
+    versions = read_dw(
+        "SELECT customer_key, City, valid_from, valid_to, is_current FROM dim_customer "
+        "WHERE source_system = 'access' AND CAST(customer_id_source AS INTEGER) = 3 ORDER BY customer_key"
+    )
+    assert len(versions) == 3
+    assert versions["is_current"].tolist() == [0, 0, 1]
+    assert versions["City"].iloc[-1] == "Lyon"
+    assert len(read_dw("SELECT fact_order_key FROM fact_orders")) == n_fact
+    # une ligne par commande : le lookup ne duplique pas les commandes du client versionné
+    fact = read_dw("SELECT source_system, order_id_source FROM fact_orders")
+    assert not fact.duplicated().any()
+
+
+def test_resume_reextracts_sources_changed_since_the_failed_run(sources, monkeypatch):
+    etl.main(["--outputs", "files"])
+    add_access_order(sources, 99001)
+
+    load_final = etl.load_final_fact_and_files
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("échec simulé du chargement")
+
+    monkeypatch.setattr(etl, "load_final_fact_and_files", fail)
+    with pytest.raises(RuntimeError):
+        etl.main(["--outputs", "files"])
+    monkeypatch.setattr(etl, "load_final_fact_and_files", load_final)
+
+    add_access_order(sources, 99002)
+    etl.main(["--resume", "--outputs", "files"])
+    etl.main(["--outputs", "files"])
+
+    loaded = read_dw(
+        "SELECT CAST(order_id_source AS INTEGER) AS order_id FROM fact_orders WHERE source_system = 'access'"
+    )["order_id"]
+    assert {99001, 99002} <= set(loaded)
+
+
+def failed_chunked_run(monkeypatch):
+    load_files = etl.load_final_files_chunked
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("échec simulé du chargement")
+
+    monkeypatch.setattr(etl, "load_final_files_chunked", fail)
+    with pytest.raises(RuntimeError):
+        etl.main(["--force", "--outputs", "files", "--chunk-rows", "300"])
+    monkeypatch.setattr(etl, "load_final_files_chunked", load_files)
+
+
+def test_resume_reuses_extract_only_while_its_tables_are_unchanged(sources, monkeypatch, capsys):
+    # Orders n'est pas dans l'extraction par blocs : une nouvelle commande ne l'invalide pas
+    failed_chunked_run(monkeypatch)
+    add_access_order(sources, 99001)
+    capsys.readouterr()
+    etl.main(["--resume", "--outputs", "files", "--chunk-rows", "300"])
+    assert "reprise : extract relu" in capsys.readouterr().out
+    assert 99001 in set(read_dw("SELECT CAST(order_id_source AS INTEGER) AS id FROM fact_orders")["id"])
+
+    # un client modifié : extraction refaite
+    failed_chunked_run(monkeypatch)
+    execute(sources["access"], "UPDATE Customers SET City = 'Paris' WHERE ID = 3")
+    capsys.readouterr()
+    etl.main(["--resume", "--outputs", "files", "--chunk-rows", "300"])
+    assert "reprise : extract relu" not in capsys.readouterr().out
+    assert "Paris" in set(read_dw("SELECT City FROM dim_customer WHERE is_current = 1")["City"])
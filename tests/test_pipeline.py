@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+import pipeline
+from pipeline import Pipeline
+
+
+def run_steps():
+    run = Pipeline("test")
+    with run.step("big"):
+        data = np.ones(40_000_000)  # ~ 300 Mo
+        data.sum()
+        del data
+    with run.step("small"):
+        pass
+    return {s["step"]: s["peak_rss_mb"] for s in run.report()["steps"]}
+
+
+def test_step_peak_is_measured_per_step():
+    peaks = run_steps()
+    assert peaks["big"] - peaks["small"] > 200
+
+
+@pytest.mark.skipif(pipeline.psutil is None, reason="psutil non installé")
+def test_step_peak_is_sampled_without_proc(monkeypatch):
+    monkeypatch.setattr(pipeline, "reset_rss_peak", lambda: False)
+    peaks = run_steps()
+    assert peaks["big"] - peaks["small"] > 200
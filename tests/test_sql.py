@@ -0,0 +1,63 @@
+import sqlite3
+
+import pytest
+
+import etl
+import sql
+from conftest import execute, read_dw
+
+
+@pytest.fixture
+def target(sources, tmp_path, monkeypatch):
+    """
+    DW chargé par l'etl + base cible sqlite à la place de Northwind_DWH
+    """
+    etl.main(["--outputs", "files"])
+    monkeypatch.setattr(sql, "SQLITE_DB_PATH", etl.DW_DB_PATH)
+    conn = sqlite3.connect(tmp_path / "dwh_target.db")
+    yield conn
+    conn.close()
+
+
+def test_upsert_is_idempotent(target):
+    n_fact = len(read_dw("SELECT fact_order_key FROM fact_orders"))
+    assert sql.upsert_fact(target, "sqlite", batch_size=500) == (n_fact, n_fact, 0)
+    assert sql.upsert_fact(target, "sqlite", batch_size=500) == (n_fact, 0, 0)
+    assert target.execute(f"SELECT COUNT(*) FROM {sql.TARGET_TABLE}").fetchone()[0] == n_fact
+
+
+def test_upsert_only_writes_changed_orders_after_a_full_reload(sources, target):
+    sql.upsert_fact(target, "sqlite", batch_size=500)
+
+    # nouvelle commande access : toutes les fact_order_key sont renumérotées au rechargement
+    execute(
+        sources["access"],
+        'INSERT INTO Orders ("Order ID", "Employee ID", "Customer ID", "Order Date", "Shipped Date") '
+        "VALUES (90001, 1, 1, '2001-03-15 00:00:00', NULL)",
+    )
+    etl.main(["--outputs", "files"])
+    n_fact = len(read_dw("SELECT fact_order_key FROM fact_orders"))
+    assert sql.upsert_fact(target, "sqlite", batch_size=500) == (n_fact, 1, 0)
+
+
+def test_upsert_keeps_target_keys_unique_across_full_reloads(sources, target):
+    sql.upsert_fact(target, "sqlite", batch_size=500)
+    before = dict(
+        target.execute(f"SELECT order_id_source, fact_order_key FROM {sql.TARGET_TABLE} WHERE source_system = 'sqlserver'")
+    )
+
+    # nouvelle commande access : les fact_order_key du DW sont renumérotées au rechargement
+    execute(
+        sources["access"],
+        'INSERT INTO Orders ("Order ID", "Employee ID", "Customer ID", "Order Date", "Shipped Date") '
+        "VALUES (90001, 1, 1, '2001-03-15 00:00:00', NULL)",
+    )
+    etl.main(["--outputs", "files"])
+    sql.upsert_fact(target, "sqlite", batch_size=500)
+
+    keys = [k for (k,) in target.execute(f"SELECT fact_order_key FROM {sql.TARGET_TABLE}")]
+    assert len(keys) == len(set(keys))
+    after = dict(
+        target.execute(f"SELECT order_id_source, fact_order_key FROM {sql.TARGET_TABLE} WHERE source_system = 'sqlserver'")
+    )
+    assert after == before